@@ -0,0 +1,141 @@
+"""Article listings: cached lists and counts, and keyset pagination.
+
+RecentArticlesBlock appears on the home page and other busy pages, so the
+ids of the newest articles are cached per locale and count, and rendering
+only fetches those articles. The articles index caches its article count in
+the same way. Both live in the "pages" cache under a shared version, which
+signals in ams/cms/signals.py bump when an article is published or
+unpublished or a view restriction changes.
+
+An article can be published with a future publication_date and only shows
+once that date passes. Each cached value records the next such date and is
+treated as stale from then on, so the article appears on time without a
+scheduled job.
+
+The articles index pages through its articles by (publication_date, id)
+rather than by offset (see ams/utils/pagination.py), so a page deep in the
+archive costs the same as the first one.
+"""
+
+import math
+import time
+
+from django.core.cache import caches
+from django.utils import timezone
+
+from ams.cms.models import ArticlePage
+from ams.cms.page_cache import PAGE_CACHE_ALIAS
+from ams.utils.pagination import make_cursor
+from ams.utils.pagination import paginate_by_date
+
+ARTICLES_CACHE_ALIAS = PAGE_CACHE_ALIAS
+ARTICLES_PER_PAGE = 12
+
+_VERSION_KEY = "articles_version"
+
+
+def _cached(key, articles, build):
+    """Return ``build(published articles)``, cached until the articles change.
+
+    ``articles`` returns every live article that counts towards the value;
+    it is only called to rebuild the value, since building some querysets
+    (public()) already runs a query. The cached value goes stale when the
+    version is bumped or the next future publication_date among the
+    articles passes.
+    """
+    cache = caches[ARTICLES_CACHE_ALIAS]
+    cached = cache.get_many([_VERSION_KEY, key])
+    version = cached.get(_VERSION_KEY)
+    entry = cached.get(key)
+    now = timezone.now()
+    if (
+        version is not None
+        and entry is not None
+        and entry["version"] == version
+        and (entry["stale_at"] is None or now < entry["stale_at"])
+    ):
+        return entry["value"]
+
+    if version is None:
+        cache.add(_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(_VERSION_KEY)
+    articles = articles()
+    value = build(articles.filter(publication_date__lte=now))
+    stale_at = (
+        articles.filter(publication_date__gt=now)
+        .order_by("publication_date")
+        .values_list("publication_date", flat=True)
+        .first()
+    )
+    timeout = (
+        None
+        if stale_at is None
+        else max(1, math.ceil((stale_at - now).total_seconds()))
+    )
+    cache.set(
+        key,
+        {"version": version, "value": value, "stale_at": stale_at},
+        timeout=timeout,
+    )
+    return value
+
+
+def recent_article_ids(locale, count):
+    """Return the ids of the ``count`` newest published articles in ``locale``.
+
+    Costs one cache lookup when the cached list is current, and two queries
+    to rebuild it otherwise.
+    """
+    return _cached(
+        f"recent_articles_locale{locale.pk}_{count}",
+        lambda: ArticlePage.objects.live().public().filter(locale=locale),
+        lambda published: list(
+            published.order_by("-publication_date").values_list("pk", flat=True)[
+                :count
+            ],
+        ),
+    )
+
+
+def recent_articles(locale, count):
+    """Return the ``count`` newest published articles in ``locale``, newest first."""
+    ids = recent_article_ids(locale, count)
+    articles = ArticlePage.objects.live().select_related("cover_image").in_bulk(ids)
+    return [articles[pk] for pk in ids if pk in articles]
+
+
+def article_count(index_page):
+    """Return the number of published articles under an articles index."""
+    return _cached(
+        f"article_count_index{index_page.pk}",
+        lambda: ArticlePage.objects.child_of(index_page).live(),
+        lambda published: published.count(),
+    )
+
+
+def bump_articles_version():
+    """Make every cached article list and count stale."""
+    caches[ARTICLES_CACHE_ALIAS].set(_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def article_cursor(article):
+    """Return the cursor for the articles listed after ``article``."""
+    return make_cursor(article, "publication_date")
+
+
+def paginate_articles(articles, *, before=None, after=None, per_page=ARTICLES_PER_PAGE):
+    """Return one page of ``articles``, newest first, as a KeysetPage.
+
+    Without a cursor this is the first page. ``before`` gives the page of
+    articles older than the cursor's article, and ``after`` the page of
+    articles newer than it, so each page costs a single indexed query. Both
+    take a cursor string; an invalid cursor gives the first page.
+    """
+    return paginate_by_date(
+        articles,
+        "publication_date",
+        per_page=per_page,
+        descending=True,
+        before=before,
+        after=after,
+    )
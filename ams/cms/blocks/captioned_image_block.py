@@ -3,6 +3,13 @@ from wagtail.blocks import ChoiceBlock
 from wagtail.blocks import StructBlock
 from wagtail.images.blocks import ImageBlock
 
+# Filter specs of the {% picture %} tags in captioned_image_block.html, by
+# image_scaling, for ams.cms.renditions.
+RENDITION_FILTERS = {
+    "fit": "format-{avif,webp,png} height-{500,1000} preserve-svg",
+    "fill": "format-{avif,webp,jpeg} fill-{500x500,1000x1000} preserve-svg",
+}
+
 
 class CaptionedImageBlock(StructBlock):
     image = ImageBlock(required=True)
@@ -30,3 +37,8 @@ class CaptionedImageBlock(StructBlock):
     class Meta:
         icon = "image"
         template = "cms/blocks/captioned_image_block.html"
+
+    def image_renditions(self, value):
+        """Yield (image, filter spec) for each rendition the template renders."""
+        scaling = "fit" if value["image_scaling"] == "fit" else "fill"
+        yield value["image"], RENDITION_FILTERS[scaling]
@@ -11,6 +11,11 @@ from wagtail_color_panel.blocks import NativeColorBlock
 from ams.cms.constants import BackgroundOpacities
 from ams.cms.constants import ColourModes
 
+# Filter specs of the {% image %} tags in full_width_section_block.html and
+# partials/full_width_section_item_content.html, for ams.cms.renditions.
+BACKGROUND_RENDITION_FILTER = "fill-2000x800"
+ITEM_BACKGROUND_RENDITION_FILTER = "fill-400x400"
+
 
 class FullWidthSectionItem(StructBlock):
     """Individual item within a full-width section.
@@ -116,3 +121,9 @@ class FullWidthSectionBlock(StructBlock):
         label = "Full Width Section"
         template = "cms/blocks/full_width_section_block.html"
         help_text = "Uses the tertiary colour palette."
+
+    def image_renditions(self, value):
+        """Yield (image, filter spec) for each rendition the template renders."""
+        yield value["background_image"], BACKGROUND_RENDITION_FILTER
+        for item in value["items"]:
+            yield item["background_image"], ITEM_BACKGROUND_RENDITION_FILTER
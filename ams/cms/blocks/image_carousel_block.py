@@ -6,6 +6,10 @@ from wagtail.blocks import ListBlock
 from wagtail.blocks import StructBlock
 from wagtail.images.blocks import ImageBlock
 
+# Filter spec of the {% picture %} tag in image_carousel_block.html, for
+# ams.cms.renditions.
+RENDITION_FILTER = "format-{avif,webp,jpeg} width-{640,1280,1920} preserve-svg"
+
 
 class CarouselSlideBlock(StructBlock):
     """Individual slide within a carousel."""
@@ -87,3 +91,8 @@ class ImageCarouselBlock(StructBlock):
         icon = "image"
         label = "Image carousel"
         template = "cms/blocks/image_carousel_block.html"
+
+    def image_renditions(self, value):
+        """Yield (image, filter spec) for each rendition the template renders."""
+        for slide in value["slides"]:
+            yield slide["image"], RENDITION_FILTER
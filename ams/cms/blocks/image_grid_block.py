@@ -8,6 +8,13 @@ from wagtail.blocks import StructBlock
 from wagtail.blocks import URLBlock
 from wagtail.images.blocks import ImageBlock
 
+# Filter specs of the {% picture %} tags in image_grid_block.html, by
+# image_scaling, for ams.cms.renditions.
+RENDITION_FILTERS = {
+    "fit": "format-{avif,webp,png} max-{150x150,300x300,600x600} preserve-svg",
+    "fill": "format-{avif,webp,jpeg} fill-{150x150,300x300,600x600} preserve-svg",
+}
+
 
 class GridItemBlock(StructBlock):
     """Individual item within an image grid."""
@@ -120,3 +127,9 @@ class ImageGridBlock(StructBlock):
         icon = "image"
         label = "Image grid"
         template = "cms/blocks/image_grid_block.html"
+
+    def image_renditions(self, value):
+        """Yield (image, filter spec) for each rendition the template renders."""
+        for item in value["items"]:
+            scaling = "fit" if item["image_scaling"] == "fit" else "fill"
+            yield item["image"], RENDITION_FILTERS[scaling]
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from django.utils import timezone
 from wagtail.blocks import ChoiceBlock
 from wagtail.blocks import StructBlock
 from wagtail.models import Locale
@@ -24,9 +23,13 @@ class RecentArticlesBlock(StructBlock):
     )
 
     def get_context(self, value, parent_context=None):
-        """Add recent articles to context."""
+        """Add recent articles to context.
+
+        The article ids are cached (see ams/cms/articles.py), so
+        rendering costs a cache lookup and one query for the articles.
+        """
         # Imported here to avoid circular dependencies
-        from ams.cms.models import ArticlePage  # noqa: PLC0415
+        from ams.cms.articles import recent_articles  # noqa: PLC0415
 
         context = super().get_context(value, parent_context=parent_context)
 
@@ -35,14 +38,7 @@ class RecentArticlesBlock(StructBlock):
         page = parent_context.get("page") if parent_context else None
         locale = page.locale if page else Locale.get_active()
 
-        articles: list[ArticlePage] = list(
-            ArticlePage.objects.live()
-            .public()
-            .filter(locale=locale)
-            .select_related("cover_image")
-            .filter(publication_date__lte=timezone.now())
-            .order_by("-publication_date")[:count],
-        )
+        articles: list[ArticlePage] = recent_articles(locale, count)
 
         context["articles"] = articles
         return context
@@ -5,6 +5,10 @@ from wagtail.blocks import RichTextBlock
 from wagtail.blocks import StructBlock
 from wagtail.images.blocks import ImageBlock
 
+# Filter spec of the {% picture %} tag in timeline_block.html, for
+# ams.cms.renditions.
+RENDITION_FILTER = "format-{avif,webp,jpeg} fill-{400x225,800x450} preserve-svg"
+
 
 class TimelineItemBlock(StructBlock):
     date = CharBlock(
@@ -51,3 +55,10 @@ class TimelineBlock(StructBlock):
         icon = "list-ul"
         label = "Timeline"
         template = "cms/blocks/timeline_block.html"
+
+    def image_renditions(self, value):
+        """Yield (image, filter spec) for each rendition the template renders."""
+        if value["style"] == "plain":
+            return
+        for item in value["items"]:
+            yield item["image"], RENDITION_FILTER
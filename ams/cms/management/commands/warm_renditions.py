@@ -0,0 +1,75 @@
+"""Module for the custom Django warm_renditions command."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core import management
+from django.db import connections
+from wagtail.models import Page
+
+from ams.cms.renditions import generate_renditions
+from ams.cms.renditions import page_stream_values
+from ams.utils.management.commands._constants import LOG_HEADER
+
+CHUNK_SIZE = 10
+
+
+def _init_worker():
+    django.setup()
+
+
+def _warm(page_id):
+    """Generate one page's missing renditions; runs in a worker process.
+
+    Returns ``(generated count, error message or None)`` so that one missing
+    or unreadable source image doesn't stop the rest of the run.
+    """
+    page = Page.objects.filter(pk=page_id).first()
+    if page is None:
+        return 0, None
+    try:
+        return generate_renditions(*page_stream_values(page.specific)), None
+    except Exception as error:  # noqa: BLE001
+        return 0, f"Page {page_id}: {error}"
+
+
+class Command(management.base.BaseCommand):
+    """Required command class for the warm_renditions command."""
+
+    help = (
+        "Generate every image rendition rendered by the StreamField blocks of "
+        "live pages that does not exist yet, across a pool of worker processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of worker processes. 0 generates in this process.",
+        )
+
+    def handle(self, *args, **options):
+        """Automatically called when the warm_renditions command is given."""
+        self.stdout.write(LOG_HEADER.format("🖼️ Warm renditions"))
+        page_ids = list(Page.objects.live().order_by("pk").values_list("pk", flat=True))
+        if options["workers"] > 0 and page_ids:
+            # Worker processes open their own database connections; don't
+            # hand them this process's.
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options["workers"],
+                initializer=_init_worker,
+            ) as executor:
+                results = list(executor.map(_warm, page_ids, chunksize=CHUNK_SIZE))
+        else:
+            results = [_warm(page_id) for page_id in page_ids]
+        errors = [error for _generated, error in results if error]
+        for error in errors:
+            self.stderr.write(f"❌ {error}")
+        generated = sum(generated for generated, _error in results)
+        self.stdout.write(
+            f"✅ Generated {generated} renditions for {len(page_ids)} pages "
+            f"({len(errors)} failed).",
+        )
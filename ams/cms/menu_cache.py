@@ -0,0 +1,118 @@
+"""Versioned cache keys for the rendered header and footer menus.
+
+The header and footer templates cache their {% main_menu %} and
+{% flat_menu %} output in the "pages" cache, keyed on the site's menu cache
+version. Bumping the version (bump_menu_cache_version) makes every cached
+menu of the site stale at once; signals in ams/cms/signals.py bump it when a
+page is published, unpublished or moved and when a menu changes.
+
+Menu items are marked active when they link to the current page or one of
+its ancestors, so the keys also include the menu links that are active for
+the request (active_menu_links). Pages outside the menus share one entry,
+rather than each path caching its own copy.
+"""
+
+import time
+
+from django.core.cache import caches
+from django.db.models import Q
+from wagtail.models import Page
+from wagtail.models import Site
+from wagtailmenus.conf import settings as menu_settings
+from wagtailmenus.models import FlatMenuItem
+from wagtailmenus.models import MainMenuItem
+
+from ams.cms.page_cache import PAGE_CACHE_ALIAS
+
+MENU_CACHE_ALIAS = PAGE_CACHE_ALIAS
+
+# Matches the {% cache %} timeout of the menu fragments in the header and
+# footer templates.
+MENU_CACHE_TIMEOUT = 60 * 60
+
+# The max_levels the header renders {% main_menu %} with.
+MAIN_MENU_MAX_LEVELS = 2
+
+
+def _version_key(site_id):
+    return f"menu_cache_version_site{site_id}"
+
+
+def get_menu_cache_version(site_id):
+    """Return the site's current menu cache version, starting one if needed.
+
+    A missing version (never set, or culled from the cache) is replaced with
+    a new one rather than read as ``None``, so menus cached under an earlier
+    missing version are never served again.
+    """
+    cache = caches[MENU_CACHE_ALIAS]
+    key = _version_key(site_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_menu_cache_version(site_id=None):
+    """Make every cached menu of a site, or of all sites, stale."""
+    site_ids = [site_id] if site_id else Site.objects.values_list("pk", flat=True)
+    caches[MENU_CACHE_ALIAS].set_many(
+        {_version_key(pk): time.time_ns() for pk in site_ids},
+        timeout=None,
+    )
+
+
+def _menu_link_paths(site):
+    """Return ``{path: matches_descendants}`` for every link the menus show.
+
+    A link matches a request for its own path and, when
+    ``matches_descendants`` is true, for any path below it, mirroring how
+    wagtailmenus marks items active. Pages are included in every language.
+    """
+    main_items = MainMenuItem.objects.filter(menu__site=site).select_related(
+        "link_page",
+    )
+    flat_items = FlatMenuItem.objects.filter(menu__site=site).select_related(
+        "link_page",
+    )
+    pages = Q(pk__in=[])
+    paths = {}
+    for item in [*main_items, *flat_items]:
+        page = item.link_page
+        if page is None:
+            path = item.link_url.split("?")[0].split("#")[0]
+            paths[path] = path != "/"
+        elif isinstance(item, MainMenuItem) and item.allow_subnav:
+            pages |= Q(
+                path__startswith=page.path,
+                depth__lt=page.depth + MAIN_MENU_MAX_LEVELS,
+            )
+        else:
+            pages |= Q(pk=page.pk)
+    translation_keys = Page.objects.filter(pages).values("translation_key")
+    for page in Page.objects.live().filter(translation_key__in=translation_keys):
+        url = page.get_url(current_site=site)
+        if url:
+            paths[url] = page.depth >= menu_settings.SECTION_ROOT_DEPTH
+    return paths
+
+
+def active_menu_links(site, version, request_path):
+    """Return the menu links that are active for ``request_path``.
+
+    The site's menu links are looked up once per menu cache version and kept
+    in the cache for MENU_CACHE_TIMEOUT.
+    """
+    cache = caches[MENU_CACHE_ALIAS]
+    key = f"menu_link_paths_site{site.pk}_{version}"
+    paths = cache.get(key)
+    if paths is None:
+        paths = _menu_link_paths(site)
+        cache.set(key, paths, MENU_CACHE_TIMEOUT)
+    return sorted(
+        path
+        for path, matches_descendants in paths.items()
+        if request_path == path
+        or (matches_descendants and request_path.startswith(path))
+    )
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.16 on 2026-10-18 23:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0058_add_css_id_to_basepage'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='articlepage',
+            index=models.Index(fields=['publication_date', 'page_ptr'], name='cms_article_pub_date_idx'),
+        ),
+    ]
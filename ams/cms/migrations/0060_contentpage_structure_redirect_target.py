@@ -0,0 +1,39 @@
+# Generated by Django 5.2.16 on 2026-10-18 23:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def set_structure_redirect_targets(apps, schema_editor):
+    ContentPage = apps.get_model("cms", "ContentPage")
+    Page = apps.get_model("wagtailcore", "Page")
+    # Same rule as ContentPage.find_structure_redirect_target()
+    for page in ContentPage.objects.filter(is_structure_only=True):
+        page.structure_redirect_target = (
+            Page.objects.filter(
+                path__startswith=page.path,
+                depth__gt=page.depth,
+                live=True,
+            )
+            .exclude(contentpage__is_structure_only=True)
+            .order_by("path")
+            .first()
+        )
+        page.save(update_fields=["structure_redirect_target"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0059_article_publication_date_index'),
+        ('wagtailcore', '0097_baselogentry_uuid_action_timestamp_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contentpage',
+            name='structure_redirect_target',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='wagtailcore.page'),
+        ),
+        migrations.RunPython(set_structure_redirect_targets, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,5 @@
 from django.contrib import messages
 from django.core.exceptions import ValidationError
-from django.core.paginator import EmptyPage
-from django.core.paginator import PageNotAnInteger
-from django.core.paginator import Paginator
 from django.core.validators import RegexValidator
 from django.db import models
 from django.http import Http404
@@ -10,17 +7,22 @@ from django.http import HttpResponseForbidden
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
 from django.utils import timezone
+from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy as _
 from wagtail.admin.panels import FieldPanel
 from wagtail.fields import RichTextField
 from wagtail.fields import StreamField
 from wagtail.models import Page
+from wagtail.models import Site
 
 from ams.cms.blocks import ContentPageBlocks
 from ams.cms.blocks import ContentStreamBlocks
 from ams.cms.blocks import HomePageBlocks
 from ams.cms.forms import ContactForm
 from ams.cms.models.contact import ContactFormSubmission
+from ams.cms.page_cache import get_page_cache_version
+from ams.cms.renditions import page_stream_values
+from ams.cms.renditions import prefetch_renditions
 from ams.utils.email import send_templated_email
 from ams.utils.permissions import user_has_active_membership
 from ams.utils.reserved_paths import get_reserved_paths_set
@@ -58,6 +60,26 @@ class BasePage(Page):
     class Meta:
         abstract = True
 
+    def get_context(self, request, *args, **kwargs):
+        """Fetch every image rendition the page's blocks render in one query."""
+        context = super().get_context(request, *args, **kwargs)
+        prefetch_renditions(*page_stream_values(self))
+        return context
+
+    def serve(self, request, *args, **kwargs):
+        """Mark the response for the anonymous page cache if the page allows it.
+
+        PageCacheMiddleware decides whether the response is stored; see
+        ams/cms/page_cache.py.
+        """
+        response = super().serve(request, *args, **kwargs)
+        response.page_cacheable = self.is_page_cacheable()
+        return response
+
+    def is_page_cacheable(self):
+        """Whether every anonymous visitor can be shown the same response."""
+        return True
+
 
 class HomePage(BasePage):
     body = StreamField(
@@ -103,6 +125,17 @@ class ContentPage(BasePage):
             "first child page.",
         ),
     )
+    # The page a structure-only page redirects to: its first live descendant
+    # that isn't structure-only itself. Kept up to date by signals in
+    # ams/cms/signals.py so serving the redirect doesn't search the tree.
+    structure_redirect_target = models.ForeignKey(
+        "wagtailcore.Page",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
 
     # Metadata
     content_panels = [
@@ -114,6 +147,7 @@ class ContentPage(BasePage):
     template = "cms/pages/content.html"
     parent_page_types = ["cms.HomePage", "cms.ContentPage"]
     subpage_types = ["cms.ContentPage"]
+    exclude_fields_in_copy = ["structure_redirect_target"]
 
     def serve(self, request, *args, **kwargs):
         """Override serve to enforce visibility restrictions and handle structure-only
@@ -127,10 +161,13 @@ class ContentPage(BasePage):
 
         # Then check if structure-only
         if self.is_structure_only:
-            # Find first live descendant (supports multi-level structure pages)
-            first_descendant = self.get_descendants().live().first()
-            if first_descendant:
-                return redirect(first_descendant.url)
+            target = self.structure_redirect_target
+            if target is None:
+                # Not resolved yet, e.g. a copied page, or its target was
+                # deleted.
+                target = self.update_structure_redirect_target()
+            if target:
+                return redirect(target.url)
             # If no descendants, return 404
             raise Http404(_("This page has no published content."))
 
@@ -139,6 +176,56 @@ class ContentPage(BasePage):
 
         return super().serve(request, *args, **kwargs)
 
+    def is_page_cacheable(self):
+        return self.visibility == self.VISIBILITY_PUBLIC
+
+    def with_content_json(self, content):
+        """Keep the live redirect target when restoring a revision.
+
+        The target follows the page's live descendants rather than its
+        content, so the value saved with an older revision is out of date.
+        """
+        obj = super().with_content_json(content)
+        obj.structure_redirect_target_id = self.structure_redirect_target_id
+        return obj
+
+    def find_structure_redirect_target(self):
+        """Return the page a structure-only page should redirect to, or None.
+
+        This is the first live descendant that isn't structure-only itself, so
+        nested structure pages redirect straight to a content page.
+        """
+        return (
+            self.get_descendants()
+            .live()
+            .exclude(contentpage__is_structure_only=True)
+            .first()
+        )
+
+    def update_structure_redirect_target(self):
+        """Find and store the page's redirect target, and return it."""
+        target = self.find_structure_redirect_target()
+        target_id = target.pk if target else None
+        if target_id != self.structure_redirect_target_id:
+            ContentPage.objects.filter(pk=self.pk).update(
+                structure_redirect_target=target,
+            )
+        self.structure_redirect_target = target
+        return target
+
+    @classmethod
+    def update_structure_redirect_targets(cls, page):
+        """Update the redirect targets of ``page`` and its structure-only ancestors.
+
+        Called when ``page`` is published, unpublished or moved, since that can
+        change the first live page under any of them.
+        """
+        structure_pages = cls.objects.ancestor_of(page, inclusive=True).filter(
+            is_structure_only=True,
+        )
+        for structure_page in structure_pages:
+            structure_page.update_structure_redirect_target()
+
     def _handle_contact_form(self, request, *args, **kwargs):
         form = ContactForm(request.POST)
         if form.is_valid():
@@ -206,36 +293,72 @@ class ArticlesIndexPage(BasePage):
     subpage_types = ["cms.ArticlePage"]
     parent_page_types = ["cms.HomePage"]
     template = "cms/pages/articles_index_page.html"
+    fragment_template = "cms/partials/article_list_page.html"
 
     content_panels = [*Page.content_panels, FieldPanel("intro")]
 
     def get_context(self, request):
-        """Add paginated articles to context."""
+        """Add a page of articles and the article count to context.
+
+        Articles are paged by cursor rather than page number: ?before= gives
+        the articles older than the cursor's article and ?after= the newer
+        ones. See ams/cms/articles.py.
+        """
+        # Imported here to avoid circular dependencies
+        from ams.cms.articles import article_count  # noqa: PLC0415
+        from ams.cms.articles import paginate_articles  # noqa: PLC0415
+
         context = super().get_context(request)
+        context["articles"] = paginate_articles(
+            self._published_articles(),
+            before=request.GET.get("before"),
+            after=request.GET.get("after"),
+        )
+        context["article_count"] = article_count(self)
+        return context
+
+    def get_template(self, request, *args, **kwargs):
+        """Render only the page of cards for the "Older articles" link."""
+        if request.GET.get("fragment"):
+            return self.fragment_template
+        return super().get_template(request, *args, **kwargs)
+
+    def serve(self, request, *args, **kwargs):
+        """Permanently redirect old ?page= links to the same articles' cursor."""
+        if "page" in request.GET:
+            return redirect(self._page_number_url(request), permanent=True)
+        return super().serve(request, *args, **kwargs)
 
-        # Get all live articles ordered by publication date
+    def _published_articles(self):
         # Only show articles where publication_date <= now()
-        articles = (
+        return (
             ArticlePage.objects.child_of(self)
             .live()
             .select_related("cover_image")
             .filter(publication_date__lte=timezone.now())
-            .order_by("-publication_date")
         )
 
-        # Paginate articles (12 per page)
-        page = request.GET.get("page", 1)
-        paginator = Paginator(articles, 12)
+    def _page_number_url(self, request):
+        from ams.cms.articles import ARTICLES_PER_PAGE  # noqa: PLC0415
+        from ams.cms.articles import article_cursor  # noqa: PLC0415
 
+        url = self.get_url(request)
         try:
-            articles_page = paginator.page(page)
-        except PageNotAnInteger:
-            articles_page = paginator.page(1)
-        except EmptyPage:
-            articles_page = paginator.page(paginator.num_pages)
-
-        context["articles"] = articles_page
-        return context
+            number = int(request.GET["page"])
+        except ValueError:
+            return url
+        if number <= 1:
+            return url
+        # The last article of the previous page; a one-off offset query.
+        offset = (number - 1) * ARTICLES_PER_PAGE - 1
+        previous = list(
+            self._published_articles().order_by("-publication_date", "-pk")[
+                offset : offset + 1
+            ],
+        )
+        if not previous:
+            return url
+        return f"{url}?{urlencode({'before': article_cursor(previous[0])})}"
 
 
 class ArticlePage(BasePage):
@@ -279,3 +402,44 @@ class ArticlePage(BasePage):
 
     class Meta:
         ordering = ["-publication_date"]
+        indexes = [
+            # Keyset pagination of the articles index (ams/cms/articles.py).
+            models.Index(
+                fields=["publication_date", "page_ptr"],
+                name="cms_article_pub_date_idx",
+            ),
+        ]
+
+    def serve(self, request, *args, **kwargs):
+        """Answer a conditional GET with 304 Not Modified if the article is unchanged.
+
+        The ETag combines the article's last_published_at, the site's page
+        cache version (bumped when any page is published, so blocks listing
+        other pages stay current) and the request's own parts; see
+        ams/utils/conditional_get.py.
+        """
+        # Imported here to avoid circular dependencies
+        from ams.utils.conditional_get import is_conditional_request  # noqa: PLC0415
+        from ams.utils.conditional_get import make_etag  # noqa: PLC0415
+        from ams.utils.conditional_get import not_modified_response  # noqa: PLC0415
+        from ams.utils.conditional_get import set_validators  # noqa: PLC0415
+
+        if getattr(request, "is_preview", False):
+            return super().serve(request, *args, **kwargs)
+        site = Site.find_for_request(request)
+        last_modified = self.last_published_at
+        etag = make_etag(
+            request,
+            [
+                "article",
+                self.pk,
+                last_modified,
+                get_page_cache_version(site.pk) if site else None,
+            ],
+        )
+        if is_conditional_request(request):
+            response = not_modified_response(request, etag, last_modified)
+            if response is not None:
+                return response
+        response = super().serve(request, *args, **kwargs)
+        return set_validators(request, response, etag, last_modified)
@@ -0,0 +1,118 @@
+"""Full-page cache for anonymous visitors to CMS pages.
+
+Rendering a CMS page builds its menus, theme CSS and blocks on every request,
+although anonymous visitors all see the same page. PageCacheMiddleware
+(ams/utils/middleware/page_cache.py) stores the rendered response of a page
+that opted in (BasePage.is_page_cacheable) and serves it to the next
+anonymous visitor to the same site, language and path.
+
+Only the query parameters a cached page reads (PAGE_CACHE_QUERY_PARAMS) are
+part of the key, and tracking parameters such as utm_source are ignored, so
+links shared with them reuse the page's entry. Any other parameter skips the
+cache, so junk query strings can't fill the bounded cache with copies of a
+page.
+
+404s of paths that no page answers are stored too, so a bot repeating junk
+paths skips page routing. They go in their own small per-process cache
+(NOT_FOUND_CACHE_ALIAS) rather than the shared one, so a scan of junk paths
+can't evict anything else.
+
+Each site has a cache version. Cached responses record the version they were
+rendered under and are only served while it is current, so purging a site is
+a single write (purge_page_cache); signals in ams/cms/signals.py purge on
+publishing, theme and menu changes.
+"""
+
+import hashlib
+import time
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.http import urlencode
+from wagtail.models import Site
+
+PAGE_CACHE_ALIAS = "pages"
+NOT_FOUND_CACHE_ALIAS = "not_found"
+
+# The articles index's cursors and load-more fragment.
+PAGE_CACHE_QUERY_PARAMS = frozenset({"before", "after", "fragment"})
+# Added to links by analytics and ad platforms; no page reads them.
+TRACKING_QUERY_PARAMS = frozenset(
+    {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "_ga"},
+)
+
+
+def _version_key(site_id):
+    return f"page_cache_version_site{site_id}"
+
+
+def page_cache_key(request, site):
+    """Return the page cache key for ``request`` on ``site``.
+
+    Returns None if the request can't use the cache: there is no site, or the
+    query string has a parameter that is neither read by a cached page nor a
+    tracking parameter.
+    """
+    if site is None:
+        return None
+    params = []
+    for name, values in request.GET.lists():
+        if name in PAGE_CACHE_QUERY_PARAMS:
+            params.extend((name, value) for value in values)
+        elif not (name.startswith("utm_") or name in TRACKING_QUERY_PARAMS):
+            return None
+    location = f"{request.path}?{urlencode(sorted(params))}"
+    location_hash = hashlib.sha256(location.encode()).hexdigest()
+    return f"page_cache_site{site.pk}_{request.LANGUAGE_CODE}_{location_hash}"
+
+
+def get_cached_page(site, page_key):
+    """Look up the cached response stored under ``page_key`` on ``site``.
+
+    Returns ``(response or None, version)``. Pass the version on to
+    cache_page_response(), so that a page rendered while its site was being
+    purged is stored as already stale.
+    """
+    version_key = _version_key(site.pk)
+    cached = caches[PAGE_CACHE_ALIAS].get_many([version_key, page_key])
+    version = cached.get(version_key)
+    entry = cached.get(page_key) or caches[NOT_FOUND_CACHE_ALIAS].get(page_key)
+    if entry is None or entry["version"] != version:
+        return None, version
+    response = HttpResponse(
+        entry["content"],
+        status=entry.get("status", 200),
+        headers=entry["headers"],
+    )
+    response["X-Page-Cache"] = "hit"
+    return response, version
+
+
+def get_page_cache_version(site_id):
+    """Return a site's page cache version, or None if it was never purged."""
+    return caches[PAGE_CACHE_ALIAS].get(_version_key(site_id))
+
+
+def cache_page_response(page_key, response, version):
+    """Store a rendered page response, or 404, for later anonymous requests."""
+    alias = PAGE_CACHE_ALIAS
+    if response.status_code == 404:  # noqa: PLR2004
+        alias = NOT_FOUND_CACHE_ALIAS
+    caches[alias].set(
+        page_key,
+        {
+            "version": version,
+            "status": response.status_code,
+            "content": response.content,
+            "headers": dict(response.headers),
+        },
+    )
+
+
+def purge_page_cache(site_id=None):
+    """Make every cached page of a site, or of all sites, stale."""
+    site_ids = [site_id] if site_id else Site.objects.values_list("pk", flat=True)
+    caches[PAGE_CACHE_ALIAS].set_many(
+        {_version_key(pk): time.time_ns() for pk in site_ids},
+        timeout=None,
+    )
@@ -0,0 +1,95 @@
+"""Index of every site's live page paths, for the 404 page.
+
+When a path isn't found, the 404 page links to the pages at the same path on
+the other language sites. Bots probe thousands of junk paths an hour, so
+rather than routing the path through every site's page tree, page_not_found
+(ams/utils/views.py) looks it up in this index: for each site, the paths of
+its live pages relative to the site root, with their titles.
+
+The index is a single entry in the "pages" cache, under a version that
+signals in ams/cms/signals.py bump when a page is published, unpublished,
+moved or deleted, or a site or its language changes.
+"""
+
+import time
+from typing import NamedTuple
+
+from django.core.cache import caches
+from wagtail.models import Page
+from wagtail.models import Site
+
+from ams.cms.page_cache import PAGE_CACHE_ALIAS
+
+PAGE_PATHS_CACHE_ALIAS = PAGE_CACHE_ALIAS
+
+_VERSION_KEY = "page_paths_version"
+_INDEX_KEY = "page_paths_index"
+
+
+class IndexedPage(NamedTuple):
+    url_path: str
+    title: str
+
+
+class IndexedSite(NamedTuple):
+    language: str | None
+    pages: dict[str, IndexedPage]
+
+
+def page_path_key(path):
+    """Return the index key for a path relative to a site root.
+
+    Pages are routed by their slugs alone, so ``/about/team``, ``about/team/``
+    and ``/about/team/`` all give ``/about/team/``.
+    """
+    parts = [part for part in path.split("/") if part]
+    return f"/{'/'.join(parts)}/" if parts else "/"
+
+
+def _build_index():
+    index = {}
+    for site in Site.objects.select_related("root_page", "sitesettings"):
+        root_url_path = site.root_page.url_path
+        pages = (
+            Page.objects.live()
+            .descendant_of(site.root_page, inclusive=True)
+            .values_list("url_path", "title")
+        )
+        settings = getattr(site, "sitesettings", None)
+        index[site.pk] = IndexedSite(
+            language=getattr(settings, "language", None) or None,
+            pages={
+                page_path_key(url_path[len(root_url_path) :]): IndexedPage(
+                    url_path,
+                    title,
+                )
+                for url_path, title in pages
+            },
+        )
+    return index
+
+
+def get_page_path_index():
+    """Return ``{site id: IndexedSite}`` for every site.
+
+    Costs one cache lookup when the index is current, and a query per site to
+    rebuild it otherwise.
+    """
+    cache = caches[PAGE_PATHS_CACHE_ALIAS]
+    cached = cache.get_many([_VERSION_KEY, _INDEX_KEY])
+    version = cached.get(_VERSION_KEY)
+    entry = cached.get(_INDEX_KEY)
+    if version is not None and entry is not None and entry["version"] == version:
+        return entry["index"]
+
+    if version is None:
+        cache.add(_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(_VERSION_KEY)
+    index = _build_index()
+    cache.set(_INDEX_KEY, {"version": version, "index": index}, timeout=None)
+    return index
+
+
+def bump_page_path_index():
+    """Make the cached index stale, so the next 404 rebuilds it."""
+    caches[PAGE_PATHS_CACHE_ALIAS].set(_VERSION_KEY, time.time_ns(), timeout=None)
@@ -0,0 +1,109 @@
+"""Rendition prefetching and pre-generation for StreamField pages.
+
+Each {% picture %} or {% image %} tag looks up its image's renditions on its
+own, and generates any that are missing while the page renders. Blocks that
+render images implement ``image_renditions(value)``, yielding an
+``(image, filter spec)`` pair for each tag in their template, so a page can
+instead fetch every rendition it needs in one query (prefetch_renditions) and
+have them generated when it's published (generate_renditions).
+"""
+
+from django.db.models import Prefetch
+from django.db.models import prefetch_related_objects
+from wagtail.blocks import StreamValue
+from wagtail.blocks import StructValue
+from wagtail.blocks.list_block import ListValue
+from wagtail.fields import StreamField
+from wagtail.images import get_image_model
+from wagtail.images.models import Filter
+
+
+def _image_specs(image, filter_spec):
+    # Specs as the tags store them: "preserve-svg" is dropped, and for an SVG
+    # so are the format-* operations, which can collapse several specs to one.
+    return list(
+        dict.fromkeys(
+            image.clean_filter_for_svg(Filter(spec=spec)).spec
+            for spec in Filter.expand_spec(filter_spec)
+        ),
+    )
+
+
+def _walk(block, value):
+    if hasattr(block, "image_renditions"):
+        for image, filter_spec in block.image_renditions(value):
+            if image:
+                yield image, _image_specs(image, filter_spec)
+    if isinstance(value, StreamValue):
+        for child in value:
+            yield from _walk(child.block, child.value)
+    elif isinstance(value, StructValue):
+        for name, child_value in value.items():
+            yield from _walk(block.child_blocks[name], child_value)
+    elif isinstance(value, ListValue):
+        for item in value:
+            yield from _walk(block.child_block, item)
+
+
+def stream_renditions(*stream_values):
+    """Return ``[(image, [filter specs])]`` for every image rendered by blocks.
+
+    Nested blocks (columns, layout sections) are included. The same image
+    may appear more than once, as a separate instance per block.
+    """
+    return [
+        rendition
+        for stream_value in stream_values
+        for rendition in _walk(stream_value.stream_block, stream_value)
+    ]
+
+
+def prefetch_renditions(*stream_values):
+    """Fetch the renditions for every image in ``stream_values`` in one query.
+
+    Rendering then finds each rendition in the prefetched list rather than
+    looking it up. Renditions that don't exist yet are still generated when
+    rendered.
+    """
+    renditions = stream_renditions(*stream_values)
+    if not renditions:
+        return
+    filter_specs = {spec for _image, specs in renditions for spec in specs}
+    rendition_model = get_image_model().get_rendition_model()
+    prefetch_related_objects(
+        [image for image, _specs in renditions],
+        Prefetch(
+            "renditions",
+            queryset=rendition_model.objects.filter(filter_spec__in=filter_specs),
+            to_attr="prefetched_renditions",
+        ),
+    )
+
+
+def generate_renditions(*stream_values):
+    """Generate every missing rendition for the images in ``stream_values``.
+
+    Returns the number of renditions that were generated.
+    """
+    prefetch_renditions(*stream_values)
+    filters_by_image = {}
+    for image, specs in stream_renditions(*stream_values):
+        _image, filters = filters_by_image.setdefault(image.pk, (image, {}))
+        filters.update(dict.fromkeys(Filter(spec=spec) for spec in specs))
+    generated = 0
+    for image, filters in filters_by_image.values():
+        existing = image.find_existing_renditions(*filters)
+        missing = [
+            spec_filter for spec_filter in filters if spec_filter not in existing
+        ]
+        generated += len(image.create_renditions(*missing))
+    return generated
+
+
+def page_stream_values(page):
+    """Return the values of every StreamField on ``page``."""
+    return [
+        getattr(page, field.attname)
+        for field in page._meta.get_fields()  # noqa: SLF001
+        if isinstance(field, StreamField)
+    ]
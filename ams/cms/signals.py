@@ -2,19 +2,22 @@
 
 Theme Settings Caching Strategy:
 --------------------------------
-The theme settings use a two-tier caching approach for optimal performance:
+The theme's custom <head> HTML ({% theme_html %}) uses a two-tier caching
+approach for optimal performance:
 
 1. Version Cache Key: `theme_version_site{site_id}`
    - Stores only the cache_version integer (lightweight)
    - Checked on every request (fast cache lookup)
+   - Also kept in the "pages" cache for conditional GET ETags
+     (ams/utils/conditional_get.py)
 
-2. CSS Cache Key: `theme_css_v{version}_site{site_id}`
-   - Stores the rendered CSS HTML (heavier object)
+2. HTML Cache Key: `theme_html_v{version}_site{site_id}`
+   - Stores the custom HTML (heavier object)
    - Only fetched when version matches
 
 Flow:
-- On first request: DB query → render CSS → cache both tiers
-- On subsequent requests: Check version cache → use CSS cache (no DB query)
+- On first request: DB query → cache both tiers
+- On subsequent requests: Check version cache → use HTML cache (no DB query)
 - On theme update: cache_version increments → old caches become stale
 - Signals clean up old cache entries to prevent bloat
 
@@ -24,17 +27,41 @@ This ensures:
 - Immediate propagation of changes (no staleness)
 """
 
+from functools import partial
+
 from django.core.cache import cache
+from django.core.cache import caches
+from django.db import transaction
 from django.db.models.signals import post_delete
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from wagtail.models import Page
+from wagtail.models import PageViewRestriction
+from wagtail.models import Site
+from wagtail.signals import page_published
+from wagtail.signals import page_unpublished
+from wagtail.signals import post_page_move
+from wagtailmenus.models import FlatMenu
+from wagtailmenus.models import FlatMenuItem
+from wagtailmenus.models import MainMenu
+from wagtailmenus.models import MainMenuItem
 
+from ams.cms.articles import bump_articles_version
+from ams.cms.menu_cache import bump_menu_cache_version
+from ams.cms.models import ArticlePage
+from ams.cms.models import AssociationSettings
+from ams.cms.models import ContentPage
+from ams.cms.models import SiteSettings
 from ams.cms.models import ThemeSettings
+from ams.cms.page_cache import PAGE_CACHE_ALIAS
+from ams.cms.page_cache import purge_page_cache
+from ams.cms.page_paths import bump_page_path_index
+from ams.cms.tasks import generate_page_renditions_task
 
 
 @receiver(post_save, sender=ThemeSettings)
 def clear_theme_cache_on_save(sender, instance, **kwargs):
-    """Clear theme CSS cache when ThemeSettings is saved.
+    """Clear the theme HTML cache when ThemeSettings is saved.
 
     The cache_version field is auto-incremented on save, so old cache keys
     will naturally become stale. This signal clears the previous version
@@ -42,22 +69,188 @@ def clear_theme_cache_on_save(sender, instance, **kwargs):
 
     Also updates the version cache to point to the new version.
     """
-    # Clear previous version CSS cache (if it exists)
+    # Clear previous version HTML cache (if it exists)
     if instance.cache_version > 1:
-        old_css_cache_key = (
-            f"theme_css_v{instance.cache_version - 1}_site{instance.site_id}"
+        old_html_cache_key = (
+            f"theme_html_v{instance.cache_version - 1}_site{instance.site_id}"
         )
-        cache.delete(old_css_cache_key)
+        cache.delete(old_html_cache_key)
 
-    # Update version cache to new version (triggers cache invalidation)
+    # Update version cache to new version (triggers cache invalidation).
+    # Conditional GETs read the version from the page cache, which unlike the
+    # default cache is enabled in production.
     version_cache_key = f"theme_version_site{instance.site_id}"
     cache.set(version_cache_key, instance.cache_version, None)
+    caches[PAGE_CACHE_ALIAS].set(version_cache_key, instance.cache_version, None)
 
 
 @receiver(post_delete, sender=ThemeSettings)
 def clear_theme_cache_on_delete(sender, instance, **kwargs):
-    """Clear theme CSS cache when ThemeSettings is deleted."""
-    css_cache_key = f"theme_css_v{instance.cache_version}_site{instance.site_id}"
+    """Clear the theme HTML cache when ThemeSettings is deleted."""
+    html_cache_key = f"theme_html_v{instance.cache_version}_site{instance.site_id}"
     version_cache_key = f"theme_version_site{instance.site_id}"
-    cache.delete(css_cache_key)
+    cache.delete(html_cache_key)
     cache.delete(version_cache_key)
+    caches[PAGE_CACHE_ALIAS].delete(version_cache_key)
+
+
+@receiver(page_published)
+def generate_renditions_on_publish(sender, instance, **kwargs):
+    """Generate a published page's image renditions before visitors need them.
+
+    Enqueued after commit, like Wagtail's own tasks. No task worker is
+    deployed (see TASKS in config/settings/base.py), so the renditions are
+    generated at the end of the publishing request; warm_renditions backfills
+    any that a failed run left out.
+    """
+    transaction.on_commit(
+        lambda: generate_page_renditions_task.enqueue(instance.pk),
+    )
+
+
+def _purge_page_cache_on_commit(site_id):
+    # After commit, so a request can't re-cache the old content in between.
+    transaction.on_commit(partial(purge_page_cache, site_id))
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def purge_page_cache_on_publish(sender, instance, **kwargs):
+    """Purge the cached pages of the site a page was (un)published on.
+
+    The whole site is purged because menus, listings and recent-article
+    blocks on other pages show the page too.
+    """
+    site = instance.get_site()
+    _purge_page_cache_on_commit(site.pk if site else None)
+
+
+@receiver(post_page_move)
+def purge_page_cache_on_move(sender, instance, parent_page_before, **kwargs):
+    """Purge the cached pages of the sites a page was moved from and to."""
+    for page in (parent_page_before, instance):
+        site = page.get_site()
+        _purge_page_cache_on_commit(site.pk if site else None)
+
+
+@receiver(post_save, sender=ThemeSettings)
+@receiver(post_delete, sender=ThemeSettings)
+@receiver(post_save, sender=AssociationSettings)
+@receiver(post_delete, sender=AssociationSettings)
+@receiver(post_save, sender=SiteSettings)
+@receiver(post_delete, sender=SiteSettings)
+@receiver(post_save, sender=MainMenu)
+@receiver(post_delete, sender=MainMenu)
+@receiver(post_save, sender=FlatMenu)
+@receiver(post_delete, sender=FlatMenu)
+def purge_page_cache_on_site_change(sender, instance, **kwargs):
+    """Purge a site's cached pages when its settings or menus change."""
+    _purge_page_cache_on_commit(instance.site_id)
+
+
+@receiver(post_save, sender=MainMenuItem)
+@receiver(post_delete, sender=MainMenuItem)
+@receiver(post_save, sender=FlatMenuItem)
+@receiver(post_delete, sender=FlatMenuItem)
+def purge_page_cache_on_menu_item_change(sender, instance, **kwargs):
+    """Purge a site's cached pages when one of its menu items changes.
+
+    Menu items are saved after their menu, so the menu's own signal can fire
+    before the new items are in place.
+    """
+    _purge_page_cache_on_commit(instance.menu.site_id)
+
+
+def _bump_menu_cache_version_on_commit(site_id):
+    transaction.on_commit(partial(bump_menu_cache_version, site_id))
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def bump_menu_cache_on_publish(sender, instance, **kwargs):
+    """Refresh the cached menus of the site a page was (un)published on.
+
+    Menus show page titles and hide unpublished pages, and may list a newly
+    published child page under a parent that shows its children.
+    """
+    site = instance.get_site()
+    _bump_menu_cache_version_on_commit(site.pk if site else None)
+
+
+@receiver(post_page_move)
+def bump_menu_cache_on_move(sender, instance, parent_page_before, **kwargs):
+    """Refresh the cached menus of the sites a page was moved from and to."""
+    for page in (parent_page_before, instance):
+        site = page.get_site()
+        _bump_menu_cache_version_on_commit(site.pk if site else None)
+
+
+@receiver(post_save, sender=MainMenu)
+@receiver(post_delete, sender=MainMenu)
+@receiver(post_save, sender=FlatMenu)
+@receiver(post_delete, sender=FlatMenu)
+def bump_menu_cache_on_menu_change(sender, instance, **kwargs):
+    """Refresh a site's cached menus when one of its menus changes."""
+    _bump_menu_cache_version_on_commit(instance.site_id)
+
+
+@receiver(post_save, sender=MainMenuItem)
+@receiver(post_delete, sender=MainMenuItem)
+@receiver(post_save, sender=FlatMenuItem)
+@receiver(post_delete, sender=FlatMenuItem)
+def bump_menu_cache_on_menu_item_change(sender, instance, **kwargs):
+    """Refresh a site's cached menus when one of its menu items changes."""
+    _bump_menu_cache_version_on_commit(instance.menu.site_id)
+
+
+@receiver(page_published, sender=ArticlePage)
+@receiver(page_unpublished, sender=ArticlePage)
+@receiver(post_save, sender=PageViewRestriction)
+@receiver(post_delete, sender=PageViewRestriction)
+def bump_articles_on_change(sender, instance, **kwargs):
+    """Refresh the cached recent articles lists and article counts.
+
+    Recent articles lists only include public articles, so a change to any
+    page's view restriction refreshes them too.
+    """
+    transaction.on_commit(bump_articles_version)
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def update_structure_redirects_on_publish(sender, instance, **kwargs):
+    """Re-resolve the redirect targets of the structure pages above a page.
+
+    The page itself is included, as publishing may have just made it
+    structure-only.
+    """
+    ContentPage.update_structure_redirect_targets(instance)
+
+
+@receiver(post_page_move)
+def update_structure_redirects_on_move(
+    sender,
+    instance,
+    parent_page_before,
+    **kwargs,
+):
+    """Re-resolve the redirect targets above a page's old and new positions."""
+    ContentPage.update_structure_redirect_targets(parent_page_before)
+    ContentPage.update_structure_redirect_targets(instance)
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+@receiver(post_delete, sender=Page)
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+@receiver(post_save, sender=SiteSettings)
+@receiver(post_delete, sender=SiteSettings)
+def bump_page_path_index_on_change(sender, instance, **kwargs):
+    """Rebuild the 404 page's index of live page paths after commit.
+
+    Publishing a page also covers a change to its slug, which is only seen
+    once published.
+    """
+    transaction.on_commit(bump_page_path_index)
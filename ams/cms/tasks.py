@@ -0,0 +1,16 @@
+"""Background tasks for CMS pages."""
+
+from django_tasks import task
+from wagtail.models import Page
+
+from ams.cms.renditions import generate_renditions
+from ams.cms.renditions import page_stream_values
+
+
+@task()
+def generate_page_renditions_task(page_id):
+    """Generate the missing image renditions of a page's StreamField blocks."""
+    page = Page.objects.filter(pk=page_id).first()
+    if page is None:
+        return 0
+    return generate_renditions(*page_stream_values(page.specific))
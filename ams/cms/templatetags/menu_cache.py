@@ -0,0 +1,34 @@
+"""Template tags for caching rendered menus."""
+
+from django import template
+from wagtail.models import Site
+
+from ams.cms.menu_cache import active_menu_links
+from ams.cms.menu_cache import get_menu_cache_version
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def menu_cache_key(context):
+    """Return the current request's menu cache key, for {% cache %} keys.
+
+    The key combines the site's menu cache version with the menu links that
+    are active for the request path. The header and footer each ask for it,
+    so it is worked out once per request and kept on the request.
+
+    Returns:
+        str: The key, or None when there is no request or site.
+    """
+    request = context.get("request")
+    if not request:
+        return None
+    if not hasattr(request, "_menu_cache_key"):
+        site = Site.find_for_request(request)
+        key = None
+        if site:
+            version = get_menu_cache_version(site.pk)
+            active = active_menu_links(site, version, request.path)
+            key = f"{version}:{'|'.join(active)}"
+        request._menu_cache_key = key  # noqa: SLF001
+    return request._menu_cache_key  # noqa: SLF001
@@ -2,7 +2,8 @@
 
 from django import template
 from django.core.cache import cache
-from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 from wagtail.models import Site
 
@@ -32,23 +33,17 @@ def hex_to_rgb(hex_color):
 
 
 @register.simple_tag(takes_context=True)
-def theme_css(context):
-    """Render theme CSS with optimized caching.
+def theme_stylesheet(context):
+    """Link the current site's theme CSS.
 
-    Uses a two-tier caching strategy for maximum performance:
-    1. Check cache for version info (lightweight, fast)
-    2. If version matches, use cached rendered CSS
-    3. Only hit database on cache miss or version change
-
-    This ensures:
-    - Single cache lookup per request (version check)
-    - Database query only when cache is empty or theme updated
-    - Immediate propagation of theme changes (no staleness)
+    The URL includes the theme's cache_version, so the stylesheet is served
+    with a far-future immutable Cache-Control header and pages don't carry
+    the theme inline. Reads the request's cached ThemeSettings, shared with
+    the settings context processor, so it adds no query of its own.
 
     Returns:
-        str: Rendered CSS styles in <style> tags
+        str: A <link rel="stylesheet"> tag
     """
-    # Get current site from request
     request = context.get("request")
     if not request:
         return ""
@@ -57,58 +52,23 @@ def theme_css(context):
     if not site:
         return ""
 
-    # Two-tier cache keys
-    version_cache_key = f"theme_version_site{site.id}"
-    css_cache_key_template = "theme_css_v{version}_site{site_id}"
-
-    # Step 1: Check cached version (lightweight check)
-    cached_version = cache.get(version_cache_key)
-
-    if cached_version is not None:
-        # Step 2: Try to get rendered CSS for this version
-        css_cache_key = css_cache_key_template.format(
-            version=cached_version,
-            site_id=site.id,
-        )
-        cached_css = cache.get(css_cache_key)
-
-        if cached_css is not None:
-            # Cache hit - return immediately without DB query
-            return cached_css
-
-    # Step 3: Cache miss or version mismatch - query database
-    try:
-        theme_settings_obj = ThemeSettings.for_site(site)
-    except ThemeSettings.DoesNotExist:
-        return ""
-
-    if not theme_settings_obj:
-        return ""
-
-    # Step 4: Render the CSS
-    html = render_to_string(
-        "templatetags/theme_css.html",
-        {"theme": theme_settings_obj},
+    theme_settings_obj = ThemeSettings.for_request(request)
+    return format_html(
+        '<link href="{}" rel="stylesheet" />',
+        reverse(
+            "cms:theme-css",
+            kwargs={"site_id": site.id, "version": theme_settings_obj.cache_version},
+        ),
     )
 
-    # Step 5: Update both cache tiers
-    css_cache_key = css_cache_key_template.format(
-        version=theme_settings_obj.cache_version,
-        site_id=site.id,
-    )
-
-    # Cache indefinitely - will be invalidated by version change
-    cache.set(version_cache_key, theme_settings_obj.cache_version, None)
-    cache.set(css_cache_key, html, None)
-
-    return html
-
 
 @register.simple_tag(takes_context=True)
 def theme_html(context):
     """Render custom HTML for injection into <head>.
 
-    Uses the same caching strategy as theme_css, keyed on cache_version.
+    Uses a two-tier cache: the site's theme version, then the HTML cached for
+    that version, so only a cache miss or a theme update queries the
+    database.
     """
     request = context.get("request")
     if not request:
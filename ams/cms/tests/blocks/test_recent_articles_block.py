@@ -1,6 +1,7 @@
 """Tests for RecentArticlesBlock."""
 
 import datetime
+from unittest.mock import patch
 
 import pytest
 from django.utils import timezone
@@ -317,3 +318,91 @@ class TestRecentArticlesBlock:
         assert "card h-100" in html
         assert "card-body" in html
         assert "card-title" in html
+
+
+class TestRecentArticlesCache:
+    """Test caching of the recent articles lists."""
+
+    def _titles(self, parent_context, count="6"):
+        block = RecentArticlesBlock()
+        value = block.to_python({"article_count": count})
+        context = block.get_context(value, parent_context=parent_context)
+        return [article.title for article in context["articles"]]
+
+    def test_cached_list_costs_one_query(
+        self,
+        setup_articles,
+        django_assert_num_queries,
+    ):
+        """Test that rendering with a cached list only fetches the articles."""
+        parent_context = {"page": setup_articles["homepage"]}
+        titles = self._titles(parent_context)
+
+        with django_assert_num_queries(1):
+            assert self._titles(parent_context) == titles
+
+    def test_lists_are_cached_per_count(self, setup_articles):
+        """Test that each article count has its own list."""
+        parent_context = {"page": setup_articles["homepage"]}
+        expected_articles = 3
+        assert len(self._titles(parent_context, "3")) == expected_articles
+        assert self._titles(parent_context, "6")[-1] == "Article 5"
+
+    def test_publishing_refreshes_list(
+        self,
+        setup_articles,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that a newly published article appears straight away."""
+        parent_context = {"page": setup_articles["homepage"]}
+        self._titles(parent_context)
+
+        article = ArticlePage(
+            title="Breaking news",
+            slug="breaking-news",
+            publication_date=timezone.now(),
+            summary="Just in",
+            author="Test Author",
+            body=[],
+        )
+        setup_articles["articles_index"].add_child(instance=article)
+        with django_capture_on_commit_callbacks(execute=True):
+            article.save_revision().publish()
+
+        assert self._titles(parent_context)[0] == "Breaking news"
+
+    def test_unpublishing_refreshes_list(
+        self,
+        setup_articles,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that an unpublished article disappears straight away."""
+        parent_context = {"page": setup_articles["homepage"]}
+        self._titles(parent_context)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            setup_articles["articles"][0].unpublish()
+
+        assert "Article 1" not in self._titles(parent_context)
+
+    def test_scheduled_article_appears_when_due(self, setup_articles):
+        """Test that a future article appears once its publication date passes."""
+        parent_context = {"page": setup_articles["homepage"]}
+        now = timezone.now()
+        future_article = ArticlePage(
+            title="Future Article",
+            slug="future-article",
+            publication_date=now + datetime.timedelta(hours=2),
+            summary="This is in the future",
+            author="Test Author",
+            body=[],
+        )
+        setup_articles["articles_index"].add_child(instance=future_article)
+        future_article.save_revision().publish()
+
+        assert "Future Article" not in self._titles(parent_context)
+        with patch(
+            "ams.cms.articles.timezone.now",
+            return_value=now + datetime.timedelta(hours=3),
+        ):
+            assert self._titles(parent_context)[0] == "Future Article"
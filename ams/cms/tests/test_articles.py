@@ -1,5 +1,6 @@
 import datetime
 from http import HTTPStatus
+from unittest.mock import patch
 
 import pytest
 from django.test import Client
@@ -8,6 +9,7 @@ from django.utils import timezone
 from wagtail.fields import StreamField
 from wagtail.models import Page
 
+from ams.cms.articles import article_count
 from ams.cms.models import ArticlePage
 from ams.cms.models import ArticlesIndexPage
 from ams.cms.models import HomePage
@@ -175,103 +177,119 @@ class TestArticlesIndexPage:
         assert len(articles) == 1
         assert articles[0].id == past_article.id
 
-    def test_pagination_with_12_articles(self):
-        """Test that pagination works correctly with exactly 12 articles."""
-        index_page = self.create_articles_index_page()
+    def create_articles(self, index_page, count):
+        """Create ``count`` articles, one a day, newest first."""
         now = timezone.now()
-
-        # Create exactly 12 articles
-        for i in range(12):
+        return [
             self.create_article(
                 index_page,
                 f"Article {i + 1}",
                 now - datetime.timedelta(days=i),
             )
+            for i in range(count)
+        ]
 
-        # Get context for page 1
-        request = RequestFactory().get(index_page.url)
-        context = index_page.get_context(request)
+    def get_articles(self, index_page, query=""):
+        request = RequestFactory().get(index_page.url + query)
+        return index_page.get_context(request)["articles"]
+
+    def test_pagination_with_12_articles(self):
+        """Test that pagination works correctly with exactly 12 articles."""
+        index_page = self.create_articles_index_page()
+        self.create_articles(index_page, 12)
 
-        # All 12 should be on page 1
-        articles = context["articles"]
+        # All 12 should be on the first page
+        articles = self.get_articles(index_page)
         expected_articles = 12
         assert len(list(articles)) == expected_articles
-        assert articles.paginator.num_pages == 1
+        assert not articles.has_other_pages
 
     def test_pagination_with_25_articles(self):
-        """Test that pagination works correctly with 25 articles (3 pages)."""
+        """Test that cursors page through 25 articles (3 pages) and back."""
         index_page = self.create_articles_index_page()
-        now = timezone.now()
+        created = self.create_articles(index_page, 25)
 
-        # Create 25 articles
-        for i in range(25):
-            self.create_article(
-                index_page,
-                f"Article {i + 1}",
-                now - datetime.timedelta(days=i),
-            )
+        page_1 = self.get_articles(index_page)
+        assert [a.id for a in page_1] == [a.id for a in created[:12]]
+        assert not page_1.has_previous
 
-        # Test page 1
-        request = RequestFactory().get(index_page.url + "?page=1")
-        context = index_page.get_context(request)
-        articles = context["articles"]
-        expected_pages = 3
-        expected_page_1_articles = 12
-        assert len(list(articles)) == expected_page_1_articles
-        assert articles.paginator.num_pages == expected_pages
-
-        # Test page 2
-        request = RequestFactory().get(index_page.url + "?page=2")
-        context = index_page.get_context(request)
-        articles = context["articles"]
-        expected_page_2_articles = 12
-        assert len(list(articles)) == expected_page_2_articles
+        page_2 = self.get_articles(index_page, f"?before={page_1.next_cursor}")
+        assert [a.id for a in page_2] == [a.id for a in created[12:24]]
 
-        # Test page 3 (last page with only 1 article)
-        request = RequestFactory().get(index_page.url + "?page=3")
-        context = index_page.get_context(request)
-        articles = context["articles"]
-        expected_page_3_articles = 1
-        assert len(list(articles)) == expected_page_3_articles
+        page_3 = self.get_articles(index_page, f"?before={page_2.next_cursor}")
+        assert [a.id for a in page_3] == [created[24].id]
+        assert not page_3.has_next
+
+        # Newer pages lead back the same way
+        back = self.get_articles(index_page, f"?after={page_3.previous_cursor}")
+        assert [a.id for a in back] == [a.id for a in page_2]
+        back = self.get_articles(index_page, f"?after={back.previous_cursor}")
+        assert [a.id for a in back] == [a.id for a in page_1]
 
-    def test_pagination_invalid_page_defaults_to_page_1(self):
-        """Test that invalid page numbers default to page 1."""
+    def test_pagination_with_equal_publication_dates(self):
+        """Test that articles published at the same time are neither repeated
+        nor skipped."""
         index_page = self.create_articles_index_page()
         now = timezone.now()
+        for i in range(15):
+            self.create_article(index_page, f"Article {i + 1}", now)
 
-        # Create 13 articles (2 pages)
-        for i in range(13):
-            self.create_article(
-                index_page,
-                f"Article {i + 1}",
-                now - datetime.timedelta(days=i),
-            )
+        page_1 = self.get_articles(index_page)
+        page_2 = self.get_articles(index_page, f"?before={page_1.next_cursor}")
+        ids = [a.id for a in page_1] + [a.id for a in page_2]
+        expected_articles = 15
+        assert len(set(ids)) == expected_articles
 
-        # Test with invalid page number
-        request = RequestFactory().get(index_page.url + "?page=invalid")
-        context = index_page.get_context(request)
-        articles = context["articles"]
-        assert articles.number == 1
+    def test_pagination_invalid_cursor_defaults_to_first_page(self):
+        """Test that an invalid cursor shows the first page."""
+        index_page = self.create_articles_index_page()
+        created = self.create_articles(index_page, 13)
+
+        articles = self.get_articles(index_page, "?before=invalid")
+        assert next(iter(articles)).id == created[0].id
+        assert not articles.has_previous
 
-    def test_pagination_out_of_range_returns_last_page(self):
-        """Test that out of range page numbers return the last page."""
+    def test_old_page_number_links_redirect_to_cursor(self):
+        """Test that ?page=N links redirect to the same articles."""
         index_page = self.create_articles_index_page()
-        now = timezone.now()
+        created = self.create_articles(index_page, 25)
 
-        # Create 13 articles (2 pages)
-        for i in range(13):
-            self.create_article(
-                index_page,
-                f"Article {i + 1}",
-                now - datetime.timedelta(days=i),
-            )
+        response = self.client.get(index_page.url + "?page=3")
+        assert response.status_code == HTTPStatus.MOVED_PERMANENTLY
+        response = self.client.get(response["Location"])
+        assert [a.id for a in response.context["articles"]] == [created[24].id]
 
-        # Test with page number beyond range
-        request = RequestFactory().get(index_page.url + "?page=999")
-        context = index_page.get_context(request)
-        articles = context["articles"]
-        expected_page = 2  # Last page
-        assert articles.number == expected_page
+        response = self.client.get(index_page.url + "?page=invalid")
+        assert response["Location"] == index_page.url
+
+    def test_load_more_fragment(self):
+        """Test that ?fragment=1 renders only the next page's cards."""
+        index_page = self.create_articles_index_page()
+        self.create_articles(index_page, 13)
+        cursor = self.get_articles(index_page).next_cursor
+
+        response = self.client.get(index_page.url, {"before": cursor, "fragment": 1})
+        assert response.status_code == HTTPStatus.OK
+        assert b"<html" not in response.content
+        assert b"Article 13" in response.content
+        assert b"data-article-load-more" not in response.content
+
+    def test_article_count_is_cached_until_publish(
+        self,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that the article count is cached and refreshed on publish."""
+        index_page = self.create_articles_index_page()
+        self.create_articles(index_page, 2)
+
+        assert article_count(index_page) == 2  # noqa: PLR2004
+        with django_assert_num_queries(0):
+            assert article_count(index_page) == 2  # noqa: PLR2004
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.create_article(index_page, "Article 3", timezone.now())
+        assert article_count(index_page) == 3  # noqa: PLR2004
 
     def test_articles_index_page_renders(self):
         """Test that the ArticlesIndexPage renders correctly."""
@@ -376,6 +394,46 @@ class TestArticlePage:
         assert b"Test Article" in response.content
         assert b"Test Author" in response.content
 
+    def test_unchanged_article_is_not_modified(self):
+        """Test that revalidating an unchanged article gives a 304."""
+        article = self.create_article()
+        response = self.client.get(article.url)
+        assert response["ETag"]
+
+        not_modified = self.client.get(
+            article.url,
+            headers={"If-None-Match": response["ETag"]},
+        )
+        assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_cached_article_answers_revalidation(self):
+        """Test that the page cache answers revalidation without serving."""
+        article = self.create_article()
+        etag = self.client.get(article.url)["ETag"]
+
+        with patch.object(ArticlePage, "serve", side_effect=AssertionError):
+            not_modified = self.client.get(
+                article.url,
+                headers={"If-None-Match": etag},
+            )
+        assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_republished_article_is_modified(
+        self,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that publishing an article changes its ETag."""
+        article = self.create_article()
+        etag = self.client.get(article.url)["ETag"]
+
+        article.title = "Updated Article"
+        with django_capture_on_commit_callbacks(execute=True):
+            article.save_revision().publish()
+
+        response = self.client.get(article.url, headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.OK
+        assert b"Updated Article" in response.content
+
     def test_article_page_renders_without_summary(self):
         """Test that ArticlePage renders without the summary.
 
@@ -2,6 +2,7 @@
 
 import datetime
 from http import HTTPStatus
+from unittest.mock import patch
 
 import pytest
 from django.contrib.auth import get_user_model
@@ -364,14 +365,104 @@ class TestContentPageStructureOnly:
         child.add_child(instance=grandchild)
         grandchild.save_revision().publish()
 
-        # Request the parent - should redirect to child (which will then redirect to
-        # grandchild). But our test only checks the first redirect
+        # Request the parent - should redirect straight to the grandchild
         response = self.client.get(parent.url)
         assert response.status_code == HTTPStatus.FOUND
+        assert response.url == grandchild.url
+
+    def _structure_page_with_children(self, slug, *child_slugs):
+        parent = ContentPage(title=slug, slug=slug, is_structure_only=True)
+        self.homepage.add_child(instance=parent)
+        parent.save_revision().publish()
+        children = []
+        for child_slug in child_slugs:
+            child = ContentPage(title=child_slug, slug=child_slug)
+            parent.add_child(instance=child)
+            child.save_revision().publish()
+            children.append(child)
+        return parent, children
+
+    def test_structure_only_redirect_does_not_search_the_tree(self):
+        parent, (child, _) = self._structure_page_with_children(
+            "stored-target",
+            "stored-target-child-1",
+            "stored-target-child-2",
+        )
+        parent.refresh_from_db()
+        assert parent.structure_redirect_target_id == child.pk
+
+        with patch.object(
+            ContentPage,
+            "find_structure_redirect_target",
+            side_effect=AssertionError("searched the tree"),
+        ):
+            response = self.client.get(parent.url)
+        assert response.status_code == HTTPStatus.FOUND
         assert response.url == child.url
 
-        # Following the redirect chain would eventually lead to grandchild
-        # The browser would handle this automatically
+    def test_structure_only_redirect_follows_unpublish(
+        self,
+        django_capture_on_commit_callbacks,
+    ):
+        parent, (child1, child2) = self._structure_page_with_children(
+            "unpublish-target",
+            "unpublish-target-child-1",
+            "unpublish-target-child-2",
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            child1.unpublish()
+        assert self.client.get(parent.url).url == child2.url
+
+        with django_capture_on_commit_callbacks(execute=True):
+            child2.unpublish()
+        assert self.client.get(parent.url).status_code == HTTPStatus.NOT_FOUND
+
+        # The 404 above is in the page cache until the publish purges it.
+        with django_capture_on_commit_callbacks(execute=True):
+            child1.save_revision().publish()
+        assert self.client.get(parent.url).url == child1.url
+
+    def test_structure_only_redirect_follows_move(
+        self,
+        django_capture_on_commit_callbacks,
+    ):
+        parent, (child1, child2) = self._structure_page_with_children(
+            "move-target",
+            "move-target-child-1",
+            "move-target-child-2",
+        )
+        other, _ = self._structure_page_with_children("move-target-other")
+        assert self.client.get(other.url).status_code == HTTPStatus.NOT_FOUND
+
+        with django_capture_on_commit_callbacks(execute=True):
+            child1.move(other, pos="last-child")
+        child1.refresh_from_db()
+        assert self.client.get(parent.url).url == child2.url
+        assert self.client.get(other.url).url == child1.url
+
+    def test_structure_only_redirect_after_target_deleted(self):
+        parent, (child1, child2) = self._structure_page_with_children(
+            "delete-target",
+            "delete-target-child-1",
+            "delete-target-child-2",
+        )
+
+        child1.delete()
+        assert self.client.get(parent.url).url == child2.url
+        parent.refresh_from_db()
+        assert parent.structure_redirect_target_id == child2.pk
+
+    def test_structure_only_redirect_kept_when_publishing_old_revision(self):
+        parent, (child,) = self._structure_page_with_children(
+            "revision-target",
+            "revision-target-child",
+        )
+        parent.refresh_from_db()
+
+        parent.get_latest_revision().publish()
+        parent.refresh_from_db()
+        assert parent.structure_redirect_target_id == child.pk
 
     def test_non_structure_only_displays_normally(self):
         """Test that pages without is_structure_only display normally."""
@@ -0,0 +1,107 @@
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+from django.core.files.base import ContentFile
+from django.urls import reverse
+
+from ams.cms.models import AMSDocument
+from ams.memberships.tests.factories import IndividualMembershipFactory
+from ams.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+DOCUMENT_CONTENT = b"%PDF-1.4 members only"
+
+
+@pytest.fixture
+def document():
+    document = AMSDocument(title="Handbook")
+    document.file.save("handbook.pdf", ContentFile(DOCUMENT_CONTENT), save=False)
+    document.save()
+    return document
+
+
+@pytest.fixture
+def member_client(client):
+    membership = IndividualMembershipFactory(active=True)
+    client.force_login(membership.user)
+    return client
+
+
+def document_url(document):
+    return reverse("wagtaildocs_serve", args=(document.id, document.filename))
+
+
+def set_serve_method(settings, method):
+    settings.DOCUMENT_SERVE_METHOD = method
+    settings.WAGTAILDOCS_SERVE_METHOD = (
+        "redirect" if method == "redirect" else "serve_view"
+    )
+
+
+class TestDocumentServeMethods:
+    @pytest.mark.parametrize(
+        "method",
+        ["serve_view", "redirect", "x_accel_redirect"],
+    )
+    def test_non_member_redirected_to_login(self, settings, client, document, method):
+        set_serve_method(settings, method)
+        client.force_login(UserFactory())
+        response = client.get(document_url(document))
+        assert response.status_code == HTTPStatus.FOUND
+        assert response.url == reverse("account_login")
+        assert "X-Accel-Redirect" not in response
+
+    def test_redirect_sends_member_to_storage_url(
+        self,
+        settings,
+        member_client,
+        document,
+    ):
+        set_serve_method(settings, "redirect")
+        with patch.object(type(document.file.storage), "open") as mock_open:
+            response = member_client.get(document_url(document))
+        assert response.status_code == HTTPStatus.FOUND
+        assert response.url == document.file.url
+        # The worker answers without reading any of the file's bytes.
+        mock_open.assert_not_called()
+
+    def test_x_accel_redirect_hands_transfer_to_proxy(
+        self,
+        settings,
+        member_client,
+        document,
+    ):
+        set_serve_method(settings, "x_accel_redirect")
+        settings.DOCUMENT_X_ACCEL_REDIRECT_PREFIX = "/_private-media/"
+        with patch.object(type(document.file.storage), "open") as mock_open:
+            response = member_client.get(document_url(document))
+        assert response.status_code == HTTPStatus.OK
+        assert response.content == b""
+        assert response["X-Accel-Redirect"] == (
+            "/_private-media/" + document.file.url.lstrip("/")
+        )
+        assert response["Content-Type"] == "application/pdf"
+        assert response["Content-Disposition"] == document.content_disposition
+        assert response["Content-Security-Policy"] == "default-src 'none'"
+        mock_open.assert_not_called()
+
+    def test_x_accel_redirect_maps_remote_url_to_internal_path(
+        self,
+        settings,
+        member_client,
+        document,
+    ):
+        set_serve_method(settings, "x_accel_redirect")
+        settings.DOCUMENT_X_ACCEL_REDIRECT_PREFIX = "/_private-media/"
+        remote_url = "https://bucket.example.com/documents/handbook.pdf?sig=abc"
+        with patch.object(
+            type(document.file.storage),
+            "url",
+            return_value=remote_url,
+        ):
+            response = member_client.get(document_url(document))
+        assert response["X-Accel-Redirect"] == (
+            "/_private-media/https/bucket.example.com/documents/handbook.pdf?sig=abc"
+        )
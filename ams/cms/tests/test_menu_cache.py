@@ -0,0 +1,194 @@
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from wagtail.models import Page
+from wagtailmenus.models import MainMenu
+from wagtailmenus.models import MainMenuItem
+
+from ams.cms.menu_cache import active_menu_links
+from ams.cms.menu_cache import bump_menu_cache_version
+from ams.cms.menu_cache import get_menu_cache_version
+from ams.cms.models import ContentPage
+from ams.cms.models import HomePage
+from ams.cms.templatetags.menu_cache import menu_cache_key
+from ams.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _menu_queries(queries):
+    return [
+        query
+        for query in queries.captured_queries
+        if '"wagtailmenus_mainmenuitem"' in query["sql"]
+    ]
+
+
+@pytest.fixture
+def homepage():
+    homepage = HomePage.objects.first()
+    if not homepage:
+        homepage = HomePage(title="Home", slug="home")
+        Page.get_first_root_node().add_child(instance=homepage)
+    return homepage
+
+
+@pytest.fixture
+def about_page(homepage):
+    page = ContentPage(title="About us", slug="about-us")
+    homepage.add_child(instance=page)
+    page.save_revision().publish()
+    return page
+
+
+@pytest.fixture
+def news_page(homepage):
+    page = ContentPage(title="News", slug="news")
+    homepage.add_child(instance=page)
+    page.save_revision().publish()
+    return page
+
+
+@pytest.fixture
+def main_menu(wagtail_site, about_page, news_page):
+    menu = MainMenu.get_for_site(wagtail_site)
+    MainMenuItem.objects.create(menu=menu, link_page=about_page, sort_order=0)
+    MainMenuItem.objects.create(menu=menu, link_page=news_page, sort_order=1)
+    return menu
+
+
+@pytest.fixture
+def client():
+    # Logged in, so responses come from rendering rather than the page cache.
+    client = Client()
+    client.force_login(UserFactory())
+    return client
+
+
+class TestMenuCacheVersion:
+    def test_version_is_stable_until_bumped(self, wagtail_site):
+        version = get_menu_cache_version(wagtail_site.pk)
+        assert get_menu_cache_version(wagtail_site.pk) == version
+        bump_menu_cache_version(wagtail_site.pk)
+        assert get_menu_cache_version(wagtail_site.pk) != version
+
+    def test_bumping_all_sites(self, wagtail_site):
+        version = get_menu_cache_version(wagtail_site.pk)
+        bump_menu_cache_version()
+        assert get_menu_cache_version(wagtail_site.pk) != version
+
+
+class TestActiveMenuLinks:
+    def test_menu_pages_and_their_descendants_match(
+        self,
+        wagtail_site,
+        main_menu,
+        about_page,
+    ):
+        team_page = ContentPage(title="Team", slug="team")
+        about_page.add_child(instance=team_page)
+        version = get_menu_cache_version(wagtail_site.pk)
+        assert active_menu_links(wagtail_site, version, about_page.url) == [
+            about_page.url,
+        ]
+        assert active_menu_links(wagtail_site, version, team_page.url) == [
+            about_page.url,
+            team_page.url,
+        ]
+
+    def test_custom_urls_match_their_path_and_below(self, wagtail_site):
+        menu = MainMenu.get_for_site(wagtail_site)
+        MainMenuItem.objects.create(
+            menu=menu,
+            link_url="/events/",
+            link_text="Events",
+            sort_order=0,
+        )
+        version = get_menu_cache_version(wagtail_site.pk)
+        assert active_menu_links(wagtail_site, version, "/events/1/") == [
+            "/events/",
+        ]
+        assert active_menu_links(wagtail_site, version, "/resources/") == []
+
+    def test_pages_outside_the_menus_share_a_key(
+        self,
+        wagtail_site,
+        main_menu,
+        homepage,
+    ):
+        first, second = (
+            homepage.add_child(instance=ContentPage(title=title, slug=title))
+            for title in ("first", "second")
+        )
+        keys = set()
+        for page in (first, second):
+            request = RequestFactory().get(page.url)
+            keys.add(menu_cache_key({"request": request}))
+        assert len(keys) == 1
+
+
+class TestMenuFragmentCache:
+    def test_menus_are_rendered_once(self, client, main_menu, about_page):
+        client.get(about_page.url)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(about_page.url)
+        assert b"News" in response.content
+        assert _menu_queries(queries) == []
+
+    def test_active_item_is_cached_per_active_link(
+        self,
+        client,
+        main_menu,
+        about_page,
+        news_page,
+    ):
+        client.get(about_page.url)
+        response = client.get(news_page.url)
+        assert b'aria-current="page">News</a>' in response.content
+        assert b'aria-current="page">About us' not in response.content
+
+    def test_publishing_refreshes_menus(
+        self,
+        client,
+        main_menu,
+        about_page,
+        news_page,
+        django_capture_on_commit_callbacks,
+    ):
+        client.get(about_page.url)
+        news_page.title = "What's on"
+        with django_capture_on_commit_callbacks(execute=True):
+            news_page.save_revision().publish()
+        response = client.get(about_page.url)
+        assert b"What&#x27;s on" in response.content
+
+    def test_moving_a_page_refreshes_menus(
+        self,
+        wagtail_site,
+        main_menu,
+        about_page,
+        news_page,
+        django_capture_on_commit_callbacks,
+    ):
+        version = get_menu_cache_version(wagtail_site.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            news_page.move(about_page, pos="last-child")
+        assert get_menu_cache_version(wagtail_site.pk) != version
+
+    def test_menu_change_refreshes_menus(
+        self,
+        client,
+        main_menu,
+        about_page,
+        news_page,
+        django_capture_on_commit_callbacks,
+    ):
+        client.get(about_page.url)
+        with django_capture_on_commit_callbacks(execute=True):
+            main_menu.get_menu_items_manager().filter(
+                link_page=news_page,
+            ).first().delete()
+        response = client.get(about_page.url)
+        assert b"News" not in response.content
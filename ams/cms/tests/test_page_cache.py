@@ -0,0 +1,213 @@
+from http import HTTPStatus
+
+import pytest
+from django.contrib.messages import constants
+from django.contrib.messages.storage.base import Message
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import caches
+from django.test import Client
+from wagtail.models import Page
+from wagtailmenus.models import MainMenu
+
+from ams.cms.models import ContentPage
+from ams.cms.models import HomePage
+from ams.cms.models import ThemeSettings
+from ams.cms.page_cache import purge_page_cache
+from ams.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _is_hit(response):
+    return response.get("X-Page-Cache") == "hit"
+
+
+@pytest.fixture
+def homepage():
+    homepage = HomePage.objects.first()
+    if not homepage:
+        homepage = HomePage(title="Home", slug="home")
+        Page.get_first_root_node().add_child(instance=homepage)
+    return homepage
+
+
+@pytest.fixture
+def content_page(homepage):
+    page = ContentPage(title="About us", slug="about-us")
+    homepage.add_child(instance=page)
+    page.save_revision().publish()
+    return page
+
+
+class TestPageCache:
+    def test_second_anonymous_request_is_served_from_cache(self, content_page):
+        client = Client()
+        first = client.get(content_page.url)
+        second = client.get(content_page.url)
+        assert not _is_hit(first)
+        assert _is_hit(second)
+        assert second.status_code == HTTPStatus.OK
+        assert second.content == first.content
+
+    def test_page_parameters_are_cached_separately(self, content_page):
+        client = Client()
+        client.get(content_page.url)
+        assert not _is_hit(client.get(f"{content_page.url}?before=x"))
+        assert _is_hit(client.get(f"{content_page.url}?before=x"))
+
+    def test_tracking_parameters_share_the_page_entry(self, content_page):
+        client = Client()
+        client.get(content_page.url)
+        response = client.get(f"{content_page.url}?utm_source=news&fbclid=abc")
+        assert _is_hit(response)
+
+    def test_other_parameters_bypass_cache(self, content_page):
+        client = Client()
+        client.get(content_page.url)
+        client.get(f"{content_page.url}?page=2")
+        assert not _is_hit(client.get(f"{content_page.url}?page=2"))
+        assert not _is_hit(client.get(f"{content_page.url}?q=junk"))
+
+    def test_logged_in_users_bypass_cache(self, content_page):
+        Client().get(content_page.url)
+        client = Client()
+        client.force_login(UserFactory())
+        assert not _is_hit(client.get(content_page.url))
+
+    def test_members_only_pages_are_not_cached(self, content_page):
+        content_page.visibility = ContentPage.VISIBILITY_MEMBERS
+        content_page.save_revision().publish()
+        client = Client()
+        client.get(content_page.url)
+        response = client.get(content_page.url)
+        assert response.status_code == HTTPStatus.FORBIDDEN
+        assert not _is_hit(response)
+
+    def test_pages_with_a_form_are_not_cached(self, homepage):
+        page = ContentPage(
+            title="Enquiries",
+            slug="enquiries",
+            body=[("contact_form_block", {"recipient_email": "a@example.com"})],
+        )
+        homepage.add_child(instance=page)
+        page.save_revision().publish()
+        client = Client()
+        client.get(page.url)
+        response = client.get(page.url)
+        assert b"csrfmiddlewaretoken" in response.content
+        assert not _is_hit(response)
+
+    def test_pending_messages_bypass_cache(self, content_page, rf):
+        client = Client()
+        client.get(content_page.url)
+        storage = CookieStorage(rf.get("/"))
+        client.cookies["messages"] = storage._encode(  # noqa: SLF001
+            [Message(constants.SUCCESS, "Your message has been sent.")],
+        )
+        response = client.get(content_page.url)
+        assert not _is_hit(response)
+        assert b"Your message has been sent." in response.content
+
+
+class TestPageCacheNotFound:
+    def test_not_found_pages_are_cached(self, content_page):
+        client = Client()
+        first = client.get("/wp-admin/setup-config.php/")
+        second = client.get("/wp-admin/setup-config.php/")
+        assert first.status_code == HTTPStatus.NOT_FOUND
+        assert not _is_hit(first)
+        assert second.status_code == HTTPStatus.NOT_FOUND
+        assert _is_hit(second)
+        assert second.content == first.content
+
+    def test_not_found_pages_stay_out_of_the_shared_cache(self, content_page):
+        Client().get("/wp-admin/setup-config.php/")
+        assert not [
+            key
+            for key in caches["pages"]._cache  # noqa: SLF001
+            if "page_cache_site" in key
+        ]
+
+    def test_publishing_a_page_at_the_path_purges_it(
+        self,
+        homepage,
+        content_page,
+        django_capture_on_commit_callbacks,
+    ):
+        page = ContentPage(title="News", slug="news", live=False)
+        homepage.add_child(instance=page)
+        client = Client()
+        client.get(page.url)
+        assert _is_hit(client.get(page.url))
+        with django_capture_on_commit_callbacks(execute=True):
+            page.save_revision().publish()
+        assert client.get(page.url).status_code == HTTPStatus.OK
+
+    def test_not_found_from_other_views_is_not_cached(self, content_page):
+        client = Client()
+        client.get("/en/events/event/999999/")
+        response = client.get("/en/events/event/999999/")
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert not _is_hit(response)
+
+
+class TestPageCachePurge:
+    def test_publishing_purges_site(
+        self,
+        content_page,
+        django_capture_on_commit_callbacks,
+    ):
+        client = Client()
+        client.get(content_page.url)
+        content_page.title = "About the association"
+        with django_capture_on_commit_callbacks(execute=True):
+            content_page.save_revision().publish()
+        response = client.get(content_page.url)
+        assert not _is_hit(response)
+        assert b"About the association" in response.content
+
+    def test_unpublishing_another_page_purges_site(
+        self,
+        homepage,
+        content_page,
+        django_capture_on_commit_callbacks,
+    ):
+        other = ContentPage(title="Other", slug="other")
+        homepage.add_child(instance=other)
+        other.save_revision().publish()
+        client = Client()
+        client.get(content_page.url)
+        with django_capture_on_commit_callbacks(execute=True):
+            other.unpublish()
+        assert not _is_hit(client.get(content_page.url))
+
+    def test_theme_change_purges_site(
+        self,
+        content_page,
+        wagtail_site,
+        django_capture_on_commit_callbacks,
+    ):
+        client = Client()
+        client.get(content_page.url)
+        with django_capture_on_commit_callbacks(execute=True):
+            ThemeSettings.for_site(wagtail_site).save()
+        assert not _is_hit(client.get(content_page.url))
+
+    def test_menu_change_purges_site(
+        self,
+        content_page,
+        wagtail_site,
+        django_capture_on_commit_callbacks,
+    ):
+        client = Client()
+        client.get(content_page.url)
+        with django_capture_on_commit_callbacks(execute=True):
+            MainMenu.get_for_site(wagtail_site).save()
+        assert not _is_hit(client.get(content_page.url))
+
+    def test_purge_page_cache(self, content_page, wagtail_site):
+        client = Client()
+        client.get(content_page.url)
+        purge_page_cache(wagtail_site.pk)
+        assert not _is_hit(client.get(content_page.url))
+        assert _is_hit(client.get(content_page.url))
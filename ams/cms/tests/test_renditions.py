@@ -0,0 +1,233 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from wagtail.images.models import Image
+from wagtail.images.models import Rendition
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.images.tests.utils import get_test_image_file_svg
+from wagtail.models import Collection
+from wagtail.models import Page
+
+from ams.cms.models import ContentPage
+from ams.cms.models import HomePage
+from ams.cms.renditions import generate_renditions
+from ams.cms.renditions import prefetch_renditions
+from ams.cms.renditions import stream_renditions
+
+pytestmark = pytest.mark.django_db
+
+# Carousel: 3 formats x 3 widths. Grid fill: 3 formats x 3 sizes. Nested
+# captioned image (fit): 3 formats x 2 heights. Full-width section: 1 + 1.
+PAGE_RENDITION_COUNT = 9 + 9 + 6 + 2
+
+
+def _image(title):
+    return Image.objects.create(
+        title=title,
+        file=get_test_image_file(),
+        collection=Collection.get_first_root_node(),
+    )
+
+
+@pytest.fixture
+def images():
+    return [_image(f"Image {number}") for number in range(4)]
+
+
+@pytest.fixture
+def homepage():
+    homepage = HomePage.objects.first()
+    if not homepage:
+        homepage = HomePage(title="Home", slug="home")
+        Page.get_first_root_node().add_child(instance=homepage)
+    return homepage
+
+
+@pytest.fixture
+def page(homepage, images):
+    carousel, grid, captioned, background = images
+    page = ContentPage(
+        title="Gallery",
+        slug="gallery",
+        body=[
+            (
+                "image_carousel_block",
+                {"slides": [{"image": carousel, "caption": ""}]},
+            ),
+            (
+                "image_grid_block",
+                {"items": [{"image": grid, "image_scaling": "fill"}]},
+            ),
+            (
+                "columns_block",
+                {
+                    "layout": "2-equal",
+                    "columns": [
+                        [
+                            (
+                                "image_block",
+                                {"image": captioned, "image_scaling": "fit"},
+                            ),
+                        ],
+                        [],
+                    ],
+                },
+            ),
+            (
+                "full_width_section_block",
+                {
+                    "background_image": background,
+                    "items": [{"text": "Join", "background_image": carousel}],
+                },
+            ),
+        ],
+    )
+    homepage.add_child(instance=page)
+    return ContentPage.objects.get(pk=page.pk)
+
+
+class TestStreamRenditions:
+    def test_collects_images_from_nested_blocks(self, page, images):
+        renditions = stream_renditions(page.body)
+        assert [image.pk for image, _specs in renditions] == [
+            images[0].pk,
+            images[1].pk,
+            images[2].pk,
+            images[3].pk,
+            images[0].pk,
+        ]
+        _image, carousel_specs = renditions[0]
+        assert carousel_specs[0] == "format-avif|width-640"
+        assert len(carousel_specs) == 9  # noqa: PLR2004
+
+    def test_fit_and_fill_use_their_own_specs(self, page):
+        _image, grid_specs = stream_renditions(page.body)[1]
+        _image, captioned_specs = stream_renditions(page.body)[2]
+        assert "format-jpeg|fill-300x300" in grid_specs
+        assert "format-png|height-1000" in captioned_specs
+
+    def test_plain_timeline_renders_no_images(self, homepage, images):
+        page = ContentPage(
+            title="History",
+            slug="history",
+            body=[
+                (
+                    "timeline_block",
+                    {
+                        "style": "plain",
+                        "items": [{"date": "2020", "image": images[0]}],
+                    },
+                ),
+            ],
+        )
+        homepage.add_child(instance=page)
+        assert stream_renditions(page.body) == []
+
+
+class TestGenerateRenditions:
+    def test_generates_missing_renditions(self, page):
+        assert generate_renditions(page.body) == PAGE_RENDITION_COUNT
+        assert Rendition.objects.count() == PAGE_RENDITION_COUNT
+
+    def test_existing_renditions_are_skipped(self, page):
+        generate_renditions(page.body)
+        page = ContentPage.objects.get(pk=page.pk)
+        assert generate_renditions(page.body) == 0
+
+
+class TestSVGImages:
+    @pytest.fixture
+    def svg_page(self, homepage):
+        svg = Image.objects.create(
+            title="Logo",
+            file=get_test_image_file_svg(),
+            collection=Collection.get_first_root_node(),
+        )
+        page = ContentPage(
+            title="Partners",
+            slug="partners",
+            body=[
+                ("image_block", {"image": svg, "image_scaling": "fit"}),
+                (
+                    "image_grid_block",
+                    {"items": [{"image": svg, "image_scaling": "fill"}]},
+                ),
+            ],
+        )
+        homepage.add_child(instance=page)
+        return ContentPage.objects.get(pk=page.pk)
+
+    def test_svg_specs_skip_format_conversion(self, svg_page):
+        _image, specs = stream_renditions(svg_page.body)[0]
+        assert specs == ["height-500", "height-1000"]
+
+    def test_generates_svg_renditions(self, svg_page):
+        assert generate_renditions(svg_page.body) == 2 + 3
+
+    def test_page_with_svg_renders(self, svg_page):
+        svg_page.save_revision().publish()
+        response = Client().get(svg_page.url)
+        assert response.status_code == HTTPStatus.OK
+        assert b".svg" in response.content
+
+
+class TestPrefetchRenditions:
+    def test_one_query_for_all_renditions(self, page, django_assert_num_queries):
+        generate_renditions(page.body)
+        page = ContentPage.objects.get(pk=page.pk)
+        list(page.body)  # Load the blocks' images first.
+        with django_assert_num_queries(1):
+            prefetch_renditions(page.body)
+        image, specs = stream_renditions(page.body)[0]
+        with django_assert_num_queries(0):
+            assert len(image.get_renditions(*specs)) == len(specs)
+
+    def test_page_renders_with_one_rendition_query(self, page):
+        generate_renditions(page.body)
+        page.save_revision().publish()
+        with CaptureQueriesContext(connection) as queries:
+            response = Client().get(page.url)
+        assert response.status_code == HTTPStatus.OK
+        rendition_queries = [
+            query
+            for query in queries.captured_queries
+            if 'FROM "wagtailimages_rendition"' in query["sql"]
+        ]
+        assert len(rendition_queries) == 1
+        assert Rendition.objects.count() == PAGE_RENDITION_COUNT
+
+
+class TestGenerateOnPublish:
+    def test_publishing_generates_renditions(
+        self,
+        page,
+        django_capture_on_commit_callbacks,
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            page.save_revision().publish()
+        assert Rendition.objects.count() == PAGE_RENDITION_COUNT
+
+
+class TestWarmRenditionsCommand:
+    def test_generates_for_live_pages_in_process(self, page):
+        page.save_revision().publish()
+        Rendition.objects.all().delete()
+        out = StringIO()
+        call_command("warm_renditions", "--workers", "0", stdout=out)
+        assert f"Generated {PAGE_RENDITION_COUNT} renditions" in out.getvalue()
+        assert "(0 failed)" in out.getvalue()
+
+    def test_missing_source_is_reported_and_skipped(self, page, images):
+        page.save_revision().publish()
+        Rendition.objects.all().delete()
+        images[0].file.delete(save=False)
+        out = StringIO()
+        err = StringIO()
+        call_command("warm_renditions", "--workers", "0", stdout=out, stderr=err)
+        assert "(1 failed)" in out.getvalue()
+        assert f"Page {page.pk}" in err.getvalue()
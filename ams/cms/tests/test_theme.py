@@ -1,5 +1,6 @@
 """Tests for theme customization functionality."""
 
+from http import HTTPStatus
 from unittest.mock import patch
 
 import pytest
@@ -8,11 +9,13 @@ from django.core.exceptions import ValidationError
 from django.template import RequestContext
 from django.template import Template
 from django.template.loader import render_to_string
+from django.urls import reverse
 from wagtail.models import Page
 from wagtail.models import Site
 
 from ams.cms.models import ThemeSettings
 from ams.cms.templatetags.theme import hex_to_rgb
+from ams.cms.views import THEME_CSS_MAX_AGE
 
 
 @pytest.fixture
@@ -143,15 +146,13 @@ class TestThemeCSSGeneration:
             body_bg_dark="#000000",
         )
 
-        html = render_to_string("templatetags/theme_css.html", {"theme": theme})
+        html = render_to_string("cms/theme.css", {"theme": theme})
 
         assert ":root" in html
         assert '[data-bs-theme="dark"]' in html
         assert "--bs-primary: #ff0000" in html
         assert "--bs-body-bg: #ffffff" in html
         assert "--bs-primary-rgb: 255, 0, 0" in html
-        assert "<style>" in html
-        assert "</style>" in html
 
     def test_primary_button_css_vars_rendered(self, site):
         """Test that primary button CSS variable overrides are rendered."""
@@ -161,7 +162,7 @@ class TestThemeCSSGeneration:
             primary_btn_text_color="#000000",
         )
 
-        html = render_to_string("templatetags/theme_css.html", {"theme": theme})
+        html = render_to_string("cms/theme.css", {"theme": theme})
 
         assert ".btn-primary" in html
         assert "--bs-btn-bg: var(--bs-primary)" in html
@@ -174,7 +175,7 @@ class TestThemeCSSGeneration:
         """Test that button font weight override is rendered."""
         theme = ThemeSettings.objects.create(site=site, btn_font_weight="700")
 
-        html = render_to_string("templatetags/theme_css.html", {"theme": theme})
+        html = render_to_string("cms/theme.css", {"theme": theme})
 
         assert ".btn" in html
         assert "--bs-btn-font-weight: 700" in html
@@ -189,7 +190,7 @@ class TestThemeCSSGeneration:
             body_color_dark="#ffffff",
         )
 
-        html = render_to_string("templatetags/theme_css.html", {"theme": theme})
+        html = render_to_string("cms/theme.css", {"theme": theme})
 
         # Check light mode section
         light_section = html.split('[data-bs-theme="dark"]')[0]
@@ -209,11 +210,11 @@ class TestThemeSignals:
     def test_cache_cleared_on_delete(self, site):
         """Test that cache is cleared when ThemeSettings is deleted."""
         theme = ThemeSettings.objects.create(site=site)
-        cache_key = f"theme_css_v{theme.cache_version}_site{theme.site_id}"
+        cache_key = f"theme_html_v{theme.cache_version}_site{theme.site_id}"
 
         # Set something in cache
-        cache.set(cache_key, "test css", None)
-        assert cache.get(cache_key) == "test css"
+        cache.set(cache_key, "test html", None)
+        assert cache.get(cache_key) == "test html"
 
         # Delete theme
         theme.delete()
@@ -225,10 +226,10 @@ class TestThemeSignals:
         """Test that old cache version is cleared when saving."""
         theme = ThemeSettings.objects.create(site=site)
         old_version = theme.cache_version
-        old_cache_key = f"theme_css_v{old_version}_site{theme.site_id}"
+        old_cache_key = f"theme_html_v{old_version}_site{theme.site_id}"
 
         # Set old cache
-        cache.set(old_cache_key, "old css", None)
+        cache.set(old_cache_key, "old html", None)
 
         # Save to increment version
         theme.primary_color = "#ff0000"
@@ -236,191 +237,68 @@ class TestThemeSignals:
 
         # Old cache should be cleared
         assert cache.get(old_cache_key) is None
-        assert cache.get(old_cache_key) is None
 
 
 @pytest.mark.django_db
-class TestThemeTemplateTag:
-    """Tests for theme_css template tag."""
-
-    def test_template_tag_renders_theme_css(self, site, rf):
-        """Test that template tag renders theme_css."""
-        theme = ThemeSettings.objects.create(site=site)
-        theme.primary_color = "#ff0000"
-        theme.save()
-        cache.clear()
-
-        request = rf.get("/")
-
-        # Mock Site.find_for_request to return our test site
-        with patch("ams.cms.templatetags.theme.Site.find_for_request") as mock_find:
-            mock_find.return_value = site
-            # Render template tag
-            template = Template("{% load theme %}{% theme_css %}")
-            context = RequestContext(request, {})
-            output = template.render(context)
-
-            assert "<style>" in output
-            assert "#ff0000" in output
-            assert "</style>" in output
+class TestThemeStylesheet:
+    """Tests for the theme_stylesheet template tag and the theme CSS view."""
 
-    def test_template_tag_uses_two_tier_cache(self, site, rf):
-        """Test that template tag uses two-tier caching strategy."""
-        theme = ThemeSettings.objects.create(site=site)
-        cache.clear()
-
-        request = rf.get("/")
+    def _url(self, theme):
+        return reverse(
+            "cms:theme-css",
+            kwargs={"site_id": theme.site_id, "version": theme.cache_version},
+        )
 
-        # Mock Site.find_for_request for all calls
-        with patch(
-            "ams.cms.templatetags.theme.Site.find_for_request",
-        ) as mock_find_site:
-            mock_find_site.return_value = site
-
-            # First call - should query DB and cache both tiers
-            with patch(
-                "ams.cms.templatetags.theme.ThemeSettings.for_site",
-            ) as mock_query:
-                mock_query.return_value = theme
-                template = Template("{% load theme %}{% theme_css %}")
-                context = RequestContext(request, {})
-                output1 = template.render(context)
-                assert mock_query.call_count == 1
-
-            # Second call - should use cache, no DB query
-            with patch(
-                "ams.cms.templatetags.theme.ThemeSettings.for_site",
-            ) as mock_query:
-                template = Template("{% load theme %}{% theme_css %}")
-                context = RequestContext(request, {})
-                output2 = template.render(context)
-                assert mock_query.call_count == 0  # No DB query
-
-            # Results should be identical
-            assert output1 == output2
-
-    def test_template_tag_cache_invalidation(self, site, rf):
-        """Test that template tag detects version changes."""
+    def test_template_tag_links_current_version(self, site, rf):
+        """Test that the tag links the stylesheet for the current version."""
         theme = ThemeSettings.objects.create(site=site)
-        theme.primary_color = "#ff0000"
-        theme.save()
-        cache.clear()
-
         request = rf.get("/")
 
-        # Mock Site.find_for_request for all calls
         with patch("ams.cms.templatetags.theme.Site.find_for_request") as mock_find:
             mock_find.return_value = site
+            template = Template("{% load theme %}{% theme_stylesheet %}")
+            output = template.render(RequestContext(request, {}))
 
-            # First call - caches version 2
-            template = Template("{% load theme %}{% theme_css %}")
-            context = RequestContext(request, {})
-            output1 = template.render(context)
-            assert "#ff0000" in output1
-
-            # Update theme - increments to version 3
-            theme.primary_color = "#00ff00"
-            theme.save()
-            theme.refresh_from_db()
-
-            # Second call - should detect version change and update
-            template = Template("{% load theme %}{% theme_css %}")
-            context = RequestContext(request, {})
-            output2 = template.render(context)
-            assert "#00ff00" in output2
-            assert "#ff0000" not in output2
+        assert output == f'<link href="{self._url(theme)}" rel="stylesheet" />'
 
     def test_template_tag_no_site(self, rf):
-        """Test template tag returns empty when Site.find_for_request returns None."""
-        # Mock Site.find_for_request to return None
+        """Test template tag returns empty when there is no site."""
         with patch("ams.cms.templatetags.theme.Site.find_for_request") as mock_find:
             mock_find.return_value = None
-            request = rf.get("/")
-
-            template = Template("{% load theme %}{% theme_css %}")
-            context = RequestContext(request, {})
-            output = template.render(context)
+            template = Template("{% load theme %}{% theme_stylesheet %}")
+            output = template.render(RequestContext(rf.get("/"), {}))
 
-            assert output == ""
+        assert output == ""
 
-    def test_template_tag_autocreates_settings(self, site, rf):
-        """Test that template tag auto-creates theme settings via for_site."""
-        # Ensure no theme settings exist for this site initially
-        ThemeSettings.objects.filter(site=site).delete()
-        cache.clear()
-
-        request = rf.get("/")
-
-        # Mock Site.find_for_request to return our test site
-        with patch("ams.cms.templatetags.theme.Site.find_for_request") as mock_find:
-            mock_find.return_value = site
-            # Render template tag - should auto-create settings
-            template = Template("{% load theme %}{% theme_css %}")
-            context = RequestContext(request, {})
-            output = template.render(context)
-
-            # Should have created settings with default values
-            assert "<style>" in output
-            assert len(output) > 0
-
-            # Verify settings were created in database
-            theme = ThemeSettings.for_site(site)
-            assert theme is not None
-            assert theme.primary_color == "#0d6efd"  # Default value
-
-    def test_template_tag_performance(self, site, rf):
-        """Test that template tag only queries DB once."""
+    def test_view_serves_immutable_css(self, site, client):
+        """Test that the view serves the theme CSS for a year."""
         theme = ThemeSettings.objects.create(site=site)
-        cache.clear()
+        theme.primary_color = "#ff0000"
+        theme.save()
 
-        request = rf.get("/")
+        response = client.get(self._url(theme))
 
-        # Mock Site.find_for_request for all calls
-        with patch("ams.cms.templatetags.theme.Site.find_for_request") as mock_find:
-            mock_find.return_value = site
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "text/css; charset=utf-8"
+        assert "immutable" in response["Cache-Control"]
+        assert f"max-age={THEME_CSS_MAX_AGE}" in response["Cache-Control"]
+        css = response.content.decode()
+        assert "--bs-primary: #ff0000;" in css
+        assert "<style>" not in css
 
-            # First call
-            with patch(
-                "ams.cms.templatetags.theme.ThemeSettings.for_site",
-            ) as mock_query:
-                mock_query.return_value = theme
-                template = Template("{% load theme %}{% theme_css %}")
-                context = RequestContext(request, {})
-                template.render(context)
-                first_call_count = mock_query.call_count
-
-            # Make 10 more calls - should all use cache
-            with patch(
-                "ams.cms.templatetags.theme.ThemeSettings.for_site",
-            ) as mock_query:
-                for _ in range(10):
-                    template = Template("{% load theme %}{% theme_css %}")
-                    context = RequestContext(request, {})
-                    template.render(context)
-                subsequent_calls = mock_query.call_count
-
-            assert first_call_count == 1
-            assert subsequent_calls == 0  # No DB queries
-
-    def test_template_tag_cache_keys(self, site, rf):
-        """Test that correct cache keys are used."""
+    def test_view_redirects_old_version(self, site, client):
+        """Test that an outdated version redirects to the current one."""
         theme = ThemeSettings.objects.create(site=site)
-        cache.clear()
+        old_url = self._url(theme)
+        theme.save()
 
-        request = rf.get("/")
+        response = client.get(old_url)
 
-        # Mock Site.find_for_request to return our test site
-        with patch("ams.cms.templatetags.theme.Site.find_for_request") as mock_find:
-            mock_find.return_value = site
-            # Render template tag
-            template = Template("{% load theme %}{% theme_css %}")
-            context = RequestContext(request, {})
-            template.render(context)
-
-            # Check that both cache tiers are populated
-            version_key = f"theme_version_site{site.id}"
-            css_key = f"theme_css_v{theme.cache_version}_site{site.id}"
-
-            assert cache.get(version_key) == theme.cache_version
-            assert cache.get(css_key) is not None
-            assert "<style>" in cache.get(css_key)
+        assert response.status_code == HTTPStatus.FOUND
+        assert response["Location"] == self._url(theme)
+        assert "immutable" not in response.get("Cache-Control", "")
+
+    def test_view_unknown_site(self, client):
+        """Test that an unknown site is not found."""
+        url = reverse("cms:theme-css", kwargs={"site_id": 999999, "version": 1})
+        assert client.get(url).status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from ams.cms.views import theme_stylesheet
+
+app_name = "cms"
+urlpatterns = [
+    path("<int:site_id>/<int:version>.css", theme_stylesheet, name="theme-css"),
+]
@@ -1 +1,37 @@
-# Create your views here.
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.shortcuts import redirect
+from django.template.loader import render_to_string
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import require_safe
+from wagtail.models import Site
+
+from ams.cms.models import ThemeSettings
+
+# A theme stylesheet URL includes the theme's cache_version, so its content
+# never changes; browsers and CDNs may keep it for as long as they like.
+THEME_CSS_MAX_AGE = 60 * 60 * 24 * 365
+
+
+@require_safe
+def theme_stylesheet(request, site_id, version):
+    """Serve a site's theme CSS (see the theme_stylesheet template tag).
+
+    A URL for an older version, such as one in a page cached before the
+    theme was saved, redirects to the current version.
+    """
+    site = get_object_or_404(Site, pk=site_id)
+    theme = ThemeSettings.for_site(site)
+    if version != theme.cache_version:
+        return redirect("cms:theme-css", site_id=site.pk, version=theme.cache_version)
+    response = HttpResponse(
+        render_to_string("cms/theme.css", {"theme": theme}),
+        content_type="text/css; charset=utf-8",
+    )
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=THEME_CSS_MAX_AGE,
+        immutable=True,
+    )
+    return response
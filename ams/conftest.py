@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from django.utils.crypto import get_random_string
 from wagtail.models import Collection
 from wagtail.models import Locale
@@ -48,6 +49,12 @@ def _media_storage(settings, tmpdir) -> None:
     settings.MEDIA_ROOT = tmpdir.strpath
 
 
+@pytest.fixture(autouse=True)
+def _page_cache():
+    caches["pages"].clear()
+    caches["not_found"].clear()
+
+
 @pytest.fixture
 def user(db) -> User:
     return UserFactory()
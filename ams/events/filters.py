@@ -1,11 +1,64 @@
 import django_filters
+from django import forms
+from django.conf import settings
+from django.core.cache import caches
 from django.utils.timezone import now
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
+from ams.cms.page_cache import PAGE_CACHE_ALIAS
 from ams.entities.models import Entity
 from ams.events.models import Event
 from ams.events.models import Region
 
+FILTER_CHOICES_CACHE_ALIAS = PAGE_CACHE_ALIAS
+
+
+def _filter_choices_key(language):
+    return f"event_filter_choices_{language}"
+
+
+def get_filter_choices():
+    """Return the region and organiser dropdown choices, by filter name.
+
+    Cached per language, since region names are translated. Signals in
+    ams/events/signals.py clear the cache when a region or entity changes.
+    """
+    cache = caches[FILTER_CHOICES_CACHE_ALIAS]
+    key = _filter_choices_key(get_language())
+    choices = cache.get(key)
+    if choices is None:
+        choices = {
+            "locations__region": [
+                (region.pk, str(region)) for region in Region.objects.all()
+            ],
+            "organisers": [(entity.pk, str(entity)) for entity in Entity.objects.all()],
+        }
+        cache.set(key, choices, timeout=None)
+    return choices
+
+
+def clear_filter_choices():
+    """Make every language's cached dropdown choices stale."""
+    caches[FILTER_CHOICES_CACHE_ALIAS].delete_many(
+        [_filter_choices_key(code) for code, _name in settings.LANGUAGES],
+    )
+
+
+class EventFilterForm(forms.Form):
+    """Fills the region and organiser dropdowns from get_filter_choices().
+
+    Only the widgets take the cached choices: the fields still validate a
+    choice against their queryset, so a filtered request looks up the chosen
+    object, but rendering the form doesn't.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name, choices in get_filter_choices().items():
+            field = self.fields[name]
+            field.widget.choices = [("", field.empty_label), *choices]
+
 
 class BaseEventFilter(django_filters.FilterSet):
     locations__region = django_filters.ModelChoiceFilter(
@@ -28,6 +81,7 @@ class BaseEventFilter(django_filters.FilterSet):
 
     class Meta:
         model = Event
+        form = EventFilterForm
         fields = [
             "locations__region",
             "accessible_online",
@@ -0,0 +1,206 @@
+"""iCalendar (RFC 5545) feeds of upcoming events, for calendar subscriptions.
+
+Calendar clients poll a subscribed feed every few minutes, so a feed is
+rendered once and cached in the "pages" cache, and EventCalendarView answers
+most polls with a 304 Not Modified. Whether a feed has changed is worked out
+from a single aggregate over its events (their latest ``updated_datetime``
+and their count) and the events version (ams/events/versions.py). These give
+the feed's ``ETag`` and ``Last-Modified`` headers.
+"""
+
+import datetime
+import html
+from typing import NamedTuple
+
+from django.core.cache import caches
+from django.db.models import Count
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.html import strip_tags
+from modeltranslation.utils import get_language
+
+from ams.cms.page_cache import PAGE_CACHE_ALIAS
+from ams.events.models import Event
+from ams.events.versions import get_events_version
+
+ICAL_CACHE_ALIAS = PAGE_CACHE_ALIAS
+# How often calendar clients are asked to poll the feeds.
+REFRESH_INTERVAL = "PT1H"
+
+_LINE_OCTETS = 75
+
+
+class FeedState(NamedTuple):
+    etag: str
+    last_modified: datetime.datetime
+
+
+def feed_events(**filters):
+    """Return the upcoming published events in a feed."""
+    return Event.objects.filter(published=True, end__gte=timezone.now(), **filters)
+
+
+def feed_state(events):
+    """Return the ETag and Last-Modified of a feed of ``events``.
+
+    Costs one cache lookup and one aggregate query. The count catches events
+    leaving the feed, and the version changes to locations, sessions and the
+    like, which don't update their events' ``updated_datetime``.
+    """
+    version = get_events_version()
+    state = events.aggregate(
+        last_updated=Max("updated_datetime"),
+        count=Count("pk", distinct=True),
+    )
+    version_time = datetime.datetime.fromtimestamp(version / 1e9, tz=datetime.UTC)
+    last_updated = state["last_updated"]
+    return FeedState(
+        etag=(
+            f"{get_language()}-{version}-{state['count']}-"
+            f"{int(last_updated.timestamp()) if last_updated else 0}"
+        ),
+        last_modified=max(last_updated or version_time, version_time),
+    )
+
+
+def cached_feed(key, state, render):
+    """Return the body of feed ``key`` at ``state``, rendered by ``render()``.
+
+    The body is rendered once per state and cached until the next one.
+    """
+    cache = caches[ICAL_CACHE_ALIAS]
+    key = f"events_ical_{key}_{get_language()}"
+    entry = cache.get(key)
+    if entry is not None and entry["etag"] == state.etag:
+        return entry["body"]
+    body = render()
+    cache.set(key, {"etag": state.etag, "body": body}, timeout=None)
+    return body
+
+
+def _escape(text):
+    """Escape a TEXT property value."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _plain_text(value):
+    return html.unescape(strip_tags(value)).strip()
+
+
+def _date_time(value):
+    return value.astimezone(datetime.UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _fold(line):
+    """Split a content line into lines of at most 75 octets."""
+    lines = []
+    current = ""
+    for char in line:
+        limit = _LINE_OCTETS if not lines else _LINE_OCTETS - 1
+        if len((current + char).encode()) > limit:
+            lines.append(current)
+            current = ""
+        current += char
+    lines.append(current)
+    return "\r\n ".join(lines)
+
+
+def _locations(locations):
+    properties = []
+    if locations:
+        properties.append(
+            (
+                "LOCATION",
+                _escape(
+                    "; ".join(
+                        location.get_full_address().replace(",\n", ", ")
+                        for location in locations
+                    ),
+                ),
+            ),
+        )
+        located = [location for location in locations if location.latitude]
+        if located:
+            properties.append(
+                ("GEO", f"{located[0].latitude};{located[0].longitude}"),
+            )
+    return properties
+
+
+def _event_components(event, build_absolute_uri, domain):
+    uid = f"event-{event.pk}@{domain}"
+    properties = [
+        ("UID", uid),
+        ("DTSTAMP", _date_time(event.updated_datetime)),
+        ("LAST-MODIFIED", _date_time(event.updated_datetime)),
+        ("DTSTART", _date_time(event.start or event.end)),
+        ("DTEND", _date_time(event.end)),
+        ("SUMMARY", _escape(event.get_short_name())),
+        ("DESCRIPTION", _escape(_plain_text(event.description))),
+        ("URL", build_absolute_uri(event.get_absolute_url())),
+        *_locations(list(event.locations.all())),
+    ]
+    components = [properties]
+    if event.show_schedule:
+        for session in event.sessions.all():
+            session_properties = [
+                ("UID", f"session-{session.pk}@{domain}"),
+                ("DTSTAMP", _date_time(event.updated_datetime)),
+                ("DTSTART", _date_time(session.start)),
+                ("DTEND", _date_time(session.end)),
+                (
+                    "SUMMARY",
+                    _escape(f"{event.get_short_name()}: {session.name}"),
+                ),
+                ("DESCRIPTION", _escape(_plain_text(session.description))),
+                ("RELATED-TO", uid),
+                ("URL", session.url or build_absolute_uri(event.get_absolute_url())),
+                *_locations(list(session.locations.all())),
+            ]
+            components.append(session_properties)
+    return components
+
+
+def render_calendar(name, events, request):
+    """Return an iCalendar document of ``events``, named ``name``.
+
+    Each event is a VEVENT, and so is each session of an event that shows
+    its schedule.
+    """
+    events = (
+        events.select_related("series")
+        .prefetch_related(
+            "locations__region",
+            "sessions__locations__region",
+        )
+        .order_by("start", "pk")
+        .distinct()
+    )
+    domain = request.get_host()
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//{domain}//Events//{get_language().upper()}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(name)}",
+        f"REFRESH-INTERVAL;VALUE=DURATION:{REFRESH_INTERVAL}",
+        f"X-PUBLISHED-TTL:{REFRESH_INTERVAL}",
+    ]
+    for event in events:
+        for properties in _event_components(
+            event,
+            request.build_absolute_uri,
+            domain,
+        ):
+            lines.append("BEGIN:VEVENT")
+            lines.extend(f"{prop}:{value}" for prop, value in properties if value != "")
+            lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "".join(f"{_fold(line)}\r\n" for line in lines)
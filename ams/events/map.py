@@ -0,0 +1,235 @@
+"""GeoJSON for the events map: locations of upcoming events, clustered.
+
+The events home page map loads its markers from ``map.geojson`` (EventMapView)
+for the area in view, instead of the page embedding every upcoming event.
+Each location with upcoming published events is a GeoJSON point feature
+listing those events, built with a single aggregated query.
+
+At low zoom levels, locations are clustered on the server: the world is cut
+into a grid of cells about CLUSTER_CELL_PIXELS across at that zoom, and the
+locations in each cell become a single cluster feature at their mean
+position. The grid doesn't depend on the area in view, so each zoom level's
+features are built once and cached in the "pages" cache per language, under
+a version that signals in ams/events/signals.py bump when an event, location
+or session changes. Each cached value also goes stale when its first event
+ends, since the event then leaves the map.
+"""
+
+import datetime
+import math
+import time
+
+from django.conf import settings
+from django.contrib.postgres.aggregates import JSONBAgg
+from django.core.cache import caches
+from django.db.models import F
+from django.db.models import Min
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.db.models.functions import JSONObject
+from django.db.models.functions import NullIf
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.formats import date_format
+from modeltranslation.utils import build_localized_fieldname
+from modeltranslation.utils import get_language
+
+from ams.cms.page_cache import PAGE_CACHE_ALIAS
+from ams.events.models import Location
+
+MAP_CACHE_ALIAS = PAGE_CACHE_ALIAS
+# Zoom levels up to this are clustered; closer in, every location is shown.
+CLUSTER_MAX_ZOOM = 9
+CLUSTER_CELL_PIXELS = 60
+TILE_PIXELS = 256
+
+_VERSION_KEY = "events_map_version"
+
+
+def _localized(field):
+    """Return ``field`` in the active language, falling back to the default."""
+    default = build_localized_fieldname(
+        field,
+        settings.MODELTRANSLATION_DEFAULT_LANGUAGE,
+    )
+    return Coalesce(
+        NullIf(F(build_localized_fieldname(field, get_language())), Value("")),
+        F(default),
+    )
+
+
+def _location_features(now):
+    """Return a point feature per located location with upcoming events.
+
+    Also returns the earliest end of those events, or None if there are none.
+    """
+    locations = (
+        Location.objects.filter(
+            latitude__isnull=False,
+            longitude__isnull=False,
+            events__published=True,
+            events__end__gte=now,
+        )
+        .values("pk", "latitude", "longitude")
+        .annotate(
+            title=_localized("name"),
+            events_data=JSONBAgg(
+                JSONObject(
+                    pk="events__pk",
+                    slug="events__slug",
+                    name=_localized("events__name"),
+                    start="events__start",
+                ),
+                order_by=("events__start", "events__pk"),
+            ),
+            first_end=Min("events__end"),
+        )
+        .order_by("pk")
+    )
+    features = []
+    stale_at = None
+    for location in locations:
+        events = []
+        for event in location["events_data"]:
+            start = (
+                datetime.datetime.fromisoformat(event["start"])
+                if event["start"]
+                else None
+            )
+            events.append(
+                {
+                    "url": reverse(
+                        "events:event",
+                        kwargs={"pk": event["pk"], "slug": event["slug"]},
+                    ),
+                    "date": date_format(timezone.localtime(start), "j M Y")
+                    if start
+                    else "",
+                    "name": event["name"],
+                },
+            )
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [
+                        float(location["longitude"]),
+                        float(location["latitude"]),
+                    ],
+                },
+                "properties": {
+                    "title": location["title"],
+                    "url": reverse("events:location", kwargs={"pk": location["pk"]}),
+                    "events": events,
+                },
+            },
+        )
+        if stale_at is None or location["first_end"] < stale_at:
+            stale_at = location["first_end"]
+    return features, stale_at
+
+
+def cluster_features(features, zoom):
+    """Return ``features`` with those close together at ``zoom`` clustered.
+
+    A cluster is a point feature with ``cluster``, ``count`` (locations) and
+    ``event_count`` properties, and a ``bbox`` around its locations.
+    """
+    cell = 360 / (TILE_PIXELS * 2**zoom) * CLUSTER_CELL_PIXELS
+    cells = {}
+    for feature in features:
+        lng, lat = feature["geometry"]["coordinates"]
+        cells.setdefault(
+            (math.floor(lng / cell), math.floor(lat / cell)),
+            [],
+        ).append(feature)
+
+    clustered = []
+    for members in cells.values():
+        if len(members) == 1:
+            clustered.append(members[0])
+            continue
+        lngs = [member["geometry"]["coordinates"][0] for member in members]
+        lats = [member["geometry"]["coordinates"][1] for member in members]
+        clustered.append(
+            {
+                "type": "Feature",
+                "bbox": [min(lngs), min(lats), max(lngs), max(lats)],
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [
+                        sum(lngs) / len(lngs),
+                        sum(lats) / len(lats),
+                    ],
+                },
+                "properties": {
+                    "cluster": True,
+                    "count": len(members),
+                    "event_count": sum(
+                        len(member["properties"]["events"]) for member in members
+                    ),
+                },
+            },
+        )
+    return clustered
+
+
+def map_features(zoom=None):
+    """Return the map's features at ``zoom``, clustered if it is low enough.
+
+    Without a zoom level no features are clustered. Costs one cache lookup
+    when the zoom level's features are current, and one query to rebuild
+    them otherwise.
+    """
+    if zoom is not None and zoom > CLUSTER_MAX_ZOOM:
+        zoom = None
+    key = f"events_map_{get_language()}_{'all' if zoom is None else zoom}"
+    cache = caches[MAP_CACHE_ALIAS]
+    cached = cache.get_many([_VERSION_KEY, key])
+    version = cached.get(_VERSION_KEY)
+    entry = cached.get(key)
+    now = timezone.now()
+    if (
+        version is not None
+        and entry is not None
+        and entry["version"] == version
+        and (entry["stale_at"] is None or now <= entry["stale_at"])
+    ):
+        return entry["features"]
+
+    if version is None:
+        cache.add(_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(_VERSION_KEY)
+    features, stale_at = _location_features(now)
+    if zoom is not None:
+        features = cluster_features(features, zoom)
+    timeout = (
+        None
+        if stale_at is None
+        else max(1, math.ceil((stale_at - now).total_seconds()))
+    )
+    cache.set(
+        key,
+        {"version": version, "features": features, "stale_at": stale_at},
+        timeout=timeout,
+    )
+    return features
+
+
+def in_bbox(feature, bbox):
+    """Return whether a point feature lies in ``(west, south, east, north)``.
+
+    The map can be panned across the antimeridian, so longitudes are compared
+    around the world from ``west``.
+    """
+    west, south, east, north = bbox
+    lng, lat = feature["geometry"]["coordinates"]
+    return south <= lat <= north and (
+        east - west >= 360 or (lng - west) % 360 <= east - west  # noqa: PLR2004
+    )
+
+
+def bump_map_version():
+    """Make every cached set of map features stale."""
+    caches[MAP_CACHE_ALIAS].set(_VERSION_KEY, time.time_ns(), timeout=None)
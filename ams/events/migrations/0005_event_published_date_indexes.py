@@ -0,0 +1,22 @@
+# Generated by Django 5.2.16 on 2026-10-19 00:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entities', '0001_initial'),
+        ('events', '0004_event_description_en_event_description_mi_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('published', True)), fields=['start', 'id'], name='events_published_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('published', True)), fields=['end', 'id'], name='events_published_end_idx'),
+        ),
+    ]
@@ -0,0 +1,197 @@
+# Generated by Django 5.2.16 on 2026-10-19 01:24
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entities', '0001_initial'),
+        ('events', '0005_event_published_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='search_vector_en',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='search_vector_mi',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector_en'], name='events_even_search__6ee770_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector_mi'], name='events_even_search__480f3e_gin'),
+        ),
+        migrations.RunSQL(
+            sql="""
+                -- One vector per language, like the resources' search vectors
+                -- (resources migration 0016). The English vector reads the _en
+                -- columns with the 'english' config; the Maori vector reads the
+                -- _mi columns with the 'simple' config, falling back per field
+                -- to the _en value when the _mi value is blank. Organiser names
+                -- are language-neutral and indexed in both vectors.
+                CREATE OR REPLACE FUNCTION events_event_compute_search_vector_en(
+                    p_id bigint,
+                    p_series_id bigint,
+                    p_name_en text,
+                    p_description_en text
+                ) RETURNS tsvector AS $$
+                    SELECT
+                        setweight(to_tsvector('english', COALESCE(p_name_en, '')), 'A')
+                        || setweight(to_tsvector('english', COALESCE(p_description_en, '')), 'B')
+                        || setweight(to_tsvector('english', COALESCE(
+                            (SELECT string_agg(s.name_en, ' ')
+                             FROM events_session s
+                             WHERE s.event_id = p_id), '')), 'B')
+                        || setweight(to_tsvector('english', COALESCE(
+                            (SELECT s.name_en || ' ' || s.abbreviation_en
+                             FROM events_series s
+                             WHERE s.id = p_series_id), '')), 'C')
+                        || setweight(to_tsvector('english', COALESCE(
+                            (SELECT string_agg(e.name, ' ')
+                             FROM entities_entity e
+                             INNER JOIN events_event_organisers m
+                                 ON m.entity_id = e.id
+                             WHERE m.event_id = p_id), '')), 'C');
+                $$ LANGUAGE sql;
+
+                CREATE OR REPLACE FUNCTION events_event_compute_search_vector_mi(
+                    p_id bigint,
+                    p_series_id bigint,
+                    p_name_en text,
+                    p_description_en text,
+                    p_name_mi text,
+                    p_description_mi text
+                ) RETURNS tsvector AS $$
+                    SELECT
+                        setweight(to_tsvector('simple', COALESCE(NULLIF(p_name_mi, ''), p_name_en, '')), 'A')
+                        || setweight(to_tsvector('simple', COALESCE(NULLIF(p_description_mi, ''), p_description_en, '')), 'B')
+                        || setweight(to_tsvector('simple', COALESCE(
+                            (SELECT string_agg(COALESCE(NULLIF(s.name_mi, ''), s.name_en), ' ')
+                             FROM events_session s
+                             WHERE s.event_id = p_id), '')), 'B')
+                        || setweight(to_tsvector('simple', COALESCE(
+                            (SELECT COALESCE(NULLIF(s.name_mi, ''), s.name_en)
+                                 || ' ' || COALESCE(NULLIF(s.abbreviation_mi, ''), s.abbreviation_en)
+                             FROM events_series s
+                             WHERE s.id = p_series_id), '')), 'C')
+                        || setweight(to_tsvector('simple', COALESCE(
+                            (SELECT string_agg(e.name, ' ')
+                             FROM entities_entity e
+                             INNER JOIN events_event_organisers m
+                                 ON m.entity_id = e.id
+                             WHERE m.event_id = p_id), '')), 'C');
+                $$ LANGUAGE sql;
+
+                -- Row-level trigger on the event itself.
+                CREATE OR REPLACE FUNCTION events_event_search_vector_update()
+                RETURNS trigger AS $$
+                BEGIN
+                    NEW.search_vector_en := events_event_compute_search_vector_en(
+                        NEW.id, NEW.series_id, NEW.name_en, NEW.description_en
+                    );
+                    NEW.search_vector_mi := events_event_compute_search_vector_mi(
+                        NEW.id, NEW.series_id, NEW.name_en, NEW.description_en,
+                        NEW.name_mi, NEW.description_mi
+                    );
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER events_event_search_vector_trigger
+                BEFORE INSERT OR UPDATE OF name_en, description_en, name_mi, description_mi, series_id
+                ON events_event
+                FOR EACH ROW EXECUTE FUNCTION events_event_search_vector_update();
+
+                -- Sessions and organisers: re-index the event they belong to.
+                -- A session moved to another event re-indexes both events.
+                CREATE OR REPLACE FUNCTION events_event_search_vector_refresh()
+                RETURNS trigger AS $$
+                BEGIN
+                    UPDATE events_event SET
+                        search_vector_en = events_event_compute_search_vector_en(
+                            id, series_id, name_en, description_en),
+                        search_vector_mi = events_event_compute_search_vector_mi(
+                            id, series_id, name_en, description_en, name_mi, description_mi)
+                    WHERE id IN (NEW.event_id, OLD.event_id);
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER events_session_search_vector_trigger
+                AFTER INSERT OR UPDATE OF name_en, name_mi, event_id OR DELETE
+                ON events_session
+                FOR EACH ROW EXECUTE FUNCTION events_event_search_vector_refresh();
+
+                CREATE TRIGGER events_organisers_search_vector_trigger
+                AFTER INSERT OR DELETE
+                ON events_event_organisers
+                FOR EACH ROW EXECUTE FUNCTION events_event_search_vector_refresh();
+
+                -- Renaming a series or an organiser re-indexes its events.
+                CREATE OR REPLACE FUNCTION events_series_search_vector_refresh()
+                RETURNS trigger AS $$
+                BEGIN
+                    UPDATE events_event SET
+                        search_vector_en = events_event_compute_search_vector_en(
+                            id, series_id, name_en, description_en),
+                        search_vector_mi = events_event_compute_search_vector_mi(
+                            id, series_id, name_en, description_en, name_mi, description_mi)
+                    WHERE series_id = NEW.id;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER events_series_search_vector_trigger
+                AFTER UPDATE OF name_en, name_mi, abbreviation_en, abbreviation_mi
+                ON events_series
+                FOR EACH ROW EXECUTE FUNCTION events_series_search_vector_refresh();
+
+                CREATE OR REPLACE FUNCTION events_entity_search_vector_refresh()
+                RETURNS trigger AS $$
+                BEGIN
+                    UPDATE events_event ev SET
+                        search_vector_en = events_event_compute_search_vector_en(
+                            ev.id, ev.series_id, ev.name_en, ev.description_en),
+                        search_vector_mi = events_event_compute_search_vector_mi(
+                            ev.id, ev.series_id, ev.name_en, ev.description_en,
+                            ev.name_mi, ev.description_mi)
+                    FROM events_event_organisers m
+                    WHERE m.event_id = ev.id
+                      AND m.entity_id = NEW.id;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER events_entity_search_vector_trigger
+                AFTER UPDATE OF name
+                ON entities_entity
+                FOR EACH ROW EXECUTE FUNCTION events_entity_search_vector_refresh();
+
+                -- Index every existing event.
+                UPDATE events_event SET name_en = name_en;
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS events_entity_search_vector_trigger ON entities_entity;
+                DROP TRIGGER IF EXISTS events_series_search_vector_trigger ON events_series;
+                DROP TRIGGER IF EXISTS events_organisers_search_vector_trigger ON events_event_organisers;
+                DROP TRIGGER IF EXISTS events_session_search_vector_trigger ON events_session;
+                DROP TRIGGER IF EXISTS events_event_search_vector_trigger ON events_event;
+                DROP FUNCTION IF EXISTS events_entity_search_vector_refresh();
+                DROP FUNCTION IF EXISTS events_series_search_vector_refresh();
+                DROP FUNCTION IF EXISTS events_event_search_vector_refresh();
+                DROP FUNCTION IF EXISTS events_event_search_vector_update();
+                DROP FUNCTION IF EXISTS events_event_compute_search_vector_mi(bigint, bigint, text, text, text, text);
+                DROP FUNCTION IF EXISTS events_event_compute_search_vector_en(bigint, bigint, text, text);
+            """,
+        ),
+    ]
@@ -1,4 +1,6 @@
 from autoslug import AutoSlugField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.urls import reverse
@@ -163,9 +165,33 @@ class Event(models.Model):
     )
     created_datetime = models.DateTimeField(auto_now_add=True)
     updated_datetime = models.DateTimeField(auto_now=True)
+    # One search vector per language, maintained by Postgres triggers (see
+    # migration 0006) like the resources' vectors. Weights: name=A,
+    # description & session names=B, series name/abbreviation & organiser
+    # names=C. search_vector_en indexes the _en columns with the 'english'
+    # config; search_vector_mi indexes the _mi columns with the 'simple'
+    # config, falling back per field to the _en value when the _mi value is
+    # blank. Organiser names are language-neutral and indexed in both.
+    search_vector_en = SearchVectorField(null=True, editable=False)
+    search_vector_mi = SearchVectorField(null=True, editable=False)
 
     class Meta:
         ordering = ["start", "end"]
+        indexes = [
+            GinIndex(fields=["search_vector_en"]),
+            GinIndex(fields=["search_vector_mi"]),
+            # Keyset pagination of the upcoming and past event listings.
+            models.Index(
+                fields=["start", "id"],
+                condition=models.Q(published=True),
+                name="events_published_start_idx",
+            ),
+            models.Index(
+                fields=["end", "id"],
+                condition=models.Q(published=True),
+                name="events_published_end_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -0,0 +1,82 @@
+"""Full-text search of events, ranked and paged by ``(rank, id)`` cursor.
+
+Each event has a search vector per language (see the Event model), kept
+current by Postgres triggers and indexed with GIN, so a search is a single
+indexed query however many events have been archived. Results are ordered
+by rank, best first, and paged on from a cursor naming the last result shown
+rather than by offset, so a later page costs the same as the first.
+"""
+
+from django.contrib.postgres.search import SearchQuery
+from django.contrib.postgres.search import SearchRank
+from django.db.models import F
+from django.db.models import FloatField
+from django.db.models import Q
+from django.db.models.functions import Cast
+from django.utils.translation import get_language
+
+from ams.events.models import Event
+from ams.utils.pagination import KeysetPage
+
+# Maps the active language to its search vector column and the Postgres
+# text-search config used to build it, as for resources.
+_SEARCH_BY_LANGUAGE = {
+    "en": ("search_vector_en", "english"),
+    "mi": ("search_vector_mi", "simple"),
+}
+
+
+def search_events(q):
+    """Return the published events matching ``q``, annotated with ``rank``.
+
+    The rank is cast to double precision: Postgres returns a ``real`` as text
+    rounded for its own precision, and a cursor must hold a rank exactly.
+    """
+    column, config = _SEARCH_BY_LANGUAGE.get(
+        get_language(),
+        _SEARCH_BY_LANGUAGE["en"],
+    )
+    query = SearchQuery(q, config=config, search_type="websearch")
+    return Event.objects.filter(published=True, **{column: query}).annotate(
+        rank=Cast(SearchRank(F(column), query), FloatField()),
+    )
+
+
+def make_rank_cursor(event):
+    """Return the cursor for the results ranked below ``event``."""
+    return f"{event.rank!r}_{event.pk}"
+
+
+def parse_rank_cursor(value):
+    """Return the ``(rank, id)`` in a cursor, or None if invalid."""
+    try:
+        rank, pk = value.rsplit("_", 1)
+        return float(rank), int(pk)
+    except (AttributeError, ValueError):
+        return None
+
+
+def paginate_by_rank(queryset, *, per_page, after=None):
+    """Return one page of ranked ``queryset``, best first, as a KeysetPage.
+
+    ``after`` takes a cursor from a previous page's ``next_cursor`` and gives
+    the results ranked below its event. An invalid cursor gives the first
+    page. Results only page onwards, so ``previous_cursor`` is always None.
+    """
+    queryset = queryset.order_by("-rank", "-pk")
+    key = parse_rank_cursor(after) if after else None
+    if key is not None:
+        rank, pk = key
+        # The same bounded form as paginate_by_date()'s cursors. The rank is
+        # worked out per match rather than read from an index, so here the
+        # bound only keeps the two helpers' predicates alike.
+        queryset = queryset.filter(
+            Q(rank__lte=rank) & (Q(rank__lt=rank) | Q(rank=rank, pk__lt=pk)),
+        )
+    object_list = list(queryset[: per_page + 1])
+    has_next = len(object_list) > per_page
+    object_list = object_list[:per_page]
+    return KeysetPage(
+        object_list,
+        next_cursor=make_rank_cursor(object_list[-1]) if has_next else None,
+    )
@@ -0,0 +1,62 @@
+"""Signals keeping the events' cached filter choices, map and version current."""
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from ams.entities.models import Entity
+from ams.events.filters import clear_filter_choices
+from ams.events.map import bump_map_version
+from ams.events.models import Event
+from ams.events.models import Location
+from ams.events.models import Region
+from ams.events.models import Series
+from ams.events.models import Session
+from ams.events.versions import bump_events_version
+
+
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+@receiver(post_save, sender=Entity)
+@receiver(post_delete, sender=Entity)
+def clear_filter_choices_on_change(sender, instance, **kwargs):
+    """Rebuild the region and organiser dropdowns after commit."""
+    transaction.on_commit(clear_filter_choices)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+@receiver(m2m_changed, sender=Event.locations.through)
+def bump_map_version_on_change(sender, instance, **kwargs):
+    """Rebuild the events map after commit.
+
+    Sessions are included because saving one sets its event's dates with a
+    queryset update, which sends no signal.
+    """
+    transaction.on_commit(bump_map_version)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+@receiver(post_save, sender=Series)
+@receiver(post_delete, sender=Series)
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+@receiver(post_save, sender=Entity)
+@receiver(post_delete, sender=Entity)
+@receiver(m2m_changed, sender=Event.locations.through)
+@receiver(m2m_changed, sender=Event.organisers.through)
+@receiver(m2m_changed, sender=Session.locations.through)
+def bump_events_version_on_change(sender, instance, **kwargs):
+    """Change the iCalendar feeds' and event pages' ETags after commit."""
+    transaction.on_commit(bump_events_version)
@@ -0,0 +1,49 @@
+import pytest
+
+from ams.events.map import cluster_features
+from ams.events.map import in_bbox
+
+
+def point(lng, lat, events=1):
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [lng, lat]},
+        "properties": {"title": "", "url": "", "events": [{}] * events},
+    }
+
+
+class TestClusterFeatures:
+    def test_single_locations_are_kept(self):
+        features = [point(174.78, -41.29), point(172.64, -43.53)]
+        assert cluster_features(features, 5) == features
+
+    def test_nearby_locations_are_clustered(self):
+        features = [point(174.5, -41.0, events=2), point(174.7, -41.2)]
+        [cluster] = cluster_features(features, 5)
+        assert cluster["geometry"]["coordinates"] == pytest.approx([174.6, -41.1])
+        assert cluster["bbox"] == [174.5, -41.2, 174.7, -41.0]
+        assert cluster["properties"] == {
+            "cluster": True,
+            "count": 2,
+            "event_count": 3,
+        }
+
+    def test_cells_shrink_as_the_map_zooms_in(self):
+        features = [point(174.5, -41.0), point(174.7, -41.2)]
+        assert len(cluster_features(features, 9)) == len(features)
+
+
+class TestInBbox:
+    def test_inside_and_outside(self):
+        bbox = (170, -45, 180, -35)
+        assert in_bbox(point(174.78, -41.29), bbox)
+        assert not in_bbox(point(174.78, -30), bbox)
+        assert not in_bbox(point(160, -41.29), bbox)
+
+    def test_across_the_antimeridian(self):
+        # The Chatham Islands, with the map panned east past 180 degrees.
+        assert in_bbox(point(-176.5, -44), (170, -46, 185, -40))
+        assert not in_bbox(point(-170, -44), (170, -46, 185, -40))
+
+    def test_whole_world(self):
+        assert in_bbox(point(-120, 10), (-540, -90, 540, 90))
@@ -1,14 +1,30 @@
 import datetime
+from decimal import Decimal
 from http import HTTPStatus
+from unittest.mock import patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from django.utils import translation
 from django.utils.formats import date_format
+from django.utils.http import http_date
 
+from ams.entities.models import Entity
+from ams.entities.tests.factories import EntityFactory
+from ams.events.map import map_features
+from ams.events.models import Event
+from ams.events.search import search_events
 from ams.events.tests.factories import EventFactory
 from ams.events.tests.factories import LocationFactory
-from ams.events.views import HomeView
+from ams.events.tests.factories import RegionFactory
+from ams.events.tests.factories import SeriesFactory
+from ams.events.tests.factories import SessionFactory
+from ams.events.versions import bump_events_version
+from ams.events.views import EVENTS_PER_PAGE
+from ams.users.tests.factories import UserFactory
+from ams.utils.pagination import make_cursor
 
 pytestmark = pytest.mark.django_db
 
@@ -18,26 +34,167 @@ class TestHomeView:
         response = client.get("/en/events/")
         assert response.status_code == HTTPStatus.OK
 
-    def test_map_locations_in_context(self, client):
-        location = LocationFactory()
-        EventFactory(locations=[location])
+    def test_map_loads_its_markers(self, client):
+        EventFactory(locations=[LocationFactory()])
         response = client.get("/en/events/")
-        assert "map_locations" in response.context
+        content = response.content.decode()
+        assert 'data-geojson-url="/en/events/map.geojson"' in content
+        assert "event-markers-data" not in content
 
-    def test_map_location_date_format(self, client):
-        location = LocationFactory()
+
+class TestEventMapView:
+    def get_features(self, client, **params):
+        response = client.get("/en/events/map.geojson", params)
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "application/geo+json"
+        data = response.json()
+        assert data["type"] == "FeatureCollection"
+        return data["features"]
+
+    def test_location_features(self, client):
+        location = LocationFactory(
+            name="Middleton Grange School",
+            latitude=Decimal("-43.5"),
+            longitude=Decimal("172.6"),
+        )
         start = timezone.now() + datetime.timedelta(days=10)
-        EventFactory(
+        later = EventFactory(
+            name="Second",
+            locations=[location],
+            start=start + datetime.timedelta(days=1),
+            end=start + datetime.timedelta(days=2),
+        )
+        first = EventFactory(
+            name="First",
             locations=[location],
             start=start,
             end=start + datetime.timedelta(days=1),
         )
-        response = client.get("/en/events/")
-        event_date = response.context["map_locations"][0]["events"][0]["date"]
-        assert event_date == date_format(start, "j M Y")
+
+        [feature] = self.get_features(client)
+
+        assert feature["geometry"] == {
+            "type": "Point",
+            "coordinates": [172.6, -43.5],
+        }
+        assert feature["properties"]["title"] == "Middleton Grange School"
+        assert feature["properties"]["url"] == location.get_absolute_url()
+        assert feature["properties"]["events"] == [
+            {
+                "url": first.get_absolute_url(),
+                "date": date_format(timezone.localtime(start), "j M Y"),
+                "name": "First",
+            },
+            {
+                "url": later.get_absolute_url(),
+                "date": date_format(
+                    timezone.localtime(later.start),
+                    "j M Y",
+                ),
+                "name": "Second",
+            },
+        ]
+
+    def test_only_located_upcoming_published_events(self, client):
+        EventFactory(
+            locations=[LocationFactory()],
+            start=timezone.now() - datetime.timedelta(days=2),
+            end=timezone.now() - datetime.timedelta(days=1),
+        )
+        EventFactory(locations=[LocationFactory()], published=False)
+        EventFactory(locations=[LocationFactory(latitude=None, longitude=None)])
+        LocationFactory()
+        assert self.get_features(client) == []
+
+    def test_bbox(self, client):
+        EventFactory(
+            locations=[
+                LocationFactory(
+                    name="Wellington",
+                    latitude=Decimal("-41.29"),
+                    longitude=Decimal("174.78"),
+                ),
+                LocationFactory(
+                    name="Auckland",
+                    latitude=Decimal("-36.85"),
+                    longitude=Decimal("174.76"),
+                ),
+            ],
+        )
+        features = self.get_features(client, bbox="174,-42,175,-40")
+        assert [feature["properties"]["title"] for feature in features] == [
+            "Wellington",
+        ]
+
+    def test_clusters_at_low_zoom(self, client):
+        locations = [
+            LocationFactory(latitude=Decimal("-41.29"), longitude=Decimal("174.78")),
+            LocationFactory(latitude=Decimal("-41.22"), longitude=Decimal("174.90")),
+        ]
+        EventFactory(locations=locations)
+        EventFactory(locations=locations[:1])
+
+        [cluster] = self.get_features(client, zoom=5)
+        assert cluster["properties"] == {
+            "cluster": True,
+            "count": 2,
+            "event_count": 3,
+        }
+        assert cluster["bbox"] == [174.78, -41.29, 174.9, -41.22]
+
+        assert len(self.get_features(client, zoom=15)) == len(locations)
+
+    @pytest.mark.parametrize(
+        "params",
+        [{"bbox": "1,2,3"}, {"bbox": "a,b,c,d"}, {"bbox": "nan,0,1,1"}, {"zoom": "-1"}],
+    )
+    def test_invalid_parameters(self, client, params):
+        response = client.get("/en/events/map.geojson", params)
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_features_are_cached(self, client):
+        EventFactory(locations=[LocationFactory()])
+        self.get_features(client, zoom=5)
+
+        with CaptureQueriesContext(connection) as queries:
+            features = self.get_features(client, zoom=5, bbox="170,-45,180,-35")
+
+        assert not [
+            query
+            for query in queries.captured_queries
+            if '"events_location"' in query["sql"]
+        ]
+        assert len(features) == 1
+
+    def test_changes_are_shown(self, client, django_capture_on_commit_callbacks):
+        event = EventFactory(locations=[LocationFactory(name="Old hall")])
+        self.get_features(client)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            event.locations.add(LocationFactory(name="New hall"))
+        features = self.get_features(client)
+        assert {feature["properties"]["title"] for feature in features} == {
+            "Old hall",
+            "New hall",
+        }
+
+        with django_capture_on_commit_callbacks(execute=True):
+            event.published = False
+            event.save()
+        assert self.get_features(client) == []
+
+    def test_ended_event_leaves_the_map(self, client):
+        event = EventFactory(locations=[LocationFactory()])
+        self.get_features(client)
+
+        with patch(
+            "ams.events.map.timezone.now",
+            return_value=event.end + datetime.timedelta(seconds=1),
+        ):
+            assert self.get_features(client) == []
 
     @pytest.mark.skip(reason="Te Reo Māori translation required")
-    def test_map_location_date_uses_active_language(self, rf):
+    def test_event_date_uses_active_language(self):
         location = LocationFactory()
         start = datetime.datetime(2026, 7, 15, 0, 0, 0, tzinfo=datetime.UTC)
         EventFactory(
@@ -45,15 +202,156 @@ class TestHomeView:
             start=start,
             end=start + datetime.timedelta(days=1),
         )
-        request = rf.get("/en/events/")
-        view = HomeView()
-        view.setup(request)
         with translation.override("mi"):
-            context = view.get_context_data()
-        event_date = context["map_locations"][0]["events"][0]["date"]
+            [feature] = map_features()
+        event_date = feature["properties"]["events"][0]["date"]
         assert event_date == "15 Jul 2026"
 
 
+class TestEventCalendarView:
+    def test_upcoming_feed(self, client):
+        location = LocationFactory(name="Middleton Grange School", city="Christchurch")
+        event = EventFactory(
+            name="Robotics, day one",
+            description="<p>Build a robot &amp; race it.</p>",
+            locations=[location],
+        )
+        EventFactory(
+            name="Finished",
+            start=timezone.now() - datetime.timedelta(days=2),
+            end=timezone.now() - datetime.timedelta(days=1),
+        )
+        EventFactory(name="Draft", published=False)
+
+        response = client.get("/en/events/upcoming.ics")
+
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "text/calendar; charset=utf-8"
+        assert response["ETag"]
+        assert response["Last-Modified"]
+        body = response.content.decode()
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert body.endswith("END:VCALENDAR\r\n")
+        assert body.count("BEGIN:VEVENT") == 1
+        assert "SUMMARY:Robotics\\, day one\r\n" in body
+        assert "DESCRIPTION:Build a robot & race it.\r\n" in body
+        assert f"UID:event-{event.pk}@testserver\r\n" in body
+        assert f"URL:http://testserver{event.get_absolute_url()}\r\n" in body
+        assert "LOCATION:Middleton Grange School\\, " in body
+
+    def test_long_lines_are_folded(self, client):
+        EventFactory(description="word " * 100)
+        body = client.get("/en/events/upcoming.ics").content
+        assert all(len(line) <= 75 for line in body.split(b"\r\n"))  # noqa: PLR2004
+        assert b"\r\n word" in body
+
+    def test_sessions_of_scheduled_events(self, client):
+        event = EventFactory(show_schedule=True)
+        session = SessionFactory(event=event, name="Keynote")
+        SessionFactory(event=EventFactory(show_schedule=False))
+
+        body = client.get("/en/events/upcoming.ics").content.decode()
+
+        assert body.count("BEGIN:VEVENT") == 3  # noqa: PLR2004
+        assert f"UID:session-{session.pk}@testserver\r\n" in body
+        assert f"RELATED-TO:event-{event.pk}@testserver\r\n" in body
+
+    def test_series_region_and_organiser_feeds(self, client):
+        series = SeriesFactory(name="Code Club")
+        region = RegionFactory(name="Otago")
+        organiser = EntityFactory(name="Tech Club")
+        EventFactory(name="In series", series=series)
+        EventFactory(name="In region", locations=[LocationFactory(region=region)])
+        EventFactory(name="By organiser", organisers=[organiser])
+
+        feeds = {
+            f"/en/events/series/{series.pk}.ics": ("Code Club", "In series"),
+            f"/en/events/region/{region.pk}.ics": ("Events in Otago", "In region"),
+            f"/en/events/organiser/{organiser.pk}.ics": (
+                "Events by Tech Club",
+                "By organiser",
+            ),
+        }
+        for url, (name, event_name) in feeds.items():
+            body = client.get(url).content.decode()
+            assert f"X-WR-CALNAME:{name}\r\n" in body
+            assert body.count("BEGIN:VEVENT") == 1
+            assert f"{event_name}\r\n" in body
+
+    def test_unknown_feed_404(self, client):
+        response = client.get("/en/events/series/999999.ics")
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_deleted_feed_404_with_matching_etag(self, client):
+        series = SeriesFactory()
+        url = f"/en/events/series/{series.pk}.ics"
+        etag = client.get(url)["ETag"]
+        series.delete()
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_unchanged_feed_is_not_modified(self, client):
+        EventFactory()
+        response = client.get("/en/events/upcoming.ics")
+
+        with CaptureQueriesContext(connection) as queries:
+            not_modified = client.get(
+                "/en/events/upcoming.ics",
+                headers={"If-None-Match": response["ETag"]},
+            )
+
+        assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+        assert not_modified["ETag"] == response["ETag"]
+        event_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if '"events_event"' in query["sql"]
+        ]
+        assert len(event_queries) == 1
+        assert "MAX(" in event_queries[0]
+
+        not_modified = client.get(
+            "/en/events/upcoming.ics",
+            headers={"If-Modified-Since": response["Last-Modified"]},
+        )
+        assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_feed_is_rendered_once(self, client):
+        EventFactory(locations=[LocationFactory()])
+        body = client.get("/en/events/upcoming.ics").content
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/en/events/upcoming.ics")
+
+        assert response.content == body
+        assert not [
+            query
+            for query in queries.captured_queries
+            if '"events_location"' in query["sql"]
+        ]
+
+    def test_changes_change_the_etag(
+        self,
+        client,
+        django_capture_on_commit_callbacks,
+    ):
+        event = EventFactory(locations=[LocationFactory(name="Old hall")])
+        etag = client.get("/en/events/upcoming.ics")["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            location = event.locations.get()
+            location.name = "New hall"
+            location.save()
+
+        response = client.get(
+            "/en/events/upcoming.ics",
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response["ETag"] != etag
+        assert "LOCATION:New hall" in response.content.decode()
+
+
 class TestEventUpcomingView:
     def test_get(self, client):
         response = client.get("/en/events/upcoming/")
@@ -75,12 +373,280 @@ class TestEventUpcomingView:
         assert future_event in qs
         assert past_event not in qs
 
+    def test_pages_by_start_date(self, client):
+        now = timezone.now()
+        events = [
+            EventFactory(
+                start=now + datetime.timedelta(days=days),
+                end=now + datetime.timedelta(days=days + 1),
+            )
+            for days in range(1, EVENTS_PER_PAGE + 2)
+        ]
+
+        response = client.get("/en/events/upcoming/")
+        page = response.context["events"]
+        assert list(page) == events[:EVENTS_PER_PAGE]
+        assert response.context["event_count"] == len(events)
+        assert not page.has_previous
+
+        response = client.get("/en/events/upcoming/", {"after": page.next_cursor})
+        page = response.context["events"]
+        assert list(page) == events[EVENTS_PER_PAGE:]
+        assert not page.has_next
+
+        response = client.get(
+            "/en/events/upcoming/",
+            {"before": page.previous_cursor},
+        )
+        assert list(response.context["events"]) == events[:EVENTS_PER_PAGE]
+
+    def test_filtered_pages_keep_the_filter(self, client):
+        region = RegionFactory()
+        location = LocationFactory(region=region)
+        for days in range(1, EVENTS_PER_PAGE + 2):
+            start = timezone.now() + datetime.timedelta(days=days)
+            EventFactory(
+                start=start,
+                end=start + datetime.timedelta(hours=2),
+                locations=[location],
+            )
+        EventFactory()
+
+        response = client.get(
+            "/en/events/upcoming/",
+            {"locations__region": region.pk},
+        )
+        next_url = f"locations__region={region.pk}"
+        assert next_url in response.content.decode()
+        assert response.context["event_count"] == EVENTS_PER_PAGE + 1
+
+    def test_event_count_is_cached(self, client):
+        start = timezone.now() + datetime.timedelta(days=1)
+        EventFactory(start=start, end=start + datetime.timedelta(hours=2))
+        client.get("/en/events/upcoming/")
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/en/events/upcoming/")
+        assert response.context["event_count"] == 1
+        assert not [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT COUNT(")
+        ]
+
+    def test_event_count_ignores_parameters_the_filter_ignores(self, client):
+        start = timezone.now() + datetime.timedelta(days=1)
+        EventFactory(start=start, end=start + datetime.timedelta(hours=2))
+        client.get("/en/events/upcoming/")
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(
+                "/en/events/upcoming/",
+                {"utm_source": "newsletter", "fbclid": "abc"},
+            )
+        assert response.context["event_count"] == 1
+        assert not [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT COUNT(")
+        ]
+
+    def test_event_count_follows_the_events_version(self, client):
+        start = timezone.now() + datetime.timedelta(days=1)
+        EventFactory(start=start, end=start + datetime.timedelta(hours=2))
+        client.get("/en/events/upcoming/")
+        EventFactory(start=start, end=start + datetime.timedelta(hours=2))
+        bump_events_version()
+        response = client.get("/en/events/upcoming/")
+        assert response.context["event_count"] == 2  # noqa: PLR2004
+
 
 class TestEventPastView:
     def test_get(self, client):
         response = client.get("/en/events/past/")
         assert response.status_code == HTTPStatus.OK
 
+    def test_pages_by_end_date_newest_first(self, client):
+        now = timezone.now()
+        events = [
+            EventFactory(
+                start=now - datetime.timedelta(days=days + 1),
+                end=now - datetime.timedelta(days=days),
+            )
+            for days in range(1, EVENTS_PER_PAGE + 2)
+        ]
+
+        response = client.get("/en/events/past/")
+        page = response.context["events"]
+        assert list(page) == events[:EVENTS_PER_PAGE]
+
+        response = client.get("/en/events/past/", {"before": page.next_cursor})
+        assert list(response.context["events"]) == events[EVENTS_PER_PAGE:]
+
+    def test_events_ending_together_are_not_skipped(self, client):
+        end = timezone.now() - datetime.timedelta(days=1)
+        events = [
+            EventFactory(start=end - datetime.timedelta(hours=1), end=end)
+            for _ in range(EVENTS_PER_PAGE + 1)
+        ]
+
+        first = client.get("/en/events/past/").context["events"]
+        second = client.get(
+            "/en/events/past/",
+            {"before": first.next_cursor},
+        ).context["events"]
+
+        assert {event.pk for event in [*first, *second]} == {
+            event.pk for event in events
+        }
+
+    def test_deep_page_starts_its_index_scan_at_the_cursor(self, client):
+        now = timezone.now()
+        events = Event.objects.bulk_create(
+            Event(
+                name=f"Event {i}",
+                slug=f"event-{i}",
+                published=True,
+                start=now - datetime.timedelta(hours=i + 2),
+                end=now - datetime.timedelta(hours=i + 1),
+            )
+            for i in range(2000)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Event._meta.db_table}")  # noqa: SLF001
+        cursor_event = events[1500]
+
+        with CaptureQueriesContext(connection) as queries:
+            client.get(
+                "/en/events/past/",
+                {"before": make_cursor(cursor_event, "end")},
+            )
+        [sql] = [
+            query["sql"]
+            for query in queries
+            if 'ORDER BY "events_event"."end" DESC' in query["sql"]
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN {sql}")
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+
+        assert "events_published_end_idx" in plan, plan
+        index_cond = next(line for line in plan.splitlines() if "Index Cond" in line)
+        assert '"end" <=' in index_cond, plan
+
+
+class TestEventSearchView:
+    def search(self, client, q, **params):
+        response = client.get("/en/events/search/", {"q": q, **params})
+        assert response.status_code == HTTPStatus.OK
+        return response.context["events"]
+
+    def test_get_without_terms(self, client):
+        response = client.get("/en/events/search/")
+        assert response.status_code == HTTPStatus.OK
+        assert "events" not in response.context
+
+    def test_matches_published_past_and_upcoming_events(self, client):
+        now = timezone.now()
+        upcoming = EventFactory(name="Robotics workshop")
+        past = EventFactory(
+            name="Robotics symposium",
+            start=now - datetime.timedelta(days=3),
+            end=now - datetime.timedelta(days=2),
+        )
+        EventFactory(name="Robotics draft", published=False)
+        EventFactory(name="Unrelated meetup")
+
+        assert set(self.search(client, "robotics")) == {upcoming, past}
+
+    def test_matches_sessions_series_and_organisers(self, client):
+        session_event = EventFactory()
+        SessionFactory(event=session_event, name="Kaitiakitanga keynote")
+        series_event = EventFactory(series=SeriesFactory(name="Hackathon tour"))
+        organiser_event = EventFactory(
+            organisers=[EntityFactory(name="Fernbrook Trust")],
+        )
+
+        assert list(self.search(client, "kaitiakitanga")) == [session_event]
+        assert list(self.search(client, "hackathon")) == [series_event]
+        assert list(self.search(client, "fernbrook")) == [organiser_event]
+
+    def test_renaming_an_organiser_reindexes_its_events(self, client):
+        organiser = EntityFactory(name="Fernbrook Trust")
+        event = EventFactory(organisers=[organiser])
+        organiser.name = "Kowhai Trust"
+        organiser.save()
+
+        assert list(self.search(client, "kowhai")) == [event]
+        assert list(self.search(client, "fernbrook")) == []
+
+    def test_ranks_name_matches_first(self, client):
+        in_description = EventFactory(
+            name="Teacher meetup",
+            description="<p>Bring your robotics kits.</p>",
+        )
+        in_name = EventFactory(name="Robotics workshop")
+
+        assert list(self.search(client, "robotics")) == [in_name, in_description]
+
+    def test_searches_maori_text_in_maori(self, client):
+        event = EventFactory(name="Coding workshop", name_mi="Wananga waehere")
+        untranslated = EventFactory(name="Robotics workshop")
+
+        with translation.override("mi"):
+            assert list(search_events("waehere")) == [event]
+            assert list(search_events("robotics")) == [untranslated]
+        assert list(self.search(client, "waehere")) == []
+
+    def test_pages_by_rank_cursor(self, client):
+        events = [
+            EventFactory(name="Robotics workshop") for _ in range(EVENTS_PER_PAGE + 1)
+        ]
+
+        first = self.search(client, "robotics")
+        assert len(first) == EVENTS_PER_PAGE
+        assert first.has_next
+        second = self.search(client, "robotics", after=first.next_cursor)
+        assert not second.has_next
+
+        assert [event.pk for event in [*first, *second]] == sorted(
+            (event.pk for event in events),
+            reverse=True,
+        )
+
+    def test_invalid_cursor_gives_first_page(self, client):
+        event = EventFactory(name="Robotics workshop")
+        assert list(self.search(client, "robotics", after="bogus")) == [event]
+
+
+class TestEventFilterChoices:
+    def test_dropdowns_are_cached(self, client):
+        region = RegionFactory(name="Waikato")
+        client.get("/en/events/upcoming/")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/en/events/past/")
+
+        tables = ('"events_region"', '"entities_entity"')
+        assert not [
+            query
+            for query in queries.captured_queries
+            if any(f"FROM {table}" in query["sql"] for table in tables)
+        ]
+        assert region.name in response.content.decode()
+
+    def test_new_region_is_shown(
+        self,
+        client,
+        django_capture_on_commit_callbacks,
+    ):
+        client.get("/en/events/upcoming/")
+        with django_capture_on_commit_callbacks(execute=True):
+            RegionFactory(name="Taranaki")
+            Entity.objects.create(name="Tech Club")
+
+        content = client.get("/en/events/upcoming/").content.decode()
+        assert "Taranaki" in content
+        assert "Tech Club" in content
+
 
 class TestEventDetailView:
     def test_get_with_slug(self, client):
@@ -99,9 +665,95 @@ class TestEventDetailView:
         response = client.get(event.get_absolute_url(), follow=True)
         assert response.status_code == HTTPStatus.NOT_FOUND
 
+    def test_validators(self, client):
+        event = EventFactory()
+        response = client.get(event.get_absolute_url())
+        assert response["ETag"]
+        assert response["Last-Modified"] == http_date(
+            event.updated_datetime.timestamp(),
+        )
+        assert response["Cache-Control"] == "no-cache"
+
+    def test_unchanged_event_is_not_modified(self, client):
+        event = EventFactory(locations=[LocationFactory()])
+        SessionFactory(event=event)
+        response = client.get(event.get_absolute_url())
+
+        with CaptureQueriesContext(connection) as queries:
+            not_modified = client.get(
+                event.get_absolute_url(),
+                headers={"If-None-Match": response["ETag"]},
+            )
+
+        assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+        assert not_modified["ETag"] == response["ETag"]
+        tables = ('"events_session"', '"events_location"')
+        assert not [
+            query
+            for query in queries.captured_queries
+            if any(table in query["sql"] for table in tables)
+        ]
+
+        # The page varies by user, so a bare If-Modified-Since isn't enough.
+        response = client.get(
+            event.get_absolute_url(),
+            headers={"If-Modified-Since": response["Last-Modified"]},
+        )
+        assert response.status_code == HTTPStatus.OK
+
+    def test_session_change_is_modified(
+        self,
+        client,
+        django_capture_on_commit_callbacks,
+    ):
+        event = EventFactory(show_schedule=True)
+        etag = client.get(event.get_absolute_url())["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            SessionFactory(event=event, name="Keynote")
+
+        response = client.get(
+            event.get_absolute_url(),
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response["ETag"] != etag
+
+    def test_logging_in_is_modified(self, client):
+        event = EventFactory()
+        etag = client.get(event.get_absolute_url())["ETag"]
+
+        client.force_login(UserFactory())
+        response = client.get(
+            event.get_absolute_url(),
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response["Cache-Control"] == "no-cache, private"
+
 
 class TestLocationDetailView:
     def test_get(self, client):
         location = LocationFactory()
         response = client.get(f"/en/events/location/{location.pk}/")
         assert response.status_code == HTTPStatus.OK
+
+    def test_event_ending_is_modified(self, client):
+        location = LocationFactory()
+        event = EventFactory(locations=[location])
+        response = client.get(location.get_absolute_url())
+        not_modified = client.get(
+            location.get_absolute_url(),
+            headers={"If-None-Match": response["ETag"]},
+        )
+        assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+
+        with patch(
+            "ams.events.views.now",
+            return_value=event.end + datetime.timedelta(seconds=1),
+        ):
+            response = client.get(
+                location.get_absolute_url(),
+                headers={"If-None-Match": response["ETag"]},
+            )
+        assert response.status_code == HTTPStatus.OK
@@ -8,6 +8,28 @@ urlpatterns = [
     path("", views.HomeView.as_view(), name="home"),
     path("upcoming/", views.EventUpcomingView.as_view(), name="upcoming"),
     path("past/", views.EventPastView.as_view(), name="past"),
+    path("search/", views.EventSearchView.as_view(), name="search"),
+    path("map.geojson", views.EventMapView.as_view(), name="map"),
+    path(
+        "upcoming.ics",
+        views.EventCalendarView.as_view(feed="upcoming"),
+        name="upcoming_ics",
+    ),
+    path(
+        "series/<int:pk>.ics",
+        views.EventCalendarView.as_view(feed="series"),
+        name="series_ics",
+    ),
+    path(
+        "region/<int:pk>.ics",
+        views.EventCalendarView.as_view(feed="region"),
+        name="region_ics",
+    ),
+    path(
+        "organiser/<int:pk>.ics",
+        views.EventCalendarView.as_view(feed="organiser"),
+        name="organiser_ics",
+    ),
     path("event/<int:pk>/", views.EventDetailView.as_view()),
     path("event/<int:pk>/<slug:slug>/", views.EventDetailView.as_view(), name="event"),
     path("location/<int:pk>/", views.LocationDetailView.as_view(), name="location"),
@@ -0,0 +1,84 @@
+"""A cache version covering everything shown about events.
+
+Signals in ams/events/signals.py bump the version after commit when an
+event changes, or a session, location, series, region or entity shown with
+one. Saving those doesn't update an event's ``updated_datetime``, so the
+iCalendar feeds (ams/events/ical.py) and the event detail pages' ETags
+include this version as well.
+
+The event listings' counts are cached under the version too
+(cached_event_count).
+"""
+
+import math
+import time
+
+from django.core.cache import caches
+from django.utils import timezone
+
+from ams.cms.page_cache import PAGE_CACHE_ALIAS
+from ams.events.models import Event
+
+EVENTS_VERSION_CACHE_ALIAS = PAGE_CACHE_ALIAS
+
+# The longest a cached event count is kept, as each filter combination
+# caches its own.
+EVENT_COUNT_TIMEOUT = 60 * 60
+
+_VERSION_KEY = "events_version"
+
+
+def get_events_version():
+    """Return the current events version, starting one if needed."""
+    cache = caches[EVENTS_VERSION_CACHE_ALIAS]
+    version = cache.get(_VERSION_KEY)
+    if version is None:
+        cache.add(_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(_VERSION_KEY)
+    return version
+
+
+def bump_events_version():
+    """Make everything cached under the events version stale."""
+    caches[EVENTS_VERSION_CACHE_ALIAS].set(_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def cached_event_count(key, events):
+    """Return ``events.count()``, cached under the events version.
+
+    The count also goes stale when the next published event ends, which
+    moves it from the upcoming to the past listings. Costs one cache lookup
+    while the count is current, and two queries to rebuild it otherwise.
+    """
+    cache = caches[EVENTS_VERSION_CACHE_ALIAS]
+    key = f"event_count_{key}"
+    cached = cache.get_many([_VERSION_KEY, key])
+    version = cached.get(_VERSION_KEY)
+    entry = cached.get(key)
+    now = timezone.now()
+    if (
+        version is not None
+        and entry is not None
+        and entry["version"] == version
+        and (entry["stale_at"] is None or now < entry["stale_at"])
+    ):
+        return entry["value"]
+
+    if version is None:
+        version = get_events_version()
+    value = events.count()
+    stale_at = (
+        Event.objects.filter(published=True, end__gte=now)
+        .order_by("end")
+        .values_list("end", flat=True)
+        .first()
+    )
+    timeout = EVENT_COUNT_TIMEOUT
+    if stale_at is not None:
+        timeout = min(timeout, max(1, math.ceil((stale_at - now).total_seconds())))
+    cache.set(
+        key,
+        {"version": version, "value": value, "stale_at": stale_at},
+        timeout=timeout,
+    )
+    return value
@@ -1,15 +1,45 @@
-from django.utils.formats import date_format
+import hashlib
+import math
+
+from django.http import Http404
+from django.http import HttpResponse
+from django.http import HttpResponseBadRequest
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.utils.http import quote_etag
+from django.utils.http import urlencode
 from django.utils.timezone import now
+from django.utils.translation import gettext as _
 from django.views import generic
 from django_filters.views import FilterView
 
+from ams.entities.models import Entity
 from ams.events.filters import PastEventFilter
 from ams.events.filters import UpcomingEventFilter
+from ams.events.ical import cached_feed
+from ams.events.ical import feed_events
+from ams.events.ical import feed_state
+from ams.events.ical import render_calendar
+from ams.events.map import in_bbox
+from ams.events.map import map_features
 from ams.events.models import Event
 from ams.events.models import Location
+from ams.events.models import Region
+from ams.events.models import Series
+from ams.events.search import paginate_by_rank
+from ams.events.search import search_events
 from ams.events.utils import create_filter_helper
 from ams.events.utils import organise_schedule_data
+from ams.events.versions import cached_event_count
+from ams.events.versions import get_events_version
+from ams.utils.mixins import BreadcrumbObjectMixin
+from ams.utils.mixins import ConditionalGetMixin
 from ams.utils.mixins import RedirectToCosmeticURLMixin
+from ams.utils.pagination import paginate_by_date
+
+EVENTS_PER_PAGE = 20
 
 
 class HomeView(generic.TemplateView):
@@ -17,70 +47,217 @@ class HomeView(generic.TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        future_events = (
+        context["upcoming_events"] = (
             Event.objects.filter(published=True, end__gte=now())
             .order_by("start")
             .prefetch_related("organisers", "locations", "sponsors")
-            .select_related("series")
+            .select_related("series")[:3]
         )
-        raw_map_locations = {}
-        for event in future_events:
-            for location in event.locations.all():
-                if location.latitude is None or location.longitude is None:
-                    continue
-                key = location.pk
-                if key not in raw_map_locations:
-                    raw_map_locations[key] = {
-                        "coords": {
-                            "lat": float(location.latitude),
-                            "lng": float(location.longitude),
-                        },
-                        "title": location.name,
-                        "events": [],
-                    }
-                raw_map_locations[key]["events"].append(
-                    {
-                        "url": event.get_absolute_url(),
-                        "date": date_format(event.start, "j M Y")
-                        if event.start
-                        else "",
-                        "name": event.name,
-                    },
-                )
-        context["map_locations"] = list(raw_map_locations.values())
-        context["upcoming_events"] = future_events[:3]
         return context
 
 
-class EventUpcomingView(FilterView):
-    filterset_class = UpcomingEventFilter
+class EventMapView(generic.View):
+    """GeoJSON of the upcoming event locations in view on the events map.
+
+    Takes the area in view as ``bbox=west,south,east,north`` and the map's
+    ``zoom`` level, both optional. See ams/events/map.py.
+    """
+
+    def get(self, request, *args, **kwargs):
+        try:
+            bbox = self._parse_bbox(request.GET.get("bbox"))
+            zoom = self._parse_zoom(request.GET.get("zoom"))
+        except ValueError:
+            return HttpResponseBadRequest("Invalid bbox or zoom.")
+        features = map_features(zoom)
+        if bbox is not None:
+            features = [feature for feature in features if in_bbox(feature, bbox)]
+        return JsonResponse(
+            {"type": "FeatureCollection", "features": features},
+            content_type="application/geo+json",
+        )
+
+    @staticmethod
+    def _parse_bbox(value):
+        if not value:
+            return None
+        bbox = [float(part) for part in value.split(",")]
+        if len(bbox) != 4 or not all(map(math.isfinite, bbox)):  # noqa: PLR2004
+            raise ValueError(value)
+        return bbox
+
+    @staticmethod
+    def _parse_zoom(value):
+        if not value:
+            return None
+        zoom = int(value)
+        if zoom < 0:
+            raise ValueError(value)
+        return zoom
+
+
+class EventCalendarView(generic.View):
+    """An iCalendar feed of upcoming events, answering polls with 304s.
+
+    ``feed`` picks the events: all upcoming events, or those of the series,
+    region or organiser with the ``pk`` in the URL. See ams/events/ical.py.
+    """
+
+    feed = None
+    feeds = {
+        "upcoming": (None, None),
+        "series": (Series, "series"),
+        "region": (Region, "locations__region"),
+        "organiser": (Entity, "organisers"),
+    }
+
+    def get(self, request, *args, **kwargs):
+        model, lookup = self.feeds[self.feed]
+        pk = kwargs.get("pk")
+        # Checked before answering a conditional request, so a feed that
+        # no longer exists gets a 404 rather than a 304.
+        if model is not None and not model.objects.filter(pk=pk).exists():
+            raise Http404
+        events = feed_events(**({lookup: pk} if lookup else {}))
+        state = feed_state(events)
+        response = get_conditional_response(
+            request,
+            etag=quote_etag(state.etag),
+            last_modified=int(state.last_modified.timestamp()),
+        )
+        if response is None:
+            body = cached_feed(
+                f"{self.feed}{pk or ''}_{request.get_host()}",
+                state,
+                lambda: render_calendar(
+                    self.get_calendar_name(model, pk),
+                    events,
+                    request,
+                ),
+            )
+            response = HttpResponse(body, content_type="text/calendar; charset=utf-8")
+        response.headers["ETag"] = quote_etag(state.etag)
+        response.headers["Last-Modified"] = http_date(state.last_modified.timestamp())
+        return response
+
+    def get_calendar_name(self, model, pk):
+        if model is None:
+            return _("Upcoming events")
+        obj = get_object_or_404(model, pk=pk)
+        if model is Series:
+            return str(obj)
+        if model is Region:
+            return _("Events in %(region)s") % {"region": obj}
+        return _("Events by %(organiser)s") % {"organiser": obj}
+
+
+class EventListView(FilterView):
+    """A filtered list of events, paged by ``(date_field, id)`` cursor.
+
+    ``events`` in the context is a KeysetPage (see ams/utils/pagination.py),
+    addressed by the ``before`` and ``after`` query parameters.
+    """
+
     context_object_name = "events"
-    template_name = "events/upcoming_events.html"
+    date_field = None
+    descending = False
+    reset_url_name = None
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["filter_formatter"] = create_filter_helper("events:upcoming")
+        context["events"] = paginate_by_date(
+            self.object_list,
+            self.date_field,
+            per_page=EVENTS_PER_PAGE,
+            descending=self.descending,
+            before=self.request.GET.get("before"),
+            after=self.request.GET.get("after"),
+        )
+        context["event_count"] = self.get_event_count()
+        context["filter_formatter"] = create_filter_helper(self.reset_url_name)
         return context
 
+    def get_event_count(self):
+        """Return the number of events matching the filter, cached.
+
+        The key is made of the filter form's cleaned values, so cursors,
+        tracking parameters and other query parameters the filter ignores
+        share one entry. An invalid filter lists no events, so it isn't
+        cached.
+        """
+        form = self.filterset.form
+        if form.is_bound and not form.is_valid():
+            return self.object_list.count()
+        filters = sorted(
+            (name, str(getattr(value, "pk", value)))
+            for name, value in getattr(form, "cleaned_data", {}).items()
+            if value not in (None, "")
+        )
+        filters_hash = hashlib.sha256(urlencode(filters).encode()).hexdigest()[:32]
+        return cached_event_count(
+            f"{self.reset_url_name}_{filters_hash}",
+            self.object_list,
+        )
+
+
+class EventUpcomingView(EventListView):
+    filterset_class = UpcomingEventFilter
+    template_name = "events/upcoming_events.html"
+    date_field = "start"
+    reset_url_name = "events:upcoming"
+
 
-class EventPastView(FilterView):
+class EventPastView(EventListView):
     filterset_class = PastEventFilter
-    context_object_name = "events"
     template_name = "events/past_events.html"
+    date_field = "end"
+    descending = True
+    reset_url_name = "events:past"
+
+
+class EventSearchView(generic.TemplateView):
+    """Published events, past and upcoming, matching the ``q`` search terms.
+
+    ``events`` in the context is a KeysetPage of the best matches first,
+    paged on by the ``after`` query parameter (see ams/events/search.py).
+    """
+
+    template_name = "events/search_events.html"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["filter_formatter"] = create_filter_helper("events:past")
+        q = self.request.GET.get("q", "").strip()
+        context["q"] = q
+        if q:
+            context["events"] = paginate_by_rank(
+                search_events(q)
+                .prefetch_related("organisers", "locations", "sponsors")
+                .select_related("series"),
+                per_page=EVENTS_PER_PAGE,
+                after=self.request.GET.get("after"),
+            )
         return context
 
 
-class EventDetailView(RedirectToCosmeticURLMixin, generic.DetailView):
+class EventDetailView(
+    ConditionalGetMixin,
+    BreadcrumbObjectMixin,
+    RedirectToCosmeticURLMixin,
+    generic.DetailView,
+):
     model = Event
     context_object_name = "event"
+    last_modified_field = "updated_datetime"
+    validator_fields = ("end",)
 
     def get_queryset(self):
         return Event.objects.filter(published=True).prefetch_related("locations")
 
+    def get_etag_parts(self, obj):
+        # Sessions, locations and the like don't update the event's
+        # updated_datetime, but do bump the events version.
+        return [get_events_version(), obj.has_ended]
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["sponsors"] = self.object.sponsors.all()
@@ -106,10 +283,21 @@ class EventDetailView(RedirectToCosmeticURLMixin, generic.DetailView):
         return context
 
 
-class LocationDetailView(RedirectToCosmeticURLMixin, generic.DetailView):
+class LocationDetailView(
+    ConditionalGetMixin,
+    BreadcrumbObjectMixin,
+    RedirectToCosmeticURLMixin,
+    generic.DetailView,
+):
     model = Location
     context_object_name = "location"
 
+    def get_etag_parts(self, obj):
+        # Locations have no timestamp; the events version covers changes to
+        # them and their events, and the count an event ending.
+        upcoming = obj.events.filter(published=True, end__gte=now()).count()
+        return [get_events_version(), upcoming]
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["upcoming_events"] = (
@@ -9,6 +9,7 @@ from modeltranslation.admin import TabbedTranslationAdmin
 from ams.memberships.forms import MembershipOptionForm
 from ams.memberships.models import IndividualMembership
 from ams.memberships.models import MembershipOption
+from ams.memberships.models import MembershipStatus
 from ams.memberships.models import OrganisationMembership
 
 
@@ -163,6 +164,26 @@ class MembershipOptionAdmin(TabbedTranslationAdmin):
         return super().delete_view(request, object_id, extra_context)
 
 
+class MembershipStatusListFilter(admin.SimpleListFilter):
+    """Filter memberships by status, worked out in SQL by `with_status()`."""
+
+    # Translators: Django admin filter heading for membership status
+    title = _("status")
+    parameter_name = "status"
+
+    def lookups(self, request, model_admin):
+        return [
+            (status.value, status.label)
+            for status in MembershipStatus
+            if status != MembershipStatus.NONE
+        ]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(membership_status=self.value())
+        return queryset
+
+
 @admin.register(IndividualMembership)
 class IndividualMembershipAdmin(admin.ModelAdmin):
     list_display = (
@@ -174,7 +195,7 @@ class IndividualMembershipAdmin(admin.ModelAdmin):
         "approved_datetime",
     )
     search_fields = ("user__email", "membership_option__name")
-    list_filter = ("membership_option", "start_date")
+    list_filter = ("membership_option", MembershipStatusListFilter, "start_date")
     autocomplete_fields = ["user", "membership_option"]
     readonly_fields = ("user_display", "status")
     exclude = ("user",)
@@ -197,6 +218,14 @@ class IndividualMembershipAdmin(admin.ModelAdmin):
             return f"{obj.user.get_full_name()} ({obj.user.email})"
         return "-"
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_status()
+
+    @admin.display(
+        # Translators: Django admin column — current membership status
+        description=_("Status"),
+        ordering="membership_status",
+    )
     def status(self, obj):
         return obj.get_status_display()
 
@@ -213,7 +242,7 @@ class OrganisationMembershipAdmin(admin.ModelAdmin):
         "expiry_date",
     )
     search_fields = ("organisation__name", "membership_option__name")
-    list_filter = ("start_date",)
+    list_filter = (MembershipStatusListFilter, "start_date")
     autocomplete_fields = ["organisation", "membership_option"]
     readonly_fields = (
         "organisation",
@@ -232,9 +261,13 @@ class OrganisationMembershipAdmin(admin.ModelAdmin):
         "approved_datetime",
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_status()
+
     @admin.display(
         # Translators: Django admin column — current membership status
         description=_("Status"),
+        ordering="membership_status",
     )
     def status(self, obj):
         return obj.get_status_display()
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.16 on 2026-10-19 01:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memberships', '0020_alter_membershipoption_unique_together_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='individualmembership',
+            name='idx_indiv_mem_active',
+        ),
+        migrations.RemoveIndex(
+            model_name='organisationmembership',
+            name='idx_org_mem_active',
+        ),
+        migrations.AddIndex(
+            model_name='individualmembership',
+            index=models.Index(condition=models.Q(('approved_datetime__isnull', False), ('cancelled_datetime__isnull', True)), fields=['user', 'expiry_date'], include=('start_date',), name='idx_indiv_mem_active'),
+        ),
+        migrations.AddIndex(
+            model_name='organisationmembership',
+            index=models.Index(condition=models.Q(('approved_datetime__isnull', False), ('cancelled_datetime__isnull', True)), fields=['organisation', 'expiry_date'], include=('start_date',), name='idx_org_mem_active'),
+        ),
+    ]
@@ -5,6 +5,7 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db.models import CASCADE
 from django.db.models import BooleanField
+from django.db.models import Case
 from django.db.models import CharField
 from django.db.models import DateField
 from django.db.models import DateTimeField
@@ -14,9 +15,12 @@ from django.db.models import Index
 from django.db.models import IntegerField
 from django.db.models import Model
 from django.db.models import PositiveIntegerField
+from django.db.models import Q
 from django.db.models import QuerySet
 from django.db.models import TextChoices
 from django.db.models import TextField
+from django.db.models import Value
+from django.db.models import When
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
@@ -275,7 +279,38 @@ class BaseMembership(Model):
             return str(self.status())
 
 
-class IndividualMembershipQuerySet(QuerySet):
+class BaseMembershipQuerySet(QuerySet):
+    """QuerySet helpers shared by the membership models.
+
+    Adds `with_status()`, which annotates each membership with its
+    canonical status (as :meth:`BaseMembership.status` derives it) so that
+    the status can be filtered and ordered on in SQL.
+    """
+
+    def with_status(self):
+        """Annotate `membership_status`, the value of `status()`, on each row.
+
+        Named so as not to hide the `status()` method on the instances.
+        """
+        today = timezone.localdate()
+        return self.annotate(
+            membership_status=Case(
+                When(
+                    cancelled_datetime__isnull=False,
+                    then=Value(MembershipStatus.CANCELLED),
+                ),
+                When(expiry_date__lte=today, then=Value(MembershipStatus.EXPIRED)),
+                When(
+                    Q(approved_datetime__isnull=True) | Q(start_date__gt=today),
+                    then=Value(MembershipStatus.PENDING),
+                ),
+                default=Value(MembershipStatus.ACTIVE),
+                output_field=CharField(),
+            ),
+        )
+
+
+class IndividualMembershipQuerySet(BaseMembershipQuerySet):
     """QuerySet helpers for `IndividualMembership`.
 
     Adds convenience filters such as `active()` which returns only
@@ -321,14 +356,15 @@ class IndividualMembership(BaseMembership):
         verbose_name = _("Membership: Individual")
         verbose_name_plural = _("Membership: Individual")
         indexes = [
+            # For active(): only approved, uncancelled rows are indexed, and
+            # start_date is stored in the index so it is read from it too.
             Index(
-                fields=[
-                    "user",
-                    "approved_datetime",
-                    "cancelled_datetime",
-                    "start_date",
-                    "expiry_date",
-                ],
+                fields=["user", "expiry_date"],
+                include=["start_date"],
+                condition=Q(
+                    cancelled_datetime__isnull=True,
+                    approved_datetime__isnull=False,
+                ),
                 name="idx_indiv_mem_active",
             ),
         ]
@@ -340,7 +376,7 @@ class IndividualMembership(BaseMembership):
         )
 
 
-class OrganisationMembershipQuerySet(QuerySet):
+class OrganisationMembershipQuerySet(BaseMembershipQuerySet):
     """QuerySet helpers for `OrganisationMembership`.
 
     Mirrors the behaviour of :class:`IndividualMembershipQuerySet` and
@@ -393,14 +429,14 @@ class OrganisationMembership(BaseMembership):
         verbose_name = _("Membership: Organisation")
         verbose_name_plural = _("Membership: Organisation")
         indexes = [
+            # For active(), as for individual memberships.
             Index(
-                fields=[
-                    "organisation",
-                    "approved_datetime",
-                    "cancelled_datetime",
-                    "start_date",
-                    "expiry_date",
-                ],
+                fields=["organisation", "expiry_date"],
+                include=["start_date"],
+                condition=Q(
+                    cancelled_datetime__isnull=True,
+                    approved_datetime__isnull=False,
+                ),
                 name="idx_org_mem_active",
             ),
         ]
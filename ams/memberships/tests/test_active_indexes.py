@@ -0,0 +1,138 @@
+"""Tests that the active-membership checks use their partial indexes."""
+
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ams.memberships.models import IndividualMembership
+from ams.memberships.models import OrganisationMembership
+from ams.memberships.tests.factories import IndividualMembershipFactory
+from ams.memberships.tests.factories import OrganisationMembershipFactory
+from ams.organisations.models import OrganisationMember
+from ams.organisations.tests.factories import OrganisationFactory
+from ams.organisations.tests.factories import OrganisationMemberFactory
+from ams.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+USERS = 400
+ROWS_PER_USER = 5
+
+
+@pytest.fixture
+def seeded_user():
+    """Seed enough memberships that scanning a whole table is the slow plan.
+
+    Most rows are cancelled, unapproved or expired, as on a long-running
+    site. Returns a user with an active individual and organisation
+    membership.
+    """
+    today = timezone.localdate()
+    now = timezone.now()
+    individual = IndividualMembershipFactory(active=True)
+    organisation_membership = OrganisationMembershipFactory(
+        approved_datetime=now,
+        start_date=today - timedelta(days=10),
+        expiry_date=today + timedelta(days=10),
+    )
+    member = OrganisationMemberFactory(
+        user=individual.user,
+        organisation=organisation_membership.organisation,
+        accepted_datetime=now,
+    )
+    users = User.objects.bulk_create(
+        User(username=f"seeded{i}", email=f"seeded{i}@example.com")
+        for i in range(USERS)
+    )
+    organisations = OrganisationFactory.create_batch(USERS // 10)
+    memberships, organisation_memberships, members = [], [], []
+    for i, user in enumerate(users):
+        organisation = organisations[i % len(organisations)]
+        for row in range(ROWS_PER_USER):
+            start = today - timedelta(days=400 * (row + 1))
+            fields = {
+                "membership_option": individual.membership_option,
+                "start_date": start,
+                "expiry_date": start + timedelta(days=365),
+                "created_datetime": now,
+                "approved_datetime": now if row % 2 else None,
+                "cancelled_datetime": now if row % 3 == 0 else None,
+            }
+            memberships.append(IndividualMembership(user=user, **fields))
+            organisation_memberships.append(
+                OrganisationMembership(
+                    organisation=organisation,
+                    seats=5,
+                    **{
+                        **fields,
+                        "membership_option": (
+                            organisation_membership.membership_option
+                        ),
+                    },
+                ),
+            )
+        members.append(
+            OrganisationMember(
+                user=user,
+                organisation=organisation,
+                created_datetime=now,
+                accepted_datetime=now,
+                revoked_datetime=now if i % 2 else None,
+            ),
+        )
+    IndividualMembership.objects.bulk_create(memberships)
+    OrganisationMembership.objects.bulk_create(organisation_memberships)
+    OrganisationMember.objects.bulk_create(members)
+    with connection.cursor() as cursor:
+        for model in (IndividualMembership, OrganisationMembership, OrganisationMember):
+            cursor.execute(f"ANALYZE {model._meta.db_table}")  # noqa: SLF001
+    return member.user
+
+
+def _plans(check):
+    """Return the EXPLAIN output of each query ``check()`` makes."""
+    with CaptureQueriesContext(connection) as queries:
+        check()
+    plans = []
+    with connection.cursor() as cursor:
+        for query in queries:
+            cursor.execute(f"EXPLAIN {query['sql']}")
+            plans.append("\n".join(row[0] for row in cursor.fetchall()))
+    return plans
+
+
+def _assert_no_sequential_scans(check, *models):
+    plans = _plans(check)
+    assert plans
+    for plan in plans:
+        for model in models:
+            table = model._meta.db_table  # noqa: SLF001
+            assert f"Seq Scan on {table}" not in plan, plan
+
+
+class TestActiveMembershipIndexes:
+    def test_individual_membership_check_uses_index(self, seeded_user):
+        assert seeded_user.has_active_individual_membership()
+        _assert_no_sequential_scans(
+            seeded_user.has_active_individual_membership,
+            IndividualMembership,
+        )
+
+    def test_organisation_membership_check_uses_indexes(self, seeded_user):
+        assert seeded_user.has_active_organisation_membership()
+        _assert_no_sequential_scans(
+            seeded_user.has_active_organisation_membership,
+            OrganisationMember,
+            OrganisationMembership,
+        )
+
+    def test_organisation_active_membership_uses_index(self, seeded_user):
+        organisation = seeded_user.organisation_members.get().organisation
+        assert organisation.has_active_membership
+        _assert_no_sequential_scans(
+            lambda: organisation.has_active_membership,
+            OrganisationMembership,
+        )
@@ -62,6 +62,34 @@ class TestIndividualMembershipAdmin:
         assert "Expired" in status
 
 
+class TestMembershipStatusListFilter:
+    def test_filters_memberships_by_status(self):
+        """Test that the admin status filter is applied in SQL."""
+        User = get_user_model()  # noqa: N806
+        admin_user = User.objects.create_superuser(
+            email="admin@test.com",
+            password="password",  # noqa: S106
+        )
+        active = IndividualMembershipFactory(active=True)
+        pending = IndividualMembershipFactory(pending=True)
+        client = Client()
+        client.force_login(admin_user)
+
+        response = client.get(
+            "/admin/memberships/individualmembership/",
+            {"status": "PENDING"},
+        )
+
+        memberships = list(response.context["cl"].result_list)
+        assert pending in memberships
+        assert active not in memberships
+
+    def test_orders_memberships_by_status(self):
+        """Test that the status column sorts by the annotated status."""
+        admin = IndividualMembershipAdmin(IndividualMembership, AdminSite())
+        assert admin.status.admin_order_field == "membership_status"
+
+
 class TestMembershipOptionAdmin:
     def test_archived_field_accessible_on_creation(self):
         """Test that archived field is accessible when creating a MembershipOption."""
@@ -0,0 +1,73 @@
+from datetime import timedelta
+from itertools import product
+
+import pytest
+from django.utils import timezone
+
+from ams.memberships.models import IndividualMembership
+from ams.memberships.models import MembershipStatus
+from ams.memberships.models import OrganisationMembership
+from ams.memberships.tests.factories import IndividualMembershipFactory
+from ams.memberships.tests.factories import OrganisationMembershipFactory
+
+pytestmark = pytest.mark.django_db
+
+# Days from today, either side of each boundary status() checks.
+DAY_OFFSETS = (-2, -1, 0, 1, 2)
+
+
+class TestWithStatus:
+    @pytest.mark.parametrize(
+        ("factory", "model"),
+        [
+            (IndividualMembershipFactory, IndividualMembership),
+            (OrganisationMembershipFactory, OrganisationMembership),
+        ],
+    )
+    def test_agrees_with_status_for_every_combination(self, factory, model):
+        # Arrange: every combination of the fields status() depends on
+        today = timezone.localdate()
+        now = timezone.now()
+        template = factory()
+        model.objects.all().delete()
+        memberships = []
+        for cancelled, approved, start, expiry in product(
+            (None, now),
+            (None, now),
+            DAY_OFFSETS,
+            DAY_OFFSETS,
+        ):
+            template.pk = None
+            template.cancelled_datetime = cancelled
+            template.approved_datetime = approved
+            template.start_date = today + timedelta(days=start)
+            template.expiry_date = today + timedelta(days=expiry)
+            template.save()
+            memberships.append(template.pk)
+
+        # Act
+        annotated = model.objects.with_status().filter(pk__in=memberships)
+
+        # Assert
+        assert len(annotated) == 2 * 2 * len(DAY_OFFSETS) ** 2
+        for membership in annotated:
+            assert membership.membership_status == membership.status()
+
+    def test_filters_and_orders_by_status(self):
+        # Arrange
+        active = IndividualMembershipFactory(active=True)
+        pending = IndividualMembershipFactory(pending=True)
+        cancelled = IndividualMembershipFactory(active=True, cancelled=True)
+        expired = IndividualMembershipFactory(active=True, expired=True)
+
+        # Act
+        ordered = list(
+            IndividualMembership.objects.with_status().order_by("membership_status"),
+        )
+        pending_only = IndividualMembership.objects.with_status().filter(
+            membership_status=MembershipStatus.PENDING,
+        )
+
+        # Assert
+        assert ordered == [active, cancelled, expired, pending]
+        assert list(pending_only) == [pending]
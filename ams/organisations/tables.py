@@ -171,10 +171,10 @@ class OrganisationMembershipTable(Table):
         orderable=False,
     )
     status = MembershipStatusBadgeColumn(
+        # Annotated by with_status(), so the table orders by status in SQL
+        accessor="membership_status",
         # Translators: Column header — current membership status (e.g. Active, Expired)
         verbose_name=_("Status"),
-        empty_values=(),
-        orderable=False,
     )
     start_date = DateColumn(
         accessor="start_date",
@@ -27,6 +27,7 @@ from ams.organisations.models import OrganisationMember
 from ams.organisations.tables import OrganisationMembershipTable
 from ams.organisations.tables import OrganisationMemberTable
 from ams.users.models import User
+from ams.utils.mixins import BreadcrumbObjectMixin
 
 logger = logging.getLogger(__name__)
 
@@ -125,6 +126,7 @@ organisation_update_view = OrganisationUpdateView.as_view()
 class OrganisationDetailView(
     LoginRequiredMixin,
     OrganisationAdminMixin,
+    BreadcrumbObjectMixin,
     DetailView,
 ):
     """
@@ -161,9 +163,8 @@ class OrganisationDetailView(
 
         # Get organisation memberships
         memberships = (
-            organisation.organisation_memberships.select_related(
-                "membership_option",
-            )
+            organisation.organisation_memberships.with_status()
+            .select_related("membership_option")
             .prefetch_related("invoices")
             .order_by("-start_date")
         )
@@ -142,6 +142,25 @@ class ResourceCategoryAdmin(ResourcesFeatureFlagMixin, TabbedTranslationAdmin):
         ),
     )
 
+    # Each save would recompute every tag's colour, so the category and its
+    # inline tags are saved without refreshing and refreshed once at the end.
+    def save_model(self, request, obj, form, change):
+        obj.save(refresh_colours=False)
+
+    def save_formset(self, request, form, formset, change):
+        if formset.model is not ResourceTag:
+            super().save_formset(request, form, formset, change)
+            return
+        for tag in formset.save(commit=False):
+            tag.save(refresh_colours=False)
+        for tag in formset.deleted_objects:
+            tag.delete()
+        formset.save_m2m()
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        form.instance.refresh_tag_colours()
+
 
 @admin.register(ResourceTag)
 class ResourceTagAdmin(ResourcesFeatureFlagMixin, TabbedTranslationAdmin):
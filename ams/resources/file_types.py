@@ -1,3 +1,4 @@
+import mimetypes
 import re
 from pathlib import Path
 from urllib.parse import urlparse
@@ -89,6 +90,11 @@ COMPONENT_TYPE_CHOICES = tuple(
     (value, data["text"]) for value, data in COMPONENT_TYPE_DATA.items()
 )
 
+# filetype's matchers only inspect the start of a file; 261 bytes covers
+# every signature it knows.
+FILE_HEADER_SIZE = 261
+DEFAULT_MIME_TYPE = "application/octet-stream"
+
 GOOGLE_DRIVE_HOSTS = {"drive.google.com", "docs.google.com"}
 GOOGLE_DRIVE_PATH_MAP = {
     "document": TYPE_DOCUMENT,
@@ -115,21 +121,54 @@ def detect_url_type(url: str) -> int:
 
 
 def detect_file_type(file_field) -> int:
+    return sniff_file(file_field)[0]
+
+
+def sniff_file(file_field) -> tuple[int, str]:
+    """Return the component type and MIME type of a file.
+
+    Known extensions are resolved from the name alone. Anything else is
+    sniffed from the first FILE_HEADER_SIZE bytes: read from memory for a
+    new upload, or with a single ranged read for a file already in storage.
+    """
     extension = Path(file_field.name).suffix[1:].lower()
+    guessed_mime = mimetypes.guess_type(file_field.name)[0] or DEFAULT_MIME_TYPE
     for type_code, type_data in COMPONENT_TYPE_DATA.items():
         if extension in type_data.get("extensions", set()):
-            return type_code
+            return type_code, guessed_mime
+    header = read_file_header(file_field)
+    kind = filetype.guess(header)
+    return detect_header_type(header), kind.mime if kind else guessed_mime
+
 
-    file_obj = file_field.open()
+def detect_header_type(header: bytes) -> int:
+    if filetype.helpers.is_image(header):
+        return TYPE_IMAGE
+    if filetype.helpers.is_video(header):
+        return TYPE_VIDEO
+    if filetype.helpers.is_audio(header):
+        return TYPE_AUDIO
+    if filetype.helpers.is_archive(header):
+        return TYPE_ARCHIVE
+    return TYPE_OTHER
+
+
+def read_file_header(file_field) -> bytes:
+    """Return the first FILE_HEADER_SIZE bytes without fetching the whole file.
+
+    Uncommitted uploads (and plain file objects) are read in memory. Stored
+    files use the storage's ``read_range`` when it has one (a ranged GET on
+    S3), falling back to opening the file.
+    """
+    if getattr(file_field, "_committed", False):
+        storage = file_field.storage
+        if hasattr(storage, "read_range"):
+            return storage.read_range(file_field.name, FILE_HEADER_SIZE)
+        with storage.open(file_field.name) as stored_file:
+            return stored_file.read(FILE_HEADER_SIZE)
+    file_obj = getattr(file_field, "file", file_field)
+    file_obj.seek(0)
     try:
-        if filetype.helpers.is_image(file_obj):
-            return TYPE_IMAGE
-        if filetype.helpers.is_video(file_obj):
-            return TYPE_VIDEO
-        if filetype.helpers.is_audio(file_obj):
-            return TYPE_AUDIO
-        if filetype.helpers.is_archive(file_obj):
-            return TYPE_ARCHIVE
+        return file_obj.read(FILE_HEADER_SIZE)
     finally:
         file_obj.seek(0)
-    return TYPE_OTHER
@@ -0,0 +1,37 @@
+"""Module for the custom Django build_resource_similarity command."""
+
+from django.conf import settings
+from django.core import management
+
+from ams.resources.similarity import rebuild_similarities
+from ams.utils.management.commands._constants import LOG_HEADER
+
+
+class Command(management.base.BaseCommand):
+    """Required command class for the build_resource_similarity command."""
+
+    help = (
+        "Rebuild the precomputed related-resources index from tag and author "
+        "co-occurrence. Only resources whose tags or authors changed since "
+        "the last run (and the resources affected by them) are recomputed, "
+        "unless --full is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Recompute every resource instead of only stale ones.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=settings.RESOURCE_RELATED_LIMIT,
+            help="Number of related resources to store per resource.",
+        )
+
+    def handle(self, *args, **options):
+        """Automatically called when the build_resource_similarity command is given."""
+        self.stdout.write(LOG_HEADER.format("🔗 Build resource similarity"))
+        count = rebuild_similarities(options["limit"], full=options["full"])
+        self.stdout.write(f"✅ Recomputed related resources for {count} resources.")
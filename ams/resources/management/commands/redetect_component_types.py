@@ -0,0 +1,86 @@
+"""Module for the custom Django redetect_component_types command."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core import management
+
+from ams.resources import file_types
+from ams.resources.models import ResourceComponent
+from ams.utils.management.commands._constants import LOG_HEADER
+
+BATCH_SIZE = 200
+
+
+class Command(management.base.BaseCommand):
+    """Required command class for the redetect_component_types command."""
+
+    help = (
+        "Detect and store the component type and MIME type of file components. "
+        "Only components without a stored MIME type are checked, unless --all "
+        "is given. Each file is sniffed from a ranged read of its first bytes, "
+        "several at a time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-detect every file component, not only unsniffed ones.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="Number of files to read from storage concurrently.",
+        )
+
+    def handle(self, *args, **options):
+        """Automatically called when the redetect_component_types command is given."""
+        self.stdout.write(LOG_HEADER.format("🔎 Redetect component types"))
+        components = ResourceComponent.objects.exclude(component_file="").exclude(
+            component_file__isnull=True,
+        )
+        if not options["all"]:
+            components = components.filter(component_mime_type="")
+        components = components.only(
+            "pk",
+            "component_file",
+            "component_type",
+            "component_mime_type",
+        ).order_by("pk")
+
+        updated = 0
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            batch = []
+            for component in components.iterator(chunk_size=BATCH_SIZE):
+                batch.append(component)
+                if len(batch) == BATCH_SIZE:
+                    updated += self._redetect(executor, batch)
+                    batch = []
+            if batch:
+                updated += self._redetect(executor, batch)
+        self.stdout.write(f"✅ Updated {updated} file components.")
+
+    def _redetect(self, executor, components):
+        results = executor.map(
+            lambda component: file_types.sniff_file(component.component_file),
+            components,
+        )
+        changed = []
+        for component, (component_type, mime_type) in zip(
+            components,
+            results,
+            strict=True,
+        ):
+            if (component.component_type, component.component_mime_type) != (
+                component_type,
+                mime_type,
+            ):
+                component.component_type = component_type
+                component.component_mime_type = mime_type
+                changed.append(component)
+        ResourceComponent.objects.bulk_update(
+            changed,
+            ["component_type", "component_mime_type"],
+        )
+        return len(changed)
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.16 on 2026-10-18 22:00
+
+from django.db import migrations, models
+
+from ams.utils.colours import contrast_colour
+from ams.utils.colours import darken
+from ams.utils.colours import interpolate_colour
+
+
+def _style_attrs(colour, tag_style):
+    # Frozen copy of ams.resources.models.tag_style_attrs at this migration.
+    if not colour:
+        return ""
+    if tag_style == "outline":
+        return (
+            f"background-color: transparent; color: {colour}; "
+            f"border: 1px solid {colour};"
+        )
+    if tag_style == "soft":
+        r, g, b = (int(colour[i : i + 2], 16) for i in (1, 3, 5))
+        return f"background-color: rgba({r}, {g}, {b}, 0.15); color: {darken(colour)};"
+    return f"background-color: {colour}; color: {contrast_colour(colour)};"
+
+
+def populate_tag_colours(apps, schema_editor):
+    ResourceCategory = apps.get_model("resources", "ResourceCategory")
+    ResourceTag = apps.get_model("resources", "ResourceTag")
+    for category in ResourceCategory.objects.all():
+        tags = list(ResourceTag.objects.filter(category=category).order_by("order", "name"))
+        start = category.gradient_start_colour
+        end = category.gradient_end_colour or start
+        for i, tag in enumerate(tags):
+            derived = ""
+            if start:
+                derived = interpolate_colour(start, end, i / max(len(tags) - 1, 1))
+            tag.effective_colour = tag.color or derived
+            tag.text_color = contrast_colour(tag.effective_colour)
+            tag.style_attrs = _style_attrs(tag.effective_colour, category.tag_style)
+        ResourceTag.objects.bulk_update(
+            tags,
+            ["effective_colour", "text_color", "style_attrs"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0020_tag_colour_gradient'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resourcetag',
+            name='effective_colour',
+            field=models.CharField(blank=True, default='', editable=False, max_length=25),
+        ),
+        migrations.AddField(
+            model_name='resourcetag',
+            name='style_attrs',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='resourcetag',
+            name='text_color',
+            field=models.CharField(blank=True, default='', editable=False, max_length=25),
+        ),
+        migrations.RunPython(populate_tag_colours, migrations.RunPython.noop),
+    ]
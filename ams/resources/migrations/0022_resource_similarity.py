@@ -0,0 +1,55 @@
+# Generated by Django 5.2.16 on 2026-10-18 22:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entities', '0001_initial'),
+        ('resources', '0021_resourcetag_stored_colours'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResourceSimilarity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+            ],
+            options={
+                'verbose_name_plural': 'resource similarities',
+                'ordering': ['resource', '-score'],
+            },
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='similarity_stale',
+            field=models.BooleanField(default=True, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(condition=models.Q(('similarity_stale', True)), fields=['similarity_stale'], name='idx_resource_similarity_stale'),
+        ),
+        migrations.AddField(
+            model_name='resourcesimilarity',
+            name='related',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='resources.resource'),
+        ),
+        migrations.AddField(
+            model_name='resourcesimilarity',
+            name='resource',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similarities', to='resources.resource'),
+        ),
+        migrations.AddIndex(
+            model_name='resourcesimilarity',
+            index=models.Index(fields=['resource', '-score'], name='idx_resource_similarity_score'),
+        ),
+        migrations.AddConstraint(
+            model_name='resourcesimilarity',
+            constraint=models.UniqueConstraint(fields=('resource', 'related'), name='unique_resource_similarity'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.16 on 2026-10-18 22:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0022_resource_similarity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resourcecomponent',
+            name='component_mime_type',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+    ]
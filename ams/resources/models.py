@@ -9,9 +9,7 @@ from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.urls import reverse
-from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
-from imagekit.models import ImageSpecField
 from imagekit.processors import ResizeToFill
 from imagekit.processors import ResizeToFit
 from tinymce.models import HTMLField
@@ -23,6 +21,7 @@ from ams.users.models import get_public_media_storage
 from ams.utils.colours import contrast_colour
 from ams.utils.colours import darken
 from ams.utils.colours import interpolate_colour
+from ams.utils.image_specs import add_responsive_image_specs
 from config.storage_backends import PrivateMediaStorage
 
 
@@ -66,24 +65,56 @@ class ResourceCategory(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, refresh_colours=True, **kwargs):
+        super().save(*args, **kwargs)
+        if refresh_colours:
+            self.refresh_tag_colours()
+
     def _slug_source(self):
         return self.name_en or self.name
 
-    @cached_property
-    def _derived_tag_colours(self) -> dict[int, str]:
-        if not self.gradient_start_colour:
-            return {}
+    def refresh_tag_colours(self) -> list["ResourceTag"]:
+        """Recompute and store the display colours of every tag in the category.
+
+        Tags without their own colour are spread along the category's gradient
+        in display order, so any change to the gradient, the tag style or the
+        set and order of tags can change every tag's colour. Only rows whose
+        stored values actually changed are written. Returns the tags, in order.
+        """
+        tags = list(ResourceTag.objects.filter(category=self))
         end_colour = self.gradient_end_colour or self.gradient_start_colour
-        tags = list(self.tags.all())
         total = len(tags)
-        return {
-            tag.pk: interpolate_colour(
-                self.gradient_start_colour,
-                end_colour,
-                i / max(total - 1, 1),
-            )
-            for i, tag in enumerate(tags)
-        }
+        changed = []
+        for i, tag in enumerate(tags):
+            derived = ""
+            if self.gradient_start_colour:
+                derived = interpolate_colour(
+                    self.gradient_start_colour,
+                    end_colour,
+                    i / max(total - 1, 1),
+                )
+            if tag.set_display_colours(tag.color or derived, self.tag_style):
+                changed.append(tag)
+        if changed:
+            ResourceTag.objects.bulk_update(changed, ResourceTag.DISPLAY_FIELDS)
+        return tags
+
+
+def tag_style_attrs(colour: str, tag_style: str) -> str:
+    """Return the inline CSS for a tag badge of *colour* in the given style."""
+    if not colour:
+        return ""
+    if tag_style == ResourceCategory.TagStyle.OUTLINE:
+        return (
+            f"background-color: transparent; color: {colour}; "
+            f"border: 1px solid {colour};"
+        )
+    if tag_style == ResourceCategory.TagStyle.SOFT:
+        r = int(colour[1:3], 16)
+        g = int(colour[3:5], 16)
+        b = int(colour[5:7], 16)
+        return f"background-color: rgba({r}, {g}, {b}, 0.15); color: {darken(colour)};"
+    return f"background-color: {colour}; color: {contrast_colour(colour)};"
 
 
 class ResourceTag(models.Model):
@@ -104,6 +135,29 @@ class ResourceTag(models.Model):
         ),
     )
     order = models.PositiveIntegerField(default=0)
+    # Display values derived from `color` or the category's gradient, stored
+    # so rendering a badge never needs the category's other tags. Kept current
+    # by ResourceCategory.refresh_tag_colours().
+    effective_colour = models.CharField(
+        max_length=25,
+        blank=True,
+        default="",
+        editable=False,
+    )
+    text_color = models.CharField(
+        max_length=25,
+        blank=True,
+        default="",
+        editable=False,
+    )
+    style_attrs = models.CharField(
+        max_length=200,
+        blank=True,
+        default="",
+        editable=False,
+    )
+
+    DISPLAY_FIELDS = ("effective_colour", "text_color", "style_attrs")
 
     class Meta:
         ordering = ["order", "name"]
@@ -112,38 +166,29 @@ class ResourceTag(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, refresh_colours=True, **kwargs):
+        super().save(*args, **kwargs)
+        if not refresh_colours:
+            # The caller refreshes the category once after saving its tags.
+            return
+        # Saving one tag can shift the gradient position of its siblings.
+        for tag in self.category.refresh_tag_colours():
+            if tag.pk == self.pk:
+                for field in self.DISPLAY_FIELDS:
+                    setattr(self, field, getattr(tag, field))
+
     def _slug_source(self):
         return self.name_en or self.name
 
-    @property
-    def effective_colour(self) -> str:
-        if self.color:
-            return self.color
-        return self.category._derived_tag_colours.get(self.pk, "")  # noqa: SLF001
-
-    @property
-    def text_color(self) -> str:
-        return contrast_colour(self.effective_colour)
-
-    @property
-    def style_attrs(self) -> str:
-        colour = self.effective_colour
-        if not colour:
-            return ""
-        style = self.category.tag_style
-        if style == ResourceCategory.TagStyle.OUTLINE:
-            return (
-                f"background-color: transparent; color: {colour}; "
-                f"border: 1px solid {colour};"
-            )
-        if style == ResourceCategory.TagStyle.SOFT:
-            r = int(colour[1:3], 16)
-            g = int(colour[3:5], 16)
-            b = int(colour[5:7], 16)
-            return (
-                f"background-color: rgba({r}, {g}, {b}, 0.15); color: {darken(colour)};"
-            )
-        return f"background-color: {colour}; color: {contrast_colour(colour)};"
+    def set_display_colours(self, colour: str, tag_style: str) -> bool:
+        """Set the stored display fields for *colour*; return whether they changed."""
+        values = (colour, contrast_colour(colour), tag_style_attrs(colour, tag_style))
+        current = tuple(getattr(self, field) for field in self.DISPLAY_FIELDS)
+        if values == current:
+            return False
+        for field, value in zip(self.DISPLAY_FIELDS, values, strict=True):
+            setattr(self, field, value)
+        return True
 
 
 class Resource(models.Model):
@@ -196,6 +241,10 @@ class Resource(models.Model):
     search_vector_en = SearchVectorField(null=True, editable=False)
     search_vector_mi = SearchVectorField(null=True, editable=False)
     view_count = models.PositiveIntegerField(default=0, editable=False)
+    # Set whenever the resource's tags or authors change, or a save may have
+    # changed whether it is published or members-only (see signals.py), and
+    # cleared by build_resource_similarity once its neighbours are rebuilt.
+    similarity_stale = models.BooleanField(default=True, editable=False)
     thumbnail = models.ImageField(
         _("thumbnail"),
         upload_to=resource_thumbnail_path,
@@ -203,18 +252,6 @@ class Resource(models.Model):
         blank=True,
         help_text=_("Optional image shown on the resource card and detail page."),
     )
-    thumbnail_card = ImageSpecField(
-        source="thumbnail",
-        processors=[ResizeToFill(200, 200)],
-        format="JPEG",
-        options={"quality": 80},
-    )
-    thumbnail_detail = ImageSpecField(
-        source="thumbnail",
-        processors=[ResizeToFit(800, 600)],
-        format="JPEG",
-        options={"quality": 85},
-    )
     author_users = models.ManyToManyField(
         settings.AUTH_USER_MODEL,
         related_name="resources",
@@ -236,6 +273,11 @@ class Resource(models.Model):
         indexes = [
             GinIndex(fields=["search_vector_en"]),
             GinIndex(fields=["search_vector_mi"]),
+            models.Index(
+                fields=["similarity_stale"],
+                name="idx_resource_similarity_stale",
+                condition=models.Q(similarity_stale=True),
+            ),
         ]
 
     def __str__(self):
@@ -291,6 +333,26 @@ class Resource(models.Model):
         }.get(self.visibility, "")
 
 
+# Thumbnail variants (e.g. thumbnail_card_400_webp), rendered as a <picture>
+# by the responsive_image_spec template tag.
+add_responsive_image_specs(
+    Resource,
+    "thumbnail_card",
+    source="thumbnail",
+    processor=lambda width: ResizeToFill(width, width),
+    widths=(200, 400),
+    options={"quality": 80},
+)
+add_responsive_image_specs(
+    Resource,
+    "thumbnail_detail",
+    source="thumbnail",
+    processor=lambda width: ResizeToFit(width, width * 3 // 4),
+    widths=(400, 800),
+    options={"quality": 85},
+)
+
+
 class ResourceComponent(models.Model):
     DATA_FIELDS = ("component_url", "component_file", "component_resource")
 
@@ -316,6 +378,12 @@ class ResourceComponent(models.Model):
         choices=file_types.COMPONENT_TYPE_CHOICES,
         default=file_types.TYPE_OTHER,
     )
+    # Detected when a file is uploaded, so later saves never refetch it.
+    component_mime_type = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+    )
     component_url = models.URLField(blank=True)
     component_file = models.FileField(
         null=True,
@@ -342,12 +410,20 @@ class ResourceComponent(models.Model):
     def save(self, *args, **kwargs):
         if self.component_url:
             self.component_type = file_types.detect_url_type(self.component_url)
+            self.component_mime_type = ""
         elif self.component_resource_id:
             self.component_type = file_types.TYPE_RESOURCE
+            self.component_mime_type = ""
         elif self.component_file:
-            self.component_type = file_types.detect_file_type(self.component_file)
+            # Sniff only a new upload, or a stored file never sniffed before.
+            is_new_upload = not self.component_file._committed  # noqa: SLF001
+            if is_new_upload or not self.component_mime_type:
+                self.component_type, self.component_mime_type = file_types.sniff_file(
+                    self.component_file,
+                )
         else:
             self.component_type = file_types.TYPE_OTHER
+            self.component_mime_type = ""
         super().save(*args, **kwargs)
 
     def clean(self):
@@ -376,6 +452,45 @@ class ResourceComponent(models.Model):
         return file_types.COMPONENT_TYPE_DATA[self.component_type]["icon"]
 
 
+class ResourceSimilarity(models.Model):
+    """A precomputed "related resource" edge, built by build_resource_similarity.
+
+    Each resource keeps its top-k most similar resources by cosine similarity
+    of their tag and author sets, so the detail page reads them in one query.
+    """
+
+    resource = models.ForeignKey(
+        Resource,
+        on_delete=models.CASCADE,
+        related_name="similarities",
+    )
+    related = models.ForeignKey(
+        Resource,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    score = models.FloatField()
+
+    class Meta:
+        ordering = ["resource", "-score"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["resource", "related"],
+                name="unique_resource_similarity",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["resource", "-score"],
+                name="idx_resource_similarity_score",
+            ),
+        ]
+        verbose_name_plural = "resource similarities"
+
+    def __str__(self):
+        return f"{self.resource} ~ {self.related} ({self.score:.2f})"
+
+
 class ResourceView(models.Model):
     resource = models.ForeignKey(
         Resource,
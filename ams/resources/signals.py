@@ -0,0 +1,93 @@
+"""Signals keeping denormalised resource data and the resources version in sync."""
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from ams.entities.models import Entity
+from ams.resources.models import Resource
+from ams.resources.models import ResourceCategory
+from ams.resources.models import ResourceComponent
+from ams.resources.models import ResourceTag
+from ams.resources.versions import bump_resources_version
+
+
+@receiver(post_delete, sender=ResourceTag)
+def refresh_sibling_tag_colours(sender, instance, **kwargs):
+    """
+    Recompute the remaining tags' colours when a tag is deleted.
+
+    Removing a tag shifts the gradient position of every tag after it. The
+    category may itself be mid-deletion (cascade), in which case there is
+    nothing left to update.
+    """
+    category = ResourceCategory.objects.filter(pk=instance.category_id).first()
+    if category is not None:
+        category.refresh_tag_colours()
+
+
+@receiver(m2m_changed, sender=Resource.tags.through)
+@receiver(m2m_changed, sender=Resource.author_users.through)
+@receiver(m2m_changed, sender=Resource.author_entities.through)
+def mark_similarity_stale(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Flag resources whose tags or authors changed for the next similarity run.
+
+    Uses a queryset update rather than save() so datetime_updated (auto_now)
+    is not bumped. Tags, users and entities all reach their resources through
+    ``.resources``; for a reverse clear (e.g. ``tag.resources.clear()``) those
+    are only known before the rows are removed, hence ``pre_clear``.
+    """
+    if action not in {"post_add", "post_remove", "pre_clear"}:
+        return
+    if not reverse:
+        resources = Resource.objects.filter(pk=instance.pk)
+    elif action == "pre_clear":
+        resources = instance.resources.all()
+    else:
+        resources = Resource.objects.filter(pk__in=pk_set)
+    resources.update(similarity_stale=True)
+
+
+@receiver(post_save, sender=Resource)
+def mark_similarity_stale_on_save(sender, instance, update_fields=None, **kwargs):
+    """
+    Flag a saved resource for the next similarity run.
+
+    Only published resources are stored as neighbours, and members-only ones
+    are kept apart, so a save that may have changed either changes other
+    resources' neighbours. Saves of other fields only are skipped.
+    """
+    if update_fields is not None and not {"published", "visibility"} & set(
+        update_fields,
+    ):
+        return
+    Resource.objects.filter(pk=instance.pk).update(similarity_stale=True)
+
+
+@receiver(post_save, sender=Resource)
+@receiver(post_delete, sender=Resource)
+@receiver(post_save, sender=ResourceComponent)
+@receiver(post_delete, sender=ResourceComponent)
+@receiver(post_save, sender=ResourceTag)
+@receiver(post_delete, sender=ResourceTag)
+@receiver(post_save, sender=ResourceCategory)
+@receiver(post_delete, sender=ResourceCategory)
+@receiver(post_save, sender=Entity)
+@receiver(post_delete, sender=Entity)
+@receiver(m2m_changed, sender=Resource.tags.through)
+@receiver(m2m_changed, sender=Resource.author_users.through)
+@receiver(m2m_changed, sender=Resource.author_entities.through)
+def bump_resources_version_on_change(sender, instance, **kwargs):
+    """Change the resource pages' ETags after commit.
+
+    Resources are included because a resource's page lists the resources it
+    is a component of and its related resources. Saves of only the view
+    count are skipped, like the queryset updates that record views.
+    """
+    update_fields = kwargs.get("update_fields")
+    if update_fields and set(update_fields) <= {"view_count"}:
+        return
+    transaction.on_commit(bump_resources_version)
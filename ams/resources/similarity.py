@@ -0,0 +1,134 @@
+"""Precomputed "related resources" index.
+
+Each resource is described by the set of its tags and authors (users and
+entities). Two resources' similarity is the cosine of their binary feature
+vectors, which for sets reduces to ``|A ∩ B| / sqrt(|A| * |B|)``. Candidates
+are found through an inverted index (feature -> resources), so only pairs
+that share at least one feature are ever scored.
+
+Only published resources are stored as neighbours. Non-members can't see
+members-only resources, so each resource stores its closest neighbours and
+its closest public neighbours, and the detail page shows a full list to
+either audience.
+"""
+
+import heapq
+import math
+from collections import Counter
+from collections import defaultdict
+
+from django.db import transaction
+
+from ams.resources.models import Resource
+from ams.resources.models import ResourceSimilarity
+from ams.resources.versions import bump_resources_version
+
+
+def resource_features() -> dict[int, set[str]]:
+    """Return every resource's tag and author features, keyed by resource pk."""
+    features = defaultdict(set)
+    through_columns = (
+        (Resource.tags.through, "resourcetag_id", "tag"),
+        (Resource.author_users.through, "user_id", "user"),
+        (Resource.author_entities.through, "entity_id", "entity"),
+    )
+    for through, column, prefix in through_columns:
+        for resource_id, value in through.objects.values_list("resource_id", column):
+            features[resource_id].add(f"{prefix}:{value}")
+    return features
+
+
+def top_neighbours(
+    resource_id: int,
+    features: dict[int, set[str]],
+    postings: dict[str, set[int]],
+    limit: int,
+    *,
+    candidates: set[int] | None = None,
+) -> list[tuple[int, float]]:
+    """Return up to *limit* ``(related_id, score)`` pairs, most similar first.
+
+    Only resources in *candidates* are considered, when it is given.
+    """
+    own = features.get(resource_id)
+    if not own:
+        return []
+    shared = Counter()
+    for feature in own:
+        shared.update(postings[feature])
+    del shared[resource_id]
+    scored = (
+        (other_id, count / math.sqrt(len(own) * len(features[other_id])))
+        for other_id, count in shared.items()
+        if candidates is None or other_id in candidates
+    )
+    # Ties broken by pk so rebuilds are deterministic.
+    return heapq.nlargest(limit, scored, key=lambda pair: (pair[1], -pair[0]))
+
+
+def rebuild_similarities(limit: int, *, full: bool = False) -> int:
+    """Rebuild stored neighbours and return how many resources were recomputed.
+
+    By default only stale resources (tags, authors, publication or
+    visibility changed since the last run) are rebuilt, together with every
+    resource whose neighbours could have changed as a result: those sharing
+    a feature with a stale resource, and those currently listing one as a
+    neighbour. Pass ``full=True`` to rebuild every resource.
+    """
+    features = resource_features()
+    postings = defaultdict(set)
+    for resource_id, resource_features_ in features.items():
+        for feature in resource_features_:
+            postings[feature].add(resource_id)
+
+    stale_ids = set(
+        Resource.objects.filter(similarity_stale=True).values_list("pk", flat=True),
+    )
+    if full:
+        targets = set(Resource.objects.values_list("pk", flat=True))
+    else:
+        targets = set(stale_ids)
+        for resource_id in stale_ids:
+            for feature in features.get(resource_id, ()):
+                targets |= postings[feature]
+        targets |= set(
+            ResourceSimilarity.objects.filter(
+                related_id__in=stale_ids,
+            ).values_list("resource_id", flat=True),
+        )
+
+    published = set(
+        Resource.objects.filter(published=True).values_list("pk", flat=True),
+    )
+    public = published - set(
+        Resource.objects.filter(
+            visibility=Resource.Visibility.MEMBERS_ONLY,
+        ).values_list("pk", flat=True),
+    )
+    rows = []
+    for resource_id in targets:
+        neighbours = {}
+        for candidates in (published, public):
+            neighbours.update(
+                top_neighbours(
+                    resource_id,
+                    features,
+                    postings,
+                    limit,
+                    candidates=candidates,
+                ),
+            )
+        rows.extend(
+            ResourceSimilarity(
+                resource_id=resource_id,
+                related_id=related_id,
+                score=score,
+            )
+            for related_id, score in neighbours.items()
+        )
+    with transaction.atomic():
+        ResourceSimilarity.objects.filter(resource_id__in=targets).delete()
+        ResourceSimilarity.objects.bulk_create(rows, batch_size=1000)
+        Resource.objects.filter(pk__in=stale_ids).update(similarity_stale=False)
+        transaction.on_commit(bump_resources_version)
+    return len(targets)
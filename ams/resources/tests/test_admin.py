@@ -1,4 +1,5 @@
 from http import HTTPStatus
+from unittest.mock import patch
 
 import pytest
 from django.urls import reverse
@@ -8,6 +9,7 @@ from ams.resources.admin import ResourceAdmin
 from ams.resources.admin import ResourceCategoryAdmin
 from ams.resources.admin import ResourceForm
 from ams.resources.models import Resource
+from ams.resources.models import ResourceCategory
 from ams.resources.tests.factories import ResourceCategoryFactory
 from ams.resources.tests.factories import ResourceFactory
 from ams.resources.tests.factories import ResourceTagFactory
@@ -180,3 +182,45 @@ class TestResourceCategoryAdmin:
         assert b"gradient_start_colour" in response.content
         assert b"gradient_end_colour" in response.content
         assert b"tag_style" in response.content
+
+    def test_saving_category_with_tags_refreshes_colours_once(
+        self,
+        admin_client,
+    ):
+        category = ResourceCategoryFactory(name="Year Level")
+        url = reverse("admin:resources_resourcecategory_change", args=[category.pk])
+        data = {
+            "name_en": "Year Level",
+            "name_mi": "",
+            "order": 0,
+            "gradient_start_colour": "#000000",
+            "gradient_end_colour": "#FFFFFF",
+            "tag_style": ResourceCategory.TagStyle.SOLID,
+            "tags-TOTAL_FORMS": "3",
+            "tags-INITIAL_FORMS": "0",
+            "tags-MIN_NUM_FORMS": "0",
+            "tags-MAX_NUM_FORMS": "1000",
+            "_save": "Save",
+        }
+        for i in range(3):
+            data |= {
+                f"tags-{i}-name_en": f"Level {i}",
+                f"tags-{i}-name_mi": "",
+                f"tags-{i}-abbreviation_en": "",
+                f"tags-{i}-abbreviation_mi": "",
+                f"tags-{i}-color": "",
+                f"tags-{i}-order": i,
+                f"tags-{i}-id": "",
+                f"tags-{i}-category": category.pk,
+            }
+        with patch.object(
+            ResourceCategory,
+            "refresh_tag_colours",
+            autospec=True,
+            side_effect=ResourceCategory.refresh_tag_colours,
+        ) as refresh:
+            response = admin_client.post(url, data)
+        assert response.status_code == HTTPStatus.FOUND
+        assert refresh.call_count == 1
+        colours = [tag.effective_colour for tag in category.tags.all()]
+        assert colours == ["#000000", "#808080", "#ffffff"]
@@ -0,0 +1,180 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from ams.entities.tests.factories import EntityFactory
+from ams.resources.models import Resource
+from ams.resources.models import ResourceSimilarity
+from ams.resources.tests.factories import ResourceFactory
+from ams.resources.tests.factories import ResourceTagFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _build(*args):
+    call_command("build_resource_similarity", *args, stdout=StringIO())
+
+
+def _neighbours(resource):
+    return list(
+        ResourceSimilarity.objects.filter(resource=resource).values_list(
+            "related_id",
+            flat=True,
+        ),
+    )
+
+
+class TestBuildResourceSimilarityCommand:
+    def test_links_resources_sharing_tags(self):
+        tag = ResourceTagFactory()
+        first = ResourceFactory()
+        second = ResourceFactory()
+        unrelated = ResourceFactory()
+        first.tags.add(tag)
+        second.tags.add(tag)
+        unrelated.tags.add(ResourceTagFactory())
+        _build()
+        assert _neighbours(first) == [second.pk]
+        assert _neighbours(second) == [first.pk]
+        assert _neighbours(unrelated) == []
+
+    def test_shared_authors_count_as_features(self):
+        entity = EntityFactory()
+        first = ResourceFactory()
+        second = ResourceFactory()
+        first.author_entities.add(entity)
+        second.author_entities.add(entity)
+        _build()
+        assert _neighbours(first) == [second.pk]
+
+    def test_orders_by_cosine_similarity(self):
+        tags = ResourceTagFactory.create_batch(3)
+        resource = ResourceFactory()
+        close = ResourceFactory()
+        distant = ResourceFactory()
+        resource.tags.add(*tags)
+        close.tags.add(*tags)
+        distant.tags.add(tags[0], ResourceTagFactory(), ResourceTagFactory())
+        _build()
+        assert _neighbours(resource) == [close.pk, distant.pk]
+        top = ResourceSimilarity.objects.get(resource=resource, related=close)
+        assert top.score == pytest.approx(1.0)
+
+    def test_limit_caps_neighbours(self):
+        tag = ResourceTagFactory()
+        resources = ResourceFactory.create_batch(4)
+        for resource in resources:
+            resource.tags.add(tag)
+        _build("--limit", "2")
+        expected_neighbours = 2
+        assert len(_neighbours(resources[0])) == expected_neighbours
+
+    def test_clears_stale_flag(self):
+        resource = ResourceFactory()
+        resource.tags.add(ResourceTagFactory())
+        _build()
+        resource.refresh_from_db()
+        assert resource.similarity_stale is False
+
+    def test_incremental_run_skips_unchanged_resources(self):
+        tag = ResourceTagFactory()
+        first = ResourceFactory()
+        second = ResourceFactory()
+        first.tags.add(tag)
+        second.tags.add(tag)
+        _build()
+        # Corrupt a stored row; an incremental run with nothing stale must
+        # leave it alone, while --full recomputes it.
+        ResourceSimilarity.objects.filter(resource=first).update(score=0.5)
+        _build()
+        assert ResourceSimilarity.objects.get(resource=first).score == 0.5  # noqa: PLR2004
+        _build("--full")
+        assert ResourceSimilarity.objects.get(resource=first).score == pytest.approx(
+            1.0,
+        )
+
+    def test_incremental_run_updates_resources_affected_by_a_change(self):
+        tag = ResourceTagFactory()
+        first = ResourceFactory()
+        second = ResourceFactory()
+        first.tags.add(tag)
+        second.tags.add(tag)
+        _build()
+
+        newcomer = ResourceFactory()
+        newcomer.tags.add(tag)
+        _build()
+        assert newcomer.pk in _neighbours(first)
+
+        newcomer.tags.remove(tag)
+        _build()
+        assert newcomer.pk not in _neighbours(first)
+        assert _neighbours(newcomer) == []
+
+    def test_unpublished_resources_are_not_neighbours(self):
+        tag = ResourceTagFactory()
+        resource = ResourceFactory()
+        draft = ResourceFactory(published=False)
+        published = ResourceFactory()
+        for item in (resource, draft, published):
+            item.tags.add(tag)
+        _build("--limit", "1")
+        assert _neighbours(resource) == [published.pk]
+
+    def test_public_neighbours_are_kept_behind_members_only_ones(self):
+        tags = ResourceTagFactory.create_batch(2)
+        resource = ResourceFactory()
+        resource.tags.add(*tags)
+        members_only = ResourceFactory.create_batch(
+            2,
+            visibility=Resource.Visibility.MEMBERS_ONLY,
+        )
+        for item in members_only:
+            item.tags.add(*tags)
+        public = ResourceFactory.create_batch(2)
+        for item in public:
+            item.tags.add(tags[0], ResourceTagFactory())
+        _build("--limit", "2")
+        assert set(_neighbours(resource)) == {
+            *(item.pk for item in members_only),
+            *(item.pk for item in public),
+        }
+
+    def test_publishing_a_resource_adds_it_on_the_next_run(self):
+        tag = ResourceTagFactory()
+        resource = ResourceFactory()
+        draft = ResourceFactory(published=False)
+        resource.tags.add(tag)
+        draft.tags.add(tag)
+        _build()
+        assert _neighbours(resource) == []
+
+        draft.published = True
+        draft.save()
+        _build()
+        assert _neighbours(resource) == [draft.pk]
+
+
+class TestSimilarityStaleFlag:
+    def test_new_resource_is_stale(self):
+        assert ResourceFactory().similarity_stale is True
+
+    def test_tag_change_marks_stale_without_bumping_datetime_updated(self):
+        resource = ResourceFactory()
+        Resource.objects.filter(pk=resource.pk).update(similarity_stale=False)
+        resource.refresh_from_db()
+        original_datetime_updated = resource.datetime_updated
+        resource.tags.add(ResourceTagFactory())
+        resource.refresh_from_db()
+        assert resource.similarity_stale is True
+        assert resource.datetime_updated == original_datetime_updated
+
+    def test_reverse_clear_marks_resources_stale(self):
+        tag = ResourceTagFactory()
+        resource = ResourceFactory()
+        resource.tags.add(tag)
+        Resource.objects.filter(pk=resource.pk).update(similarity_stale=False)
+        tag.resources.clear()
+        resource.refresh_from_db()
+        assert resource.similarity_stale is True
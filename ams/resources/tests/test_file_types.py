@@ -1,7 +1,12 @@
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
+from django.core.files.base import ContentFile
+from django.core.files.storage import InMemoryStorage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models.fields.files import FieldFile
 
+from ams.resources.file_types import FILE_HEADER_SIZE
 from ams.resources.file_types import TYPE_ARCHIVE
 from ams.resources.file_types import TYPE_AUDIO
 from ams.resources.file_types import TYPE_DOCUMENT
@@ -14,6 +19,10 @@ from ams.resources.file_types import TYPE_VIDEO
 from ams.resources.file_types import TYPE_WEBSITE
 from ams.resources.file_types import detect_file_type
 from ams.resources.file_types import detect_url_type
+from ams.resources.file_types import read_file_header
+from ams.resources.file_types import sniff_file
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
 
 
 def _make_file(name, content=b"data"):
@@ -170,3 +179,54 @@ class TestDetectFileType:
             patch("filetype.helpers.is_archive", return_value=False),
         ):
             assert detect_file_type(_make_file("unknown.bin")) == TYPE_OTHER
+
+
+def _stored_file(storage, name, content):
+    storage.save(name, ContentFile(content))
+    field = MagicMock(storage=storage)
+    stored = FieldFile(instance=None, field=field, name=name)
+    stored.storage = storage
+    return stored
+
+
+class TestSniffFile:
+    def test_known_extension_uses_name_only(self):
+        upload = _make_file("report.pdf")
+        with patch("ams.resources.file_types.read_file_header") as read_header:
+            assert sniff_file(upload) == (TYPE_PDF, "application/pdf")
+        read_header.assert_not_called()
+
+    def test_unknown_extension_sniffs_header(self):
+        upload = _make_file("photo.bin", PNG_HEADER + b"\x00" * 4096)
+        assert sniff_file(upload) == (TYPE_IMAGE, "image/png")
+
+    def test_unrecognised_content_falls_back_to_octet_stream(self):
+        assert sniff_file(_make_file("unknown.bin")) == (
+            TYPE_OTHER,
+            "application/octet-stream",
+        )
+
+
+class TestReadFileHeader:
+    def test_upload_reads_only_header_and_rewinds(self):
+        upload = _make_file("photo.bin", PNG_HEADER + b"\x00" * 4096)
+        header = read_file_header(upload)
+        assert len(header) == FILE_HEADER_SIZE
+        assert header.startswith(PNG_HEADER)
+        assert upload.tell() == 0
+
+    def test_stored_file_uses_ranged_read(self):
+        storage = InMemoryStorage()
+        stored = _stored_file(storage, "photo.bin", PNG_HEADER)
+        storage.read_range = MagicMock(return_value=PNG_HEADER)
+        with patch.object(storage, "open") as open_file:
+            assert read_file_header(stored) == PNG_HEADER
+        storage.read_range.assert_called_once_with("photo.bin", FILE_HEADER_SIZE)
+        open_file.assert_not_called()
+
+    def test_stored_file_without_ranged_read_opens_file(self):
+        storage = InMemoryStorage()
+        stored = _stored_file(storage, "photo.bin", PNG_HEADER + b"\x00" * 4096)
+        header = read_file_header(stored)
+        assert len(header) == FILE_HEADER_SIZE
+        assert header.startswith(PNG_HEADER)
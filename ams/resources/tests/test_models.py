@@ -117,11 +117,70 @@ class TestResourceTagEffectiveColour:
 
         tag.order = 99
         tag.save()
-        del category._derived_tag_colours  # noqa: SLF001 — clear cached_property
         last_position_colour = tag.effective_colour
 
         assert first_position_colour != last_position_colour
 
+    def test_adding_tag_updates_stored_colours_of_siblings(self):
+        category = ResourceCategoryFactory(
+            gradient_start_colour="#000000",
+            gradient_end_colour="#ffffff",
+        )
+        first = ResourceTagFactory(category=category, color="", order=1)
+        second = ResourceTagFactory(category=category, color="", order=2)
+        ResourceTagFactory(category=category, color="", order=3)
+        second.refresh_from_db()
+        first.refresh_from_db()
+        assert first.effective_colour == "#000000"
+        assert second.effective_colour not in {"#000000", "#ffffff"}
+
+    def test_deleting_tag_updates_stored_colours_of_siblings(self):
+        category = ResourceCategoryFactory(
+            gradient_start_colour="#000000",
+            gradient_end_colour="#ffffff",
+        )
+        ResourceTagFactory(category=category, color="", order=1)
+        middle = ResourceTagFactory(category=category, color="", order=2)
+        last = ResourceTagFactory(category=category, color="", order=3)
+        last.delete()
+        middle.refresh_from_db()
+        assert middle.effective_colour == "#ffffff"
+
+    def test_changing_category_gradient_updates_stored_colours(self):
+        category = ResourceCategoryFactory(gradient_start_colour="")
+        tag = ResourceTagFactory(category=category, color="")
+        assert tag.effective_colour == ""
+
+        category.gradient_start_colour = "#3a86ff"
+        category.save()
+        tag.refresh_from_db()
+        assert tag.effective_colour == "#3a86ff"
+        assert tag.text_color == "#ffffff"
+
+    def test_changing_category_tag_style_updates_stored_style_attrs(self):
+        category = ResourceCategoryFactory(
+            gradient_start_colour="#3a86ff",
+            tag_style=ResourceCategory.TagStyle.SOFT,
+        )
+        tag = ResourceTagFactory(category=category, color="")
+
+        category.tag_style = ResourceCategory.TagStyle.OUTLINE
+        category.save()
+        tag.refresh_from_db()
+        assert "border: 1px solid #3a86ff" in tag.style_attrs
+
+    def test_reading_colours_does_not_query(self, django_assert_num_queries):
+        category = ResourceCategoryFactory(
+            gradient_start_colour="#000000",
+            gradient_end_colour="#ffffff",
+        )
+        ResourceTagFactory.create_batch(3, category=category, color="")
+        tags = list(ResourceTag.objects.filter(category=category))
+        with django_assert_num_queries(0):
+            for tag in tags:
+                assert tag.effective_colour
+                assert tag.style_attrs
+
 
 class TestResourceTagStyleAttrs:
     def test_empty_when_no_effective_colour(self):
@@ -367,6 +426,36 @@ class TestResourceComponentTypeDetection:
         component = self._save_with_url("https://example.org/something")
         assert component.component_type == file_types.TYPE_WEBSITE
 
+    def test_file_mime_type_stored(self):
+        component = self._save_with_file("doc.pdf")
+        assert component.component_mime_type == "application/pdf"
+
+    def test_url_clears_mime_type(self):
+        component = self._save_with_file("doc.pdf")
+        component.component_file = None
+        component.component_url = "https://example.org/something"
+        component.save()
+        assert component.component_mime_type == ""
+
+    def test_resave_does_not_sniff_stored_file(self, file_storage):
+        component = ResourceComponentFactory(with_file=True)
+        with patch("ams.resources.file_types.sniff_file") as sniff:
+            component.name = "Renamed"
+            component.save()
+            ResourceComponent.objects.get(pk=component.pk).save()
+        sniff.assert_not_called()
+
+    def test_stored_file_without_mime_type_sniffed_once(self, file_storage):
+        component = ResourceComponentFactory(with_file=True)
+        ResourceComponent.objects.filter(pk=component.pk).update(
+            component_type=file_types.TYPE_OTHER,
+            component_mime_type="",
+        )
+        component = ResourceComponent.objects.get(pk=component.pk)
+        component.save()
+        assert component.component_type == file_types.TYPE_PDF
+        assert component.component_mime_type == "application/pdf"
+
     def test_component_resource_detected_as_resource(self):
         resource = ResourceFactory()
         other = ResourceFactory()
@@ -0,0 +1,79 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+
+from ams.resources import file_types
+from ams.resources.models import ResourceComponent
+from ams.resources.tests.factories import ResourceComponentFactory
+
+pytestmark = pytest.mark.django_db
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+
+
+def _redetect(*args):
+    out = StringIO()
+    call_command("redetect_component_types", *args, stdout=out)
+    return out.getvalue()
+
+
+def _file_component(file_storage, filename, content):
+    """Create a file component as stored before MIME types were detected."""
+    component = ResourceComponentFactory()
+    name = file_storage.save(f"resources/{filename}", ContentFile(content))
+    ResourceComponent.objects.filter(pk=component.pk).update(
+        component_url="",
+        component_file=name,
+        component_type=file_types.TYPE_OTHER,
+        component_mime_type="",
+    )
+    return ResourceComponent.objects.get(pk=component.pk)
+
+
+@pytest.fixture
+def unsniffed_image(file_storage):
+    return _file_component(file_storage, "photo.bin", PNG_HEADER + b"\x00" * 512)
+
+
+class TestRedetectComponentTypesCommand:
+    def test_backfills_type_and_mime_type(self, unsniffed_image):
+        output = _redetect()
+        unsniffed_image.refresh_from_db()
+        assert unsniffed_image.component_type == file_types.TYPE_IMAGE
+        assert unsniffed_image.component_mime_type == "image/png"
+        assert "Updated 1 file components" in output
+
+    def test_reads_only_file_headers(self, file_storage, unsniffed_image):
+        with patch.object(file_storage, "open", wraps=file_storage.open) as opened:
+            file_storage.read_range = lambda name, length: PNG_HEADER[:length]
+            _redetect()
+        opened.assert_not_called()
+        unsniffed_image.refresh_from_db()
+        assert unsniffed_image.component_mime_type == "image/png"
+
+    def test_skips_already_sniffed_components(self, unsniffed_image):
+        ResourceComponent.objects.filter(pk=unsniffed_image.pk).update(
+            component_mime_type="text/plain",
+        )
+        with patch("ams.resources.file_types.read_file_header") as read_header:
+            output = _redetect()
+        read_header.assert_not_called()
+        assert "Updated 0 file components" in output
+
+    def test_all_redetects_sniffed_components(self, unsniffed_image):
+        ResourceComponent.objects.filter(pk=unsniffed_image.pk).update(
+            component_mime_type="text/plain",
+        )
+        _redetect("--all", "--workers", "2")
+        unsniffed_image.refresh_from_db()
+        assert unsniffed_image.component_mime_type == "image/png"
+
+    def test_ignores_url_components(self, file_storage):
+        component = ResourceComponentFactory(component_url="https://example.com/")
+        output = _redetect("--all")
+        component.refresh_from_db()
+        assert component.component_type == file_types.TYPE_WEBSITE
+        assert "Updated 0 file components" in output
@@ -3,12 +3,15 @@ from http import HTTPStatus
 from unittest.mock import patch
 
 import pytest
+from django.db import connection
 from django.db.models import F
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from ams.entities.tests.factories import EntityFactory
 from ams.resources.models import Resource
 from ams.resources.models import ResourceComponentView
+from ams.resources.models import ResourceSimilarity
 from ams.resources.models import ResourceView
 from ams.resources.tests.factories import ResourceCategoryFactory
 from ams.resources.tests.factories import ResourceComponentFactory
@@ -142,6 +145,151 @@ class TestResourceDetailView:
         response = client.get(child.get_absolute_url())
         assert list(response.context["components_of"]) == []
 
+    def test_related_resources_in_context(self, client):
+        resource = ResourceFactory(published=True)
+        closest = ResourceFactory(published=True)
+        other = ResourceFactory(published=True)
+        ResourceSimilarity.objects.create(resource=resource, related=other, score=0.2)
+        ResourceSimilarity.objects.create(
+            resource=resource,
+            related=closest,
+            score=0.9,
+        )
+        response = client.get(resource.get_absolute_url())
+        assert response.context["related_resources"] == [closest, other]
+        assert closest.name.encode() in response.content
+
+    def test_related_resources_exclude_unpublished(self, client):
+        resource = ResourceFactory(published=True)
+        unpublished = ResourceFactory(published=False)
+        ResourceSimilarity.objects.create(
+            resource=resource,
+            related=unpublished,
+            score=0.9,
+        )
+        response = client.get(resource.get_absolute_url())
+        assert response.context["related_resources"] == []
+
+    def test_related_resources_exclude_members_only_for_non_members(self, client):
+        resource = ResourceFactory(published=True)
+        members_only = ResourceFactory(
+            published=True,
+            visibility=Resource.Visibility.MEMBERS_ONLY,
+        )
+        ResourceSimilarity.objects.create(
+            resource=resource,
+            related=members_only,
+            score=0.9,
+        )
+        response = client.get(resource.get_absolute_url())
+        assert response.context["related_resources"] == []
+        with patch(_MEMBERSHIP_PATCH, return_value=True):
+            response = client.get(resource.get_absolute_url())
+        assert response.context["related_resources"] == [members_only]
+
+
+class TestResourceDetailConditionalGet:
+    def test_unchanged_resource_is_not_modified(self, client):
+        resource = ResourceFactory(published=True)
+        ResourceComponentFactory(resource=resource)
+        response = client.get(resource.get_absolute_url())
+
+        with CaptureQueriesContext(connection) as queries:
+            not_modified = client.get(
+                resource.get_absolute_url(),
+                headers={"If-None-Match": response["ETag"]},
+            )
+
+        assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+        assert not [
+            query
+            for query in queries.captured_queries
+            if '"resources_resourcecomponent"' in query["sql"]
+        ]
+
+    def test_not_modified_still_records_a_view(self, client):
+        resource = ResourceFactory(published=True)
+        etag = client.get(resource.get_absolute_url())["ETag"]
+        client.get(resource.get_absolute_url(), headers={"If-None-Match": etag})
+        resource.refresh_from_db()
+        assert resource.view_count == 2  # noqa: PLR2004
+
+    def test_edited_resource_is_modified(self, client):
+        resource = ResourceFactory(published=True)
+        etag = client.get(resource.get_absolute_url())["ETag"]
+        resource.name = "Renamed"
+        resource.save()
+        response = client.get(
+            resource.get_absolute_url(),
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == HTTPStatus.OK
+
+    def test_membership_change_is_modified(self, client):
+        client.force_login(UserFactory())
+        resource = ResourceFactory(published=True)
+        etag = client.get(resource.get_absolute_url())["ETag"]
+        with patch(
+            "ams.utils.conditional_get.user_has_active_membership",
+            return_value=True,
+        ):
+            response = client.get(
+                resource.get_absolute_url(),
+                headers={"If-None-Match": etag},
+            )
+        assert response.status_code == HTTPStatus.OK
+
+    def test_component_change_is_modified(
+        self,
+        client,
+        django_capture_on_commit_callbacks,
+    ):
+        resource = ResourceFactory(published=True)
+        etag = client.get(resource.get_absolute_url())["ETag"]
+        with django_capture_on_commit_callbacks(execute=True):
+            ResourceComponentFactory(resource=resource, name="Worksheet")
+        response = client.get(
+            resource.get_absolute_url(),
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert b"Worksheet" in response.content
+
+    def test_bare_if_modified_since_gets_the_page(self, client):
+        resource = ResourceFactory(published=True)
+        response = client.get(resource.get_absolute_url())
+        client.force_login(UserFactory())
+        response = client.get(
+            resource.get_absolute_url(),
+            headers={"If-Modified-Since": response["Last-Modified"]},
+        )
+        assert response.status_code == HTTPStatus.OK
+
+    def test_not_modified_checks_the_user_can_view(self, client):
+        resource = ResourceFactory(
+            published=True,
+            visibility=Resource.Visibility.MEMBERS_ONLY,
+        )
+        with (
+            patch(_MEMBERSHIP_PATCH, return_value=True),
+            patch(
+                "ams.utils.conditional_get.user_has_active_membership",
+                return_value=True,
+            ),
+        ):
+            etag = client.get(resource.get_absolute_url())["ETag"]
+        with patch(
+            "ams.utils.conditional_get.user_has_active_membership",
+            return_value=True,
+        ):
+            response = client.get(
+                resource.get_absolute_url(),
+                headers={"If-None-Match": etag},
+            )
+        assert response.status_code == HTTPStatus.FORBIDDEN
+        resource.refresh_from_db()
+        assert resource.view_count == 1
+
 
 class TestResourceThumbnail:
     def test_card_renders_thumbnail_when_set(self, client):
@@ -157,7 +305,8 @@ class TestResourceThumbnail:
     def test_detail_renders_thumbnail_when_set(self, client):
         resource = ResourceFactory(published=True, with_thumbnail=True)
         response = client.get(resource.get_absolute_url())
-        assert resource.thumbnail_detail.url.encode() in response.content
+        assert resource.thumbnail_detail_400_jpeg.url.encode() in response.content
+        assert resource.thumbnail_detail_800_avif.url.encode() in response.content
 
     def test_thumbnail_url_is_not_signed(self, client):
         resource = ResourceFactory(published=True, with_thumbnail=True)
@@ -869,12 +1018,11 @@ class TestResourceHomeMostViewed:
         # views spread across them, so a per-row query (an N+1) shows up as
         # extra queries rather than being indistinguishable from a single
         # prefetch — a 1-resource fixture can't tell the two apart.
-        # gradient_start_colour is set on both categories so tags exercise
-        # effective_colour's derived (not overridden) path — the one that
-        # walks category.tags.all() via _derived_tag_colours — and having
-        # two categories with several tags each is what would expose a
-        # per-category N+1 if tags__category__tags weren't sharing one
-        # ResourceCategory instance across sibling tags.
+        # gradient_start_colour is set on both categories so tags use derived
+        # (not overridden) colours, and having two categories with several
+        # tags each is what would expose a per-tag or per-category N+1 if
+        # rendering a badge reached back to the category for its colour
+        # instead of reading the tag's stored display columns.
         category_a = ResourceCategoryFactory(gradient_start_colour="#3a86ff")
         category_b = ResourceCategoryFactory(gradient_start_colour="#ff006e")
         tags_a = ResourceTagFactory.create_batch(3, category=category_a, color="")
@@ -890,13 +1038,12 @@ class TestResourceHomeMostViewed:
             ResourceComponentFactory(resource=resource)
             _record_view(resource)
             _record_view(resource)
-        # Measured baseline is 38-54 with this fixture depending on how warm
+        # Measured baseline is at most 52 with this fixture depending on how warm
         # Django's process-level caches (e.g. ContentType) already are from
         # earlier tests in the run (site/locale middleware overhead plus
-        # three sliced resource lists x four prefetches each, the last of
-        # which is tags__category__tags so effective_colour's per-category
-        # cached_property doesn't hit the DB per tag). Ceiling gives headroom
-        # for that variance while still catching a new N+1 (which would add
-        # roughly one query per resource per list).
-        with django_assert_max_num_queries(62):
+        # three sliced resource lists x four prefetches each; tag colours
+        # are stored on the tag so no category prefetch is needed). Ceiling
+        # gives headroom for that variance while still catching a new N+1
+        # (which would add roughly one query per resource per list).
+        with django_assert_max_num_queries(58):
             client.get("/en/resources/")
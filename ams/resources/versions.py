@@ -0,0 +1,38 @@
+"""A cache version covering everything shown with a resource.
+
+A resource's detail page shows its components, tags, category, authors and
+related resources, none of which update the resource's
+``datetime_updated``. Signals in ams/resources/signals.py bump the version
+after commit when any of them changes, and rebuild_similarities() bumps it
+after recomputing the related resources, so the detail pages' ETags include
+this version as well.
+"""
+
+import time
+
+from django.core.cache import caches
+
+from ams.cms.page_cache import PAGE_CACHE_ALIAS
+
+RESOURCES_VERSION_CACHE_ALIAS = PAGE_CACHE_ALIAS
+
+_VERSION_KEY = "resources_version"
+
+
+def get_resources_version():
+    """Return the current resources version, starting one if needed."""
+    cache = caches[RESOURCES_VERSION_CACHE_ALIAS]
+    version = cache.get(_VERSION_KEY)
+    if version is None:
+        cache.add(_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(_VERSION_KEY)
+    return version
+
+
+def bump_resources_version():
+    """Make everything cached under the resources version stale."""
+    caches[RESOURCES_VERSION_CACHE_ALIAS].set(
+        _VERSION_KEY,
+        time.time_ns(),
+        timeout=None,
+    )
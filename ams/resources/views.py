@@ -1,6 +1,8 @@
 from collections import defaultdict
 from datetime import timedelta
+from http import HTTPStatus
 
+from django.conf import settings
 from django.contrib.postgres.search import SearchQuery
 from django.contrib.postgres.search import SearchRank
 from django.core.exceptions import PermissionDenied
@@ -16,9 +18,15 @@ from django.views import generic
 from ams.resources.forms import ResourceSearchForm
 from ams.resources.models import Resource
 from ams.resources.models import ResourceComponent
+from ams.resources.models import ResourceSimilarity
 from ams.resources.models import ResourceTag
 from ams.resources.models import record_component_view
 from ams.resources.models import record_resource_view
+from ams.resources.versions import get_resources_version
+from ams.utils.image_specs import prefetch_image_spec_states
+from ams.utils.image_specs import responsive_spec_attnames
+from ams.utils.mixins import BreadcrumbObjectMixin
+from ams.utils.mixins import ConditionalGetMixin
 from ams.utils.mixins import RedirectToCosmeticURLMixin
 from ams.utils.permissions import user_has_active_membership
 
@@ -41,7 +49,7 @@ _RESOURCE_LIST_PREFETCHES = (
     "components",
     "author_users",
     "author_entities",
-    "tags__category__tags",
+    "tags",
 )
 
 LATEST_LIMIT = 5
@@ -91,13 +99,37 @@ class ResourceHomeView(generic.TemplateView):
             .order_by("-view_count")
             .prefetch_related(*_RESOURCE_LIST_PREFETCHES)[:MOST_VIEWED_LIMIT]
         )
+        for key in ("resources", "most_viewed_month", "most_viewed_all_time"):
+            context[key] = list(context[key])
+        prefetch_image_spec_states(
+            [
+                *context["resources"],
+                *context["most_viewed_month"],
+                *context["most_viewed_all_time"],
+            ],
+            *responsive_spec_attnames(Resource, "thumbnail_card"),
+        )
         return context
 
 
-class ResourceDetailView(RedirectToCosmeticURLMixin, generic.DetailView):
+class ResourceDetailView(
+    ConditionalGetMixin,
+    BreadcrumbObjectMixin,
+    RedirectToCosmeticURLMixin,
+    generic.DetailView,
+):
     model = Resource
     context_object_name = "resource"
     template_name = "resources/resource_detail.html"
+    last_modified_field = "datetime_updated"
+    validator_fields = ("visibility",)
+
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            # Still a view, although the page wasn't rendered.
+            record_resource_view(self.object)
+        return response
 
     def get_queryset(self):
         return Resource.objects.filter(published=True).prefetch_related(
@@ -111,15 +143,40 @@ class ResourceDetailView(RedirectToCosmeticURLMixin, generic.DetailView):
             raise PermissionDenied
         return obj
 
+    def get_validator_object(self):
+        obj = super().get_validator_object()
+        # No 304 for a resource the user may no longer see; get() then runs
+        # get_object() and its permission check.
+        if obj is not None and not _user_can_view(self.request.user, obj):
+            return None
+        return obj
+
+    def get_etag_parts(self, obj):
+        # Components, tags, authors and related resources don't update the
+        # resource's datetime_updated, but do bump the resources version.
+        return [get_resources_version()]
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["components_of"] = self.object.component_of.filter(
             resource__published=True,
         ).select_related("resource")
+        context["related_resources"] = self._related_resources()
         context["can_access"] = _user_can_access(self.request.user, self.object)
         record_resource_view(self.object)
         return context
 
+    def _related_resources(self):
+        # Neighbours are precomputed by build_resource_similarity; visibility
+        # is applied here so one index serves members and non-members alike.
+        rows = ResourceSimilarity.objects.filter(
+            resource=self.object,
+            related__published=True,
+        ).select_related("related")
+        if not user_has_active_membership(self.request.user):
+            rows = rows.exclude(related__visibility=Resource.Visibility.MEMBERS_ONLY)
+        return [row.related for row in rows[: settings.RESOURCE_RELATED_LIMIT]]
+
 
 class ResourceComponentAccessView(generic.View):
     def get(self, request, pk):
@@ -203,5 +260,9 @@ class ResourceSearchView(generic.TemplateView):
                 qs = qs.filter(tags__pk__in=category_tag_pks)
             qs = qs.distinct()
 
-        context["results"] = qs.prefetch_related(*_RESOURCE_LIST_PREFETCHES)
+        context["results"] = list(qs.prefetch_related(*_RESOURCE_LIST_PREFETCHES))
+        prefetch_image_spec_states(
+            context["results"],
+            *responsive_spec_attnames(Resource, "thumbnail_card"),
+        )
         return context
@@ -0,0 +1,51 @@
+document.addEventListener('DOMContentLoaded', function () {
+  const cards = document.querySelector('[data-article-cards]');
+  if (!cards) return;
+
+  // "Older articles" appends the next page's cards in place. The page is
+  // fetched as a fragment (?fragment=1) of the same URL, so without
+  // JavaScript the link still works as a normal page link.
+  function loadMore(event) {
+    const link = event.currentTarget;
+    event.preventDefault();
+    if (link.getAttribute('aria-busy') === 'true') return;
+    link.setAttribute('aria-busy', 'true');
+
+    const url = new URL(link.href, window.location.href);
+    url.searchParams.set('fragment', '1');
+    fetch(url)
+      .then(function (response) {
+        if (!response.ok) throw new Error(response.statusText);
+        return response.text();
+      })
+      .then(function (html) {
+        const fragment = document.createElement('template');
+        fragment.innerHTML = html;
+        const newCards = fragment.content.querySelector('[data-article-cards]');
+        if (newCards) cards.append(...newCards.children);
+        const nextLink = fragment.content.querySelector(
+          '[data-article-load-more]'
+        );
+        if (nextLink) {
+          link.href = nextLink.getAttribute('href');
+          link.removeAttribute('aria-busy');
+        } else {
+          // Last page: leave the link disabled, like the server renders it.
+          const label = document.createElement('span');
+          label.className = link.className;
+          label.textContent = link.textContent;
+          link.parentElement.classList.add('disabled');
+          link.replaceWith(label);
+        }
+      })
+      .catch(function () {
+        // Fall back to loading the next page normally.
+        window.location.href = link.href;
+      });
+  }
+
+  const links = document.querySelectorAll('[data-article-load-more]');
+  links.forEach(function (link) {
+    link.addEventListener('click', loadMore);
+  });
+});
@@ -15,17 +15,11 @@
     referrerPolicy: 'strict-origin-when-cross-origin',
   }).addTo(map);
 
-  if (markers.length === 0) return;
-
-  var markerCluster = L.markerClusterGroup();
-  var bounds = L.latLngBounds();
-
-  markers.forEach(function (m) {
-    var latlng = L.latLng(m.coords.lat, m.coords.lng);
-    var popupContent = '<strong>' + m.title + '</strong>';
+  function popupContent(m) {
+    var content = '<strong>' + m.title + '</strong>';
     if (m.events) {
       m.events.forEach(function (evt) {
-        popupContent +=
+        content +=
           '<p class="mb-0"><a href="' +
           evt.url +
           '">' +
@@ -35,9 +29,83 @@
           '</a></p>';
       });
     } else if (m.text) {
-      popupContent += m.text;
+      content += m.text;
+    }
+    return content;
+  }
+
+  // The events map loads the locations in view from a GeoJSON endpoint,
+  // which clusters them at low zoom levels. Clicking a cluster zooms to it.
+  var geojsonUrl = mapId.dataset.geojsonUrl;
+  if (geojsonUrl) {
+    var layer = L.layerGroup().addTo(map);
+    var controller = null;
+
+    function clusterMarker(feature, latlng) {
+      var count = feature.properties.count;
+      var size = count < 10 ? 'small' : count < 100 ? 'medium' : 'large';
+      var marker = L.marker(latlng, {
+        icon: L.divIcon({
+          html: '<div><span>' + count + '</span></div>',
+          className: 'marker-cluster marker-cluster-' + size,
+          iconSize: L.point(40, 40),
+        }),
+      });
+      var bbox = feature.bbox;
+      marker.on('click', function () {
+        map.fitBounds(
+          [
+            [bbox[1], bbox[0]],
+            [bbox[3], bbox[2]],
+          ],
+          { padding: [30, 30] }
+        );
+      });
+      return marker;
     }
-    var marker = L.marker(latlng).bindPopup(popupContent);
+
+    function loadFeatures() {
+      if (controller) controller.abort();
+      controller = new AbortController();
+      var url = new URL(geojsonUrl, window.location.href);
+      url.searchParams.set('bbox', map.getBounds().pad(0.5).toBBoxString());
+      url.searchParams.set('zoom', map.getZoom());
+      fetch(url, { signal: controller.signal })
+        .then(function (response) {
+          if (!response.ok) throw new Error(response.statusText);
+          return response.json();
+        })
+        .then(function (data) {
+          layer.clearLayers();
+          L.geoJSON(data, {
+            pointToLayer: function (feature, latlng) {
+              if (feature.properties.cluster) {
+                return clusterMarker(feature, latlng);
+              }
+              return L.marker(latlng).bindPopup(
+                popupContent(feature.properties)
+              );
+            },
+          }).addTo(layer);
+        })
+        .catch(function () {
+          // Aborted by a newer request, or failed: keep the current markers.
+        });
+    }
+
+    map.on('moveend', loadFeatures);
+    loadFeatures();
+    return;
+  }
+
+  if (markers.length === 0) return;
+
+  var markerCluster = L.markerClusterGroup();
+  var bounds = L.latLngBounds();
+
+  markers.forEach(function (m) {
+    var latlng = L.latLng(m.coords.lat, m.coords.lng);
+    var marker = L.marker(latlng).bindPopup(popupContent(m));
     markerCluster.addLayer(marker);
     bounds.extend(latlng);
   });
@@ -0,0 +1,92 @@
+/**
+ * Unit tests for articles_load_more.js
+ */
+
+describe('Articles Load More', () => {
+  let container;
+
+  function loadScript() {
+    const fs = require('fs');
+    const path = require('path');
+    const sourceCode = fs.readFileSync(
+      path.join(__dirname, '../articles_load_more.js'),
+      'utf8'
+    );
+    eval(sourceCode);
+    document.dispatchEvent(new Event('DOMContentLoaded'));
+  }
+
+  function mockFragment(html) {
+    global.fetch = jest.fn(() =>
+      Promise.resolve({ ok: true, text: () => Promise.resolve(html) })
+    );
+  }
+
+  function flushPromises() {
+    return new Promise((resolve) => setTimeout(resolve, 0));
+  }
+
+  beforeEach(() => {
+    container = document.createElement('div');
+    container.innerHTML = `
+      <div data-article-cards><div class="col">Article 1</div></div>
+      <nav>
+        <li class="page-item">
+          <a class="page-link" href="/articles/?before=cursor-1"
+             data-article-load-more>Older</a>
+        </li>
+      </nav>
+    `;
+    document.body.appendChild(container);
+  });
+
+  afterEach(() => {
+    document.body.removeChild(container);
+    delete global.fetch;
+    jest.resetModules();
+  });
+
+  test('fetches the next page as a fragment', async () => {
+    mockFragment('<div data-article-cards></div>');
+    loadScript();
+
+    container.querySelector('[data-article-load-more]').click();
+    await flushPromises();
+
+    const url = new URL(global.fetch.mock.calls[0][0]);
+    expect(url.searchParams.get('before')).toBe('cursor-1');
+    expect(url.searchParams.get('fragment')).toBe('1');
+  });
+
+  test('appends the new cards and moves the link on', async () => {
+    mockFragment(`
+      <div data-article-cards><div class="col">Article 2</div></div>
+      <a href="/articles/?before=cursor-2" data-article-load-more>Older</a>
+    `);
+    loadScript();
+
+    const link = container.querySelector('[data-article-load-more]');
+    link.click();
+    await flushPromises();
+
+    const cards = container.querySelectorAll('[data-article-cards] .col');
+    expect(cards).toHaveLength(2);
+    expect(cards[1].textContent).toBe('Article 2');
+    expect(link.getAttribute('href')).toBe('/articles/?before=cursor-2');
+  });
+
+  test('disables the link after the last page', async () => {
+    mockFragment(
+      '<div data-article-cards><div class="col">Article 2</div></div>'
+    );
+    loadScript();
+
+    container.querySelector('[data-article-load-more]').click();
+    await flushPromises();
+
+    expect(container.querySelector('[data-article-load-more]')).toBeNull();
+    const item = container.querySelector('.page-item');
+    expect(item.classList).toContain('disabled');
+    expect(item.textContent.trim()).toBe('Older');
+  });
+});
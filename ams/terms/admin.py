@@ -2,11 +2,16 @@
 
 from django.contrib import admin
 from django.contrib import messages
+from django.db.models import Count
+from django.db.models import OuterRef
+from django.db.models import Subquery
 from django.db.models.deletion import ProtectedError
+from django.db.models.functions import Coalesce
 from django.http import HttpResponseRedirect
 from django.utils.translation import gettext_lazy as _
 from modeltranslation.admin import TabbedTranslationAdmin
 
+from ams.terms.models import PendingTermAcceptance
 from ams.terms.models import Term
 from ams.terms.models import TermAcceptance
 from ams.terms.models import TermVersion
@@ -18,6 +23,20 @@ class TermAdmin(TabbedTranslationAdmin):
     search_fields = ["name", "key"]
 
 
+def _count_per_version(model):
+    """Count ``model``'s rows for each term version, without a join."""
+    return Coalesce(
+        Subquery(
+            model.objects.filter(term_version=OuterRef("pk"))
+            .order_by()
+            .values("term_version")
+            .annotate(count=Count("pk"))
+            .values("count"),
+        ),
+        0,
+    )
+
+
 @admin.register(TermVersion)
 class TermVersionAdmin(TabbedTranslationAdmin):
     """Django admin interface for managing Term Versions."""
@@ -27,12 +46,13 @@ class TermVersionAdmin(TabbedTranslationAdmin):
         "version",
         "is_active",
         "date_active",
+        "acceptance_progress",
         "created_at",
     ]
     list_filter = ["term", "is_active", "date_active", "created_at"]
     search_fields = ["version", "content"]
     ordering = ["-date_active", "-created_at"]
-    readonly_fields = ["created_at", "updated_at"]
+    readonly_fields = ["created_at", "updated_at", "cut_over_at"]
     date_hierarchy = "date_active"
 
     fieldsets = (
@@ -57,12 +77,44 @@ class TermVersionAdmin(TabbedTranslationAdmin):
         (
             _("Metadata"),
             {
-                "fields": ("created_at", "updated_at"),
+                "fields": ("created_at", "updated_at", "cut_over_at"),
                 "classes": ("collapse",),
             },
         ),
     )
 
+    def get_queryset(self, request):
+        """Annotate the acceptance counts shown as progress."""
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                accepted_count=_count_per_version(TermAcceptance),
+                pending_count=_count_per_version(PendingTermAcceptance),
+            )
+        )
+
+    @admin.display(
+        # Translators: Django admin column — users who have accepted a version
+        description=_("Acceptance progress"),
+    )
+    def acceptance_progress(self, obj):
+        """
+        Show how many users have accepted the version and how many haven't.
+
+        Only known once the version has been cut over (see the cut_over_terms
+        command), since that records who still has to accept it.
+        """
+        if obj.cut_over_at is None:
+            return "-"
+        total = obj.accepted_count + obj.pending_count
+        percent = round(100 * obj.accepted_count / total) if total else 100
+        return _("%(accepted)s accepted, %(pending)s pending (%(percent)s%%)") % {
+            "accepted": obj.accepted_count,
+            "pending": obj.pending_count,
+            "percent": percent,
+        }
+
     def delete_model(self, request, obj):
         """Handle deletion with proper ProtectedError handling."""
         try:
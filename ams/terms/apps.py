@@ -10,3 +10,7 @@ class TermsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "ams.terms"
     verbose_name = _("Terms and Conditions")
+
+    def ready(self):
+        """Import signal handlers when the app is ready."""
+        import ams.terms.signals  # noqa: F401, PLC0415
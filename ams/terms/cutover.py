@@ -0,0 +1,79 @@
+"""Cutover of term versions: recording who still has to accept them.
+
+When a term version becomes active, every user is asked to accept it. The
+cut_over_terms command, run regularly, finds versions that have become
+active since it last ran and records each active user who hasn't accepted
+them as a PendingTermAcceptance, in batches, and removes the rows of the
+versions they replace. Rows are removed as users accept (see
+record_term_acceptances in ams/terms/helpers.py), so the admin reports a
+version's acceptance progress from two indexed counts rather than checking
+every user's acceptances.
+"""
+
+from itertools import batched
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from ams.terms.helpers import latest_term_versions_at
+from ams.terms.models import PendingTermAcceptance
+from ams.terms.models import TermVersion
+
+User = get_user_model()
+
+CUTOVER_BATCH_SIZE = 1000
+
+
+def cut_over_term_version(version, *, now=None):
+    """
+    Record the active users who haven't accepted ``version`` as pending.
+
+    Pending rows of the term's earlier versions are removed, since users no
+    longer need to accept those. Returns the number of users recorded.
+    """
+    now = now or timezone.now()
+    user_ids = (
+        User.objects.filter(is_active=True)
+        .exclude(term_acceptances__term_version=version)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    count = 0
+    with transaction.atomic():
+        PendingTermAcceptance.objects.filter(
+            term_version__term_id=version.term_id,
+        ).exclude(term_version=version).delete()
+        user_ids = user_ids.iterator(chunk_size=CUTOVER_BATCH_SIZE)
+        for batch in batched(user_ids, CUTOVER_BATCH_SIZE):
+            PendingTermAcceptance.objects.bulk_create(
+                [
+                    PendingTermAcceptance(user_id=user_id, term_version=version)
+                    for user_id in batch
+                ],
+                ignore_conflicts=True,
+            )
+            count += len(batch)
+        # An update rather than save(), so the terms epoch is left alone.
+        TermVersion.objects.filter(pk=version.pk).update(cut_over_at=now)
+    return count
+
+
+def cut_over_due_term_versions(now=None):
+    """
+    Cut over each term's latest version that is active but not yet cut over.
+
+    Returns a list of ``(version, users recorded)`` pairs.
+    """
+    now = now or timezone.now()
+    # The latest versions are picked first: filtering the DISTINCT ON query
+    # would pick the latest version not yet cut over, which may be an older
+    # one the current version replaced.
+    due = TermVersion.objects.filter(
+        pk__in=latest_term_versions_at(now).values("pk"),
+        cut_over_at__isnull=True,
+    )
+    return [
+        (version, cut_over_term_version(version, now=now))
+        for version in due.select_related("term")
+    ]
@@ -6,7 +6,7 @@ from urllib.parse import urlencode
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 
-from ams.terms.helpers import get_pending_term_versions_for_user
+from ams.terms.helpers import user_has_pending_terms
 
 
 def terms_required(view_func):
@@ -28,16 +28,13 @@ def terms_required(view_func):
 
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
-        # Only check for authenticated users
-        if request.user.is_authenticated:
-            pending_versions = get_pending_term_versions_for_user(request.user)
-
-            if pending_versions:
-                # Build redirect URL with 'next' parameter
-                next_url = request.get_full_path()
-                accept_url = reverse("terms:accept")
-                redirect_url = f"{accept_url}?{urlencode({'next': next_url})}"
-                return HttpResponseRedirect(redirect_url)
+        # Anonymous users never have pending terms
+        if user_has_pending_terms(request.user):
+            # Build redirect URL with 'next' parameter
+            next_url = request.get_full_path()
+            accept_url = reverse("terms:accept")
+            redirect_url = f"{accept_url}?{urlencode({'next': next_url})}"
+            return HttpResponseRedirect(redirect_url)
 
         return view_func(request, *args, **kwargs)
 
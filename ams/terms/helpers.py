@@ -1,15 +1,186 @@
-"""Helper functions for terms and conditions."""
-
+"""Helper functions for terms and conditions.
+
+Terms are checked on every request to a protected view, so the check is
+cached in the "pages" cache. The terms epoch is the set of ids of the latest
+current version of each term; it is stored until a term version changes
+(see ams/terms/signals.py) or a scheduled version becomes active. Each
+user's pending versions are stored against the epoch they were worked out
+for, for up to an hour or until that user next accepts a version. The check
+usually costs one cache lookup, which is still one SELECT, since the "pages"
+cache is database-backed in production.
+"""
+
+import math
 from typing import TYPE_CHECKING
 
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Min
 from django.utils import timezone
 
+from ams.cms.page_cache import PAGE_CACHE_ALIAS
+from ams.terms.models import PendingTermAcceptance
 from ams.terms.models import TermAcceptance
 from ams.terms.models import TermVersion
 
 if TYPE_CHECKING:
     from ams.users.models import User
 
+TERMS_CACHE_ALIAS = PAGE_CACHE_ALIAS
+TERMS_EPOCH_KEY = "terms_epoch"
+USER_TERMS_TIMEOUT = 60 * 60
+
+
+def _user_terms_key(user_id):
+    return f"terms_pending_user{user_id}"
+
+
+def latest_term_versions_at(now):
+    """Return the latest version of each term current at ``now``.
+
+    Postgres picks each term's version with DISTINCT ON, rather than every
+    current version being loaded and reduced in Python. Ties on date_active
+    go to the version created last, as in the model's ordering.
+    """
+    return (
+        TermVersion.objects.filter(is_active=True, date_active__lte=now)
+        .order_by("term_id", "-date_active", "-created_at")
+        .distinct("term_id")
+    )
+
+
+def get_terms_epoch() -> "frozenset[int]":
+    """
+    Get the ids of the latest current version of each term.
+
+    Costs one cache lookup, or two queries when the epoch is not stored.
+    The stored epoch goes stale when the next scheduled version becomes
+    active, since no save marks that moment.
+    """
+    return _epoch_from(caches[TERMS_CACHE_ALIAS].get(TERMS_EPOCH_KEY))
+
+
+def _epoch_from(entry):
+    """Return the epoch in a stored entry, or work it out if it is stale."""
+    now = timezone.now()
+    if entry is not None and (entry["stale_at"] is None or now < entry["stale_at"]):
+        return entry["epoch"]
+    epoch = frozenset(latest_term_versions_at(now).values_list("pk", flat=True))
+    stale_at = TermVersion.objects.filter(
+        is_active=True,
+        date_active__gt=now,
+    ).aggregate(stale_at=Min("date_active"))["stale_at"]
+    timeout = (
+        None
+        if stale_at is None
+        else max(1, math.ceil((stale_at - now).total_seconds()))
+    )
+    caches[TERMS_CACHE_ALIAS].set(
+        TERMS_EPOCH_KEY,
+        {"epoch": epoch, "stale_at": stale_at},
+        timeout=timeout,
+    )
+    return epoch
+
+
+def invalidate_terms_epoch():
+    """Make the stored terms epoch stale, so it is worked out again."""
+    caches[TERMS_CACHE_ALIAS].delete(TERMS_EPOCH_KEY)
+
+
+def invalidate_user_terms(user_id):
+    """Make a user's stored pending term versions stale."""
+    caches[TERMS_CACHE_ALIAS].delete(_user_terms_key(user_id))
+
+
+def record_term_acceptances(
+    user: "User",
+    term_versions: "list[TermVersion]",
+    *,
+    ip_address: str,
+    user_agent: str,
+    source: str = "web",
+) -> None:
+    """
+    Record that a user accepted some term versions.
+
+    The acceptances are inserted together, and versions the user already
+    accepted (e.g. in another tab) are skipped by the database rather than
+    looked up first. The user's pending rows for them are removed, and their
+    stored pending versions made stale, as bulk inserts send no signals.
+
+    Args:
+        user: The User who accepted
+        term_versions: The TermVersions they accepted
+        ip_address: IP address the acceptance came from
+        user_agent: Browser user agent string, truncated for storage
+        source: Source of acceptance (e.g., 'web', 'api', 'sso')
+    """
+    TermAcceptance.objects.bulk_create(
+        [
+            TermAcceptance(
+                user=user,
+                term_version=term_version,
+                ip_address=ip_address,
+                user_agent=user_agent[:500],
+                source=source,
+            )
+            for term_version in term_versions
+        ],
+        ignore_conflicts=True,
+    )
+    PendingTermAcceptance.objects.filter(
+        user=user,
+        term_version__in=term_versions,
+    ).delete()
+    invalidate_user_terms(user.pk)
+    transaction.on_commit(lambda: invalidate_user_terms(user.pk))
+
+
+def user_has_pending_terms(user: "User") -> bool:
+    """
+    Check whether a user has term versions still to accept.
+
+    Used on every request to a protected view. When the terms epoch and the
+    user's pending versions for it are stored, this costs a single cache
+    lookup (one SELECT on the database cache). Otherwise the user's
+    acceptances of the epoch's versions are fetched with one query and
+    stored for up to USER_TERMS_TIMEOUT seconds.
+
+    Args:
+        user: The User instance to check
+
+    Returns:
+        bool: True if the user must accept terms before going on
+    """
+    # Anonymous users don't need to accept terms
+    if not user.is_authenticated:
+        return False
+
+    cache = caches[TERMS_CACHE_ALIAS]
+    user_key = _user_terms_key(user.pk)
+    cached = cache.get_many([TERMS_EPOCH_KEY, user_key])
+    epoch = _epoch_from(cached.get(TERMS_EPOCH_KEY))
+
+    coverage = cached.get(user_key)
+    if coverage is not None and coverage["epoch"] == epoch:
+        return bool(coverage["pending"])
+
+    pending = epoch
+    if epoch:
+        pending = epoch - set(
+            TermAcceptance.objects.filter(
+                user=user,
+                term_version_id__in=epoch,
+            ).values_list("term_version_id", flat=True),
+        )
+    cache.set(
+        user_key,
+        {"epoch": epoch, "pending": pending},
+        timeout=USER_TERMS_TIMEOUT,
+    )
+    return bool(pending)
+
 
 def get_pending_term_versions_for_user(user: "User") -> "list[TermVersion]":
     """
@@ -42,31 +213,16 @@ def get_pending_term_versions_for_user(user: "User") -> "list[TermVersion]":
     if not user.is_authenticated:
         return []
 
-    now = timezone.now()
-
-    # Get all current (active and enforceable) term versions
-    current_versions = TermVersion.objects.filter(
-        is_active=True,
-        date_active__lte=now,
-    ).select_related("term")
-
-    # Group versions by term and get the latest version for each term
-    # Latest = most recent date_active
-    latest_versions_by_term = {}
-    for version in current_versions:
-        term_id = version.term_id
-        if (
-            term_id not in latest_versions_by_term
-            or version.date_active > latest_versions_by_term[term_id].date_active
-        ):
-            latest_versions_by_term[term_id] = version
-
-    # Get only the latest versions
-    latest_versions = list(latest_versions_by_term.values())
+    latest_versions = list(
+        latest_term_versions_at(timezone.now()).select_related("term"),
+    )
 
     # Get all term versions this user has already accepted
     accepted_version_ids = set(
-        TermAcceptance.objects.filter(user=user).values_list(
+        TermAcceptance.objects.filter(
+            user=user,
+            term_version__in=latest_versions,
+        ).values_list(
             "term_version_id",
             flat=True,
         ),
@@ -102,27 +258,9 @@ def get_latest_term_versions() -> "list[TermVersion]":
     Returns:
         List of TermVersion instances (latest version per term)
     """
-    now = timezone.now()
-
-    # Get all current (active and enforceable) term versions
-    current_versions = TermVersion.objects.filter(
-        is_active=True,
-        date_active__lte=now,
-    ).select_related("term")
-
-    # Group versions by term and get the latest version for each term
-    # Latest = most recent date_active
-    latest_versions_by_term = {}
-    for version in current_versions:
-        term_id = version.term_id
-        if (
-            term_id not in latest_versions_by_term
-            or version.date_active > latest_versions_by_term[term_id].date_active
-        ):
-            latest_versions_by_term[term_id] = version
-
-    # Get only the latest versions
-    latest_versions = list(latest_versions_by_term.values())
+    latest_versions = list(
+        latest_term_versions_at(timezone.now()).select_related("term"),
+    )
 
     # Sort deterministically by term.key
     latest_versions.sort(key=lambda v: v.term.key)
@@ -0,0 +1,24 @@
+"""Module for the custom Django cut_over_terms command."""
+
+from django.core import management
+
+from ams.terms.cutover import cut_over_due_term_versions
+from ams.utils.management.commands._constants import LOG_HEADER
+
+
+class Command(management.base.BaseCommand):
+    """Required command class for the cut_over_terms command."""
+
+    help = (
+        "Record the users who still have to accept each term version that has "
+        "become active since the last run, for acceptance progress reporting. "
+        "Run regularly, e.g. every few minutes from cron."
+    )
+
+    def handle(self, *args, **options):
+        """Automatically called when the cut_over_terms command is given."""
+        self.stdout.write(LOG_HEADER.format("📜 Cut over term versions"))
+        cut_over = cut_over_due_term_versions()
+        for version, count in cut_over:
+            self.stdout.write(f"Recorded {count} users pending for {version}.")
+        self.stdout.write(f"✅ Cut over {len(cut_over)} term versions.")
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.16 on 2026-10-19 01:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('terms', '0003_backfill_name_content_english'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='termversion',
+            name='cut_over_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When the users still to accept this version were recorded, once it became active (see the cut_over_terms command).', null=True),
+        ),
+        migrations.CreateModel(
+            name='PendingTermAcceptance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('term_version', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_acceptances', to='terms.termversion')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_term_acceptances', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Pending Term Acceptance',
+                'verbose_name_plural': 'Pending Term Acceptances',
+                'indexes': [models.Index(fields=['user'], name='terms_pendi_user_id_06589d_idx')],
+                'constraints': [models.UniqueConstraint(fields=('term_version', 'user'), name='unique_pending_term_version_user')],
+            },
+        ),
+    ]
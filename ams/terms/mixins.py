@@ -5,7 +5,7 @@ from urllib.parse import urlencode
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 
-from ams.terms.helpers import get_pending_term_versions_for_user
+from ams.terms.helpers import user_has_pending_terms
 
 
 class TermsRequiredMixin:
@@ -25,15 +25,12 @@ class TermsRequiredMixin:
 
     def dispatch(self, request, *args, **kwargs):
         """Check for pending terms before allowing access."""
-        # Only check for authenticated users
-        if request.user.is_authenticated:
-            pending_versions = get_pending_term_versions_for_user(request.user)
-
-            if pending_versions:
-                # Build redirect URL with 'next' parameter
-                next_url = request.get_full_path()
-                accept_url = reverse("terms:accept")
-                redirect_url = f"{accept_url}?{urlencode({'next': next_url})}"
-                return HttpResponseRedirect(redirect_url)
+        # Anonymous users never have pending terms
+        if user_has_pending_terms(request.user):
+            # Build redirect URL with 'next' parameter
+            next_url = request.get_full_path()
+            accept_url = reverse("terms:accept")
+            redirect_url = f"{accept_url}?{urlencode({'next': next_url})}"
+            return HttpResponseRedirect(redirect_url)
 
         return super().dispatch(request, *args, **kwargs)
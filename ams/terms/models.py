@@ -128,6 +128,15 @@ class TermVersion(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    cut_over_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_(
+            "When the users still to accept this version were recorded, once "
+            "it became active (see the cut_over_terms command).",
+        ),
+    )
 
     panels = [
         HelpPanel(
@@ -232,3 +241,41 @@ class TermAcceptance(models.Model):
 
     def __str__(self):
         return f"{self.user.email} accepted {self.term_version} on {self.accepted_at}"
+
+
+class PendingTermAcceptance(models.Model):
+    """
+    Records that a user still has to accept a TermVersion.
+
+    Filled in by the cut_over_terms command when a version becomes active,
+    for the users active at that time, and emptied as they accept it. Used
+    to report acceptance progress without counting every user's acceptances.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="pending_term_acceptances",
+    )
+    term_version = models.ForeignKey(
+        "TermVersion",
+        on_delete=models.CASCADE,
+        related_name="pending_acceptances",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Pending Term Acceptance")
+        verbose_name_plural = _("Pending Term Acceptances")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["term_version", "user"],
+                name="unique_pending_term_version_user",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user"]),  # For clearing a user's rows
+        ]
+
+    def __str__(self):
+        return f"{self.user.email} has not accepted {self.term_version}"
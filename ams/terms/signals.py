@@ -0,0 +1,33 @@
+"""Signals keeping the stored terms checks current (see ams/terms/helpers.py)."""
+
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from ams.terms.helpers import invalidate_terms_epoch
+from ams.terms.helpers import invalidate_user_terms
+from ams.terms.models import TermAcceptance
+from ams.terms.models import TermVersion
+
+
+@receiver(post_save, sender=TermVersion)
+@receiver(post_delete, sender=TermVersion)
+def invalidate_terms_epoch_on_change(sender, **kwargs):
+    """
+    Work the terms epoch out again when a term version changes.
+
+    The epoch is dropped straight away and again on commit, so a request
+    that read the old versions while the change was being saved can't leave
+    them stored.
+    """
+    invalidate_terms_epoch()
+    transaction.on_commit(invalidate_terms_epoch)
+
+
+@receiver(post_save, sender=TermAcceptance)
+@receiver(post_delete, sender=TermAcceptance)
+def invalidate_user_terms_on_acceptance(sender, instance, **kwargs):
+    """Work a user's pending term versions out again when they accept one."""
+    invalidate_user_terms(instance.user_id)
+    transaction.on_commit(lambda: invalidate_user_terms(instance.user_id))
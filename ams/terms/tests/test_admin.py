@@ -8,7 +8,9 @@ from django.test import Client
 from django.test import RequestFactory
 
 from ams.terms.admin import TermVersionAdmin
+from ams.terms.cutover import cut_over_term_version
 from ams.terms.models import TermVersion
+from ams.users.tests.factories import UserFactory
 
 from .factories import TermAcceptanceFactory
 from .factories import TermFactory
@@ -116,3 +118,28 @@ class TestTermVersionAdminDeletion:
 
         # Object should still exist
         assert TermVersion.objects.filter(pk=version.pk).exists()
+
+
+class TestTermVersionAdminProgress:
+    """Test the acceptance progress shown in the TermVersion admin."""
+
+    def _progress(self, version):
+        admin = TermVersionAdmin(TermVersion, AdminSite())
+        request = RequestFactory().get("/")
+        return admin.acceptance_progress(
+            admin.get_queryset(request).get(pk=version.pk),
+        )
+
+    def test_progress_unknown_before_cut_over(self):
+        """Progress is only shown once pending users have been recorded."""
+        version = TermVersionFactory()
+        assert self._progress(version) == "-"
+
+    def test_progress_counts_accepted_and_pending_users(self):
+        """Progress counts acceptances against the recorded pending users."""
+        version = TermVersionFactory()
+        TermAcceptanceFactory(term_version=version)
+        UserFactory.create_batch(3)
+        cut_over_term_version(version)
+
+        assert self._progress(version) == "1 accepted, 3 pending (25%)"
@@ -0,0 +1,94 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from ams.terms.models import PendingTermAcceptance
+from ams.terms.tests.factories import TermAcceptanceFactory
+from ams.terms.tests.factories import TermVersionFactory
+from ams.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _pending(version):
+    return set(
+        PendingTermAcceptance.objects.filter(term_version=version).values_list(
+            "user_id",
+            flat=True,
+        ),
+    )
+
+
+class TestCutOverTermsCommand:
+    def test_records_active_users_who_have_not_accepted(self):
+        pending_user = UserFactory()
+        accepted_user = UserFactory()
+        inactive_user = UserFactory(is_active=False)
+        version = TermVersionFactory()
+        TermAcceptanceFactory(user=accepted_user, term_version=version)
+
+        call_command("cut_over_terms", stdout=StringIO())
+
+        pending = _pending(version)
+        assert pending_user.pk in pending
+        assert accepted_user.pk not in pending
+        assert inactive_user.pk not in pending
+        version.refresh_from_db()
+        assert version.cut_over_at is not None
+
+    def test_skips_versions_not_yet_active(self):
+        UserFactory()
+        version = TermVersionFactory(date_active=timezone.now() + timedelta(days=1))
+
+        call_command("cut_over_terms", stdout=StringIO())
+
+        assert _pending(version) == set()
+        version.refresh_from_db()
+        assert version.cut_over_at is None
+
+    def test_cuts_each_version_over_once(self):
+        UserFactory()
+        version = TermVersionFactory()
+        call_command("cut_over_terms", stdout=StringIO())
+        late_user = UserFactory()
+
+        out = StringIO()
+        call_command("cut_over_terms", stdout=out)
+
+        assert late_user.pk not in _pending(version)
+        assert "Cut over 0 term versions" in out.getvalue()
+
+    def test_replaces_pending_rows_of_earlier_versions(self):
+        user = UserFactory()
+        old_version = TermVersionFactory(
+            version="1.0",
+            date_active=timezone.now() - timedelta(days=2),
+        )
+        call_command("cut_over_terms", stdout=StringIO())
+        new_version = TermVersionFactory(term=old_version.term, version="2.0")
+
+        call_command("cut_over_terms", stdout=StringIO())
+
+        assert _pending(old_version) == set()
+        assert user.pk in _pending(new_version)
+
+    def test_older_version_is_not_cut_over_on_a_later_run(self):
+        user = UserFactory()
+        old_version = TermVersionFactory(
+            version="1.0",
+            date_active=timezone.now() - timedelta(days=2),
+        )
+        new_version = TermVersionFactory(term=old_version.term, version="2.0")
+
+        call_command("cut_over_terms", stdout=StringIO())
+        out = StringIO()
+        call_command("cut_over_terms", stdout=out)
+
+        assert user.pk in _pending(new_version)
+        assert _pending(old_version) == set()
+        old_version.refresh_from_db()
+        assert old_version.cut_over_at is None
+        assert "Cut over 0 term versions" in out.getvalue()
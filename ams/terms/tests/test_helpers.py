@@ -2,13 +2,20 @@
 
 from datetime import timedelta
 from unittest.mock import Mock
+from unittest.mock import patch
 
 import pytest
 from django.core.cache import cache
+from django.core.management import call_command
 from django.utils import timezone
 
 from ams.terms.helpers import get_latest_term_versions
 from ams.terms.helpers import get_pending_term_versions_for_user
+from ams.terms.helpers import get_terms_epoch
+from ams.terms.helpers import record_term_acceptances
+from ams.terms.helpers import user_has_pending_terms
+from ams.terms.models import PendingTermAcceptance
+from ams.terms.models import TermAcceptance
 from ams.terms.tests.factories import TermAcceptanceFactory
 from ams.terms.tests.factories import TermFactory
 from ams.terms.tests.factories import TermVersionFactory
@@ -450,3 +457,167 @@ class TestGetLatestTermVersions:
         assert len(result) == expected_terms
         assert result[0] == version_a2  # Latest for term A
         assert result[1] == version_b3  # Latest for term B
+
+
+class TestUserHasPendingTerms:
+    """Tests for the cached user_has_pending_terms check."""
+
+    def test_returns_false_for_anonymous_users(self):
+        """Test that anonymous users never have pending terms."""
+        assert user_has_pending_terms(Mock(is_authenticated=False)) is False
+
+    def test_agrees_with_pending_versions(self):
+        """Test the check against the full pending versions helper."""
+        user = UserFactory()
+        version = TermVersionFactory(
+            is_active=True,
+            date_active=timezone.now() - timedelta(days=1),
+        )
+        assert user_has_pending_terms(user) is True
+        assert get_pending_term_versions_for_user(user) == [version]
+
+        TermAcceptanceFactory(user=user, term_version=version)
+
+        assert user_has_pending_terms(user) is False
+        assert get_pending_term_versions_for_user(user) == []
+
+    def test_warm_check_is_answered_from_the_cache(self, django_assert_num_queries):
+        """Test that a repeat check is answered from the cache."""
+        user = UserFactory()
+        TermVersionFactory(
+            is_active=True,
+            date_active=timezone.now() - timedelta(days=1),
+        )
+        user_has_pending_terms(user)
+
+        with django_assert_num_queries(0):
+            assert user_has_pending_terms(user) is True
+
+    def test_warm_check_is_one_query_on_the_database_cache(
+        self,
+        settings,
+        django_assert_num_queries,
+    ):
+        """Test that the production cache backend answers with one SELECT."""
+        settings.CACHES = {
+            **settings.CACHES,
+            "pages": {
+                "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                "LOCATION": "test_terms_cache",
+            },
+        }
+        call_command("createcachetable", "--database", "default")
+        user = UserFactory()
+        TermVersionFactory(
+            is_active=True,
+            date_active=timezone.now() - timedelta(days=1),
+        )
+        user_has_pending_terms(user)
+
+        with django_assert_num_queries(1):
+            assert user_has_pending_terms(user) is True
+
+    def test_new_version_makes_users_accept_again(self):
+        """Test that activating a new version changes the epoch."""
+        user = UserFactory()
+        version = TermVersionFactory(
+            is_active=True,
+            date_active=timezone.now() - timedelta(days=2),
+        )
+        TermAcceptanceFactory(user=user, term_version=version)
+        assert user_has_pending_terms(user) is False
+
+        new_version = TermVersionFactory(
+            term=version.term,
+            version="2.0",
+            is_active=False,
+            date_active=timezone.now() - timedelta(days=1),
+        )
+        assert user_has_pending_terms(user) is False
+
+        new_version.is_active = True
+        new_version.save()
+
+        assert get_terms_epoch() == {new_version.pk}
+        assert user_has_pending_terms(user) is True
+
+    def test_scheduled_version_applies_when_it_becomes_active(self):
+        """Test that the stored epoch goes stale at the next activation."""
+        user = UserFactory()
+        now = timezone.now()
+        version = TermVersionFactory(
+            is_active=True,
+            date_active=now + timedelta(hours=1),
+        )
+        assert user_has_pending_terms(user) is False
+
+        with patch(
+            "ams.terms.helpers.timezone.now",
+            return_value=now + timedelta(hours=2),
+        ):
+            assert get_terms_epoch() == {version.pk}
+            assert user_has_pending_terms(user) is True
+
+    def test_epoch_picks_the_latest_version_created_on_a_tie(self):
+        """Test that DISTINCT ON breaks activation-date ties like the model."""
+        term = TermFactory()
+        date_active = timezone.now() - timedelta(days=1)
+        TermVersionFactory(
+            term=term,
+            version="1.0",
+            is_active=True,
+            date_active=date_active,
+        )
+        later = TermVersionFactory(
+            term=term,
+            version="1.1",
+            is_active=True,
+            date_active=date_active,
+        )
+
+        assert get_terms_epoch() == {later.pk}
+
+
+class TestRecordTermAcceptances:
+    """Tests for record_term_acceptances helper."""
+
+    def test_records_versions_together_skipping_accepted_ones(
+        self,
+        django_assert_max_num_queries,
+    ):
+        """Test that acceptances are inserted in bulk, ignoring duplicates."""
+        user = UserFactory()
+        accepted, first, second = TermVersionFactory.create_batch(3)
+        TermAcceptanceFactory(user=user, term_version=accepted)
+
+        with django_assert_max_num_queries(2):
+            record_term_acceptances(
+                user,
+                [accepted, first, second],
+                ip_address="127.0.0.1",
+                user_agent="Browser",
+            )
+
+        assert set(
+            TermAcceptance.objects.filter(user=user).values_list(
+                "term_version_id",
+                flat=True,
+            ),
+        ) == {accepted.pk, first.pk, second.pk}
+
+    def test_clears_pending_rows_and_stored_check(self):
+        """Test that the user's pending rows and stored check are cleared."""
+        user = UserFactory()
+        version = TermVersionFactory()
+        PendingTermAcceptance.objects.create(user=user, term_version=version)
+        assert user_has_pending_terms(user) is True
+
+        record_term_acceptances(
+            user,
+            [version],
+            ip_address="127.0.0.1",
+            user_agent="Browser",
+        )
+
+        assert not PendingTermAcceptance.objects.filter(user=user).exists()
+        assert user_has_pending_terms(user) is False
@@ -11,7 +11,7 @@ from django.views.decorators.http import require_http_methods
 from ams.terms.forms import TermAcceptanceForm
 from ams.terms.helpers import get_latest_term_versions
 from ams.terms.helpers import get_pending_term_versions_for_user
-from ams.terms.models import TermAcceptance
+from ams.terms.helpers import record_term_acceptances
 
 
 def _is_safe_redirect_url(url):
@@ -73,18 +73,14 @@ def accept_terms_view(request):
     if request.method == "POST":
         form = TermAcceptanceForm(request.POST, term_version=term_version)
         if form.is_valid():
-            # Record acceptance (or get existing if already accepted)
-            # Using get_or_create prevents UniqueViolation if user already accepted
-            # this term (e.g., via another tab, cached data, or race condition)
-            TermAcceptance.objects.get_or_create(
-                user=request.user,
-                term_version=term_version,
-                defaults={
-                    "ip_address": get_client_ip(request),
-                    # Truncate for safety
-                    "user_agent": request.headers.get("user-agent", "")[:500],
-                    "source": "web",
-                },
+            # Record acceptance (skipped if already accepted, e.g. via
+            # another tab, cached data, or race condition)
+            record_term_acceptances(
+                request.user,
+                [term_version],
+                ip_address=get_client_ip(request),
+                user_agent=request.headers.get("user-agent", ""),
+                source="web",
             )
 
             # Redirect to self with same 'next' parameter
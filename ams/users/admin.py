@@ -11,6 +11,7 @@ from django.utils.translation import gettext_lazy as _
 
 from ams.memberships.models import IndividualMembership
 from ams.memberships.models import MembershipStatus
+from ams.memberships.models import OrganisationMembership
 from ams.organisations.models import OrganisationMember
 from ams.users.forms import UserAdminChangeForm
 from ams.users.forms import UserAdminCreationForm
@@ -210,19 +211,20 @@ class UserAdmin(auth_admin.UserAdmin):
             "profile_responses__profile_field",
             Prefetch(
                 "individual_memberships",
-                queryset=IndividualMembership.objects.select_related(
-                    "membership_option",
-                ).order_by("-created_datetime"),
+                queryset=IndividualMembership.objects.with_status()
+                .select_related("membership_option")
+                .order_by("-created_datetime"),
             ),
             Prefetch(
                 "organisation_members",
                 queryset=OrganisationMember.objects.active()
                 .select_related("organisation")
-                .prefetch_related(
-                    "organisation__organisation_memberships__membership_option",
-                )
                 .order_by("-created_datetime"),
             ),
+            Prefetch(
+                "organisation_members__organisation__organisation_memberships",
+                queryset=OrganisationMembership.objects.with_status(),
+            ),
         )
 
         # Translators: Column headers for the admin CSV user export.
@@ -266,7 +268,7 @@ class UserAdmin(auth_admin.UserAdmin):
                 ind_memberships = list(user.individual_memberships.all())
                 if ind_memberships:
                     ind = ind_memberships[0]
-                    ind_status = ind.status()
+                    ind_status = ind.membership_status
                     ind_option = ind.membership_option.name
                     ind_start = ind.start_date
                     ind_expiry = ind.expiry_date
@@ -282,10 +284,14 @@ class UserAdmin(auth_admin.UserAdmin):
                     org_member = org_members[0]
                     org_name = org_member.organisation.name
                     org_role = org_member.get_role_display()
-                    org_membership = org_member.organisation.get_active_membership()
                     org_status = (
-                        org_membership.status()
-                        if org_membership
+                        MembershipStatus.ACTIVE
+                        if any(
+                            membership.membership_status == MembershipStatus.ACTIVE
+                            for membership in (
+                                org_member.organisation.organisation_memberships.all()
+                            )
+                        )
                         else MembershipStatus.NONE
                     )
                 else:
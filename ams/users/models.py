@@ -135,8 +135,10 @@ class User(AbstractUser):
         return self.organisation_members.filter(
             accepted_datetime__isnull=False,
             declined_datetime__isnull=True,
+            revoked_datetime__isnull=True,
             user__is_active=True,
             organisation__is_active=True,
+            organisation__organisation_memberships__approved_datetime__isnull=False,
             organisation__organisation_memberships__cancelled_datetime__isnull=True,
             organisation__organisation_memberships__start_date__lte=timezone.localdate(),
             organisation__organisation_memberships__expiry_date__gt=timezone.localdate(),
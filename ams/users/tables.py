@@ -23,7 +23,8 @@ class MembershipTable(Table):
         verbose_name=_("Duration"),
     )
     status = MembershipStatusBadgeColumn(
-        accessor="status",
+        # Annotated by with_status(), so the table orders by status in SQL
+        accessor="membership_status",
         # Translators: Column header — current membership status (e.g. Active, Expired)
         verbose_name=_("Status"),
     )
@@ -499,6 +499,36 @@ class TestUserMembershipMethods:
 
         assert user.has_active_organisation_membership() is False
 
+    def test_has_active_organisation_membership_excludes_revoked_member(self):
+        """Test returns False when the user's org membership was revoked."""
+        org_membership = OrganisationMembershipFactory(active=True)
+        org = org_membership.organisation
+
+        # Create user as a member of that org who was later revoked
+        org_member = OrganisationMemberFactory(
+            organisation=org,
+            accepted_datetime=timezone.now(),
+            revoked_datetime=timezone.now(),
+        )
+        user = org_member.user
+
+        assert user.has_active_organisation_membership() is False
+
+    def test_has_active_organisation_membership_excludes_unapproved_org(self):
+        """Test returns False when org membership is not yet approved."""
+        # Create org with a current but unapproved membership
+        org_membership = OrganisationMembershipFactory(pending=True)
+        org = org_membership.organisation
+
+        # Create user as member of that org
+        org_member = OrganisationMemberFactory(
+            organisation=org,
+            accepted_datetime=timezone.now(),
+        )
+        user = org_member.user
+
+        assert user.has_active_organisation_membership() is False
+
     def test_check_has_active_membership_core_individual(self):
         """Test core check returns True for individual membership."""
         membership = IndividualMembershipFactory(active=True)
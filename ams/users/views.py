@@ -23,6 +23,7 @@ from ams.users.models import User
 from ams.users.tables import MembershipTable
 from ams.users.tables import OrganisationTable
 from ams.users.tables import PendingInvitationTable
+from ams.utils.mixins import BreadcrumbObjectMixin
 from ams.utils.permissions import user_has_active_membership
 
 
@@ -30,6 +31,7 @@ class UserDetailView(
     LoginRequiredMixin,
     UserSelfOrStaffMixin,
     TermsRequiredMixin,
+    BreadcrumbObjectMixin,
     DetailView,
 ):
     model = User
@@ -40,7 +42,7 @@ class UserDetailView(
         context = super().get_context_data(**kwargs)
         user = self.object
         memberships = (
-            user.individual_memberships.all()
+            user.individual_memberships.with_status()
             .prefetch_related("invoices")
             .order_by("-start_date")
         )
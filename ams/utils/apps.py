@@ -10,3 +10,6 @@ class UtilsConfig(AppConfig):
     def ready(self):
         """Import signal handlers when the app is ready."""
         import ams.utils.signals  # noqa: F401, PLC0415
+        from ams.utils.image_specs import connect_image_spec_signals  # noqa: PLC0415
+
+        connect_image_spec_signals()
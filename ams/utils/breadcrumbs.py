@@ -1,6 +1,14 @@
-"""Breadcrumb functionality for Django pages."""
+"""Breadcrumb functionality for Django pages.
+
+Labels of pages about an object (an event, a resource, an organisation) are
+the object's name. A detail view has already loaded its object, so it
+registers it on the request (register_breadcrumb_object(), or
+BreadcrumbObjectMixin in ams/utils/mixins.py) and the breadcrumbs reuse it.
+Other labels cost one query, for the object alone.
+"""
 
 import logging
+from operator import attrgetter
 from typing import TypedDict
 
 from django.contrib.auth import get_user_model
@@ -169,13 +177,34 @@ def _get_cached_value(request, cache_key, getter_func):
     return request.breadcrumb_cache[cache_key]
 
 
+def register_breadcrumb_object(request, obj):
+    """Let the breadcrumbs of ``request`` label ``obj`` without fetching it."""
+    if not hasattr(request, "breadcrumb_objects"):
+        request.breadcrumb_objects = {}
+    request.breadcrumb_objects[obj._meta.concrete_model] = obj  # noqa: SLF001
+
+
+def _object_label(request, model, label_of=attrgetter("name"), **lookup):
+    """Return the label of the ``model`` object matching ``lookup``.
+
+    Uses the object registered on the request if it matches, and only then
+    the database. Raises ``model.DoesNotExist`` if there is no such object.
+    """
+    [(field, value)] = lookup.items()
+    registered = getattr(request, "breadcrumb_objects", {}).get(model)
+    if registered is not None and str(getattr(registered, field)) == str(value):
+        return label_of(registered)
+
+    return str(label_of(model.objects.get(**lookup)))
+
+
 def _get_organisation_name(request, **kwargs):
     """Get organisation name for breadcrumb with caching and error handling."""
 
     def get_name():
         try:
             if org_uuid := kwargs.get("uuid"):
-                return Organisation.objects.get(uuid=org_uuid).name
+                return _object_label(request, Organisation, uuid=org_uuid)
         except Organisation.DoesNotExist:
             # Organisation not found; fall back to generic label.
             logger.debug(
@@ -193,8 +222,15 @@ def _get_user_dashboard_label(request, **kwargs):
     def get_name():
         try:
             if username := kwargs.get("username"):
-                user = User.objects.get(username=username)
-                return user.get_full_name()
+                user = getattr(request, "user", None)
+                if user is not None and user.username == username:
+                    return user.get_full_name()
+                return _object_label(
+                    request,
+                    User,
+                    label_of=User.get_full_name,
+                    username=username,
+                )
         except User.DoesNotExist:
             # User not found; fall back to generic label.
             logger.debug(
@@ -212,7 +248,7 @@ def _get_event_name(request, **kwargs):
     def get_name():
         try:
             if pk := kwargs.get("pk"):
-                return Event.objects.get(pk=pk).name
+                return _object_label(request, Event, pk=pk)
         except Event.DoesNotExist:
             # Event not found; fall back to generic label.
             logger.debug(
@@ -230,7 +266,7 @@ def _get_location_name(request, **kwargs):
     def get_name():
         try:
             if pk := kwargs.get("pk"):
-                return Location.objects.get(pk=pk).name
+                return _object_label(request, Location, pk=pk)
         except Location.DoesNotExist:
             # Location not found; fall back to generic label.
             logger.debug(
@@ -248,7 +284,7 @@ def _get_resource_name(request, **kwargs):
     def get_name():
         try:
             if pk := kwargs.get("pk"):
-                return Resource.objects.get(pk=pk).name
+                return _object_label(request, Resource, pk=pk)
         except Resource.DoesNotExist:
             logger.debug(
                 "Resource with pk=%s not found for breadcrumb label.",
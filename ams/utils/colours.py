@@ -38,7 +38,7 @@ def interpolate_colour(start_colour: str, end_colour: str, position: float) -> s
     sequential gradient across a category's tags — e.g. lightest to darkest for
     an ordered set like year levels, or yellow to red for an ascending numeric
     scale — driven by each tag's position in the category's existing display
-    order, with no state stored per tag.
+    order.
     """
     position = min(max(position, 0.0), 1.0)
     start_r, start_g, start_b = (
@@ -0,0 +1,117 @@
+"""Conditional GET for detail pages: ETags that vary with who is looking.
+
+A rendered detail page depends on more than its object: the header shows
+who is logged in, members see more than other visitors, and the theme and
+menus are the site's. A page's ETag therefore combines what the view knows
+about its object (a timestamp, and anything else shown with it) with
+request_validator_parts(). Each part is a cheap lookup, so a client
+revalidating an unchanged page gets a 304 Not Modified before the page's
+objects are fetched and rendered.
+
+Only If-None-Match is answered. Last-Modified is still sent, but the page's
+timestamp says nothing about who is looking, so a bare If-Modified-Since
+(after logging in, say) always gets the full page.
+
+ConditionalGetMixin (ams/utils/mixins.py) applies this to detail views, and
+ArticlePage.serve to articles.
+"""
+
+import hashlib
+from http import HTTPStatus
+
+from django.contrib.messages import get_messages
+from django.core.cache import caches
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date
+from django.utils.http import quote_etag
+from django.utils.translation import get_language
+from wagtail.models import Site
+
+from ams.cms.menu_cache import get_menu_cache_version
+from ams.cms.models import ThemeSettings
+from ams.cms.page_cache import PAGE_CACHE_ALIAS
+from ams.utils.permissions import user_has_active_membership
+
+
+def _theme_version(request, site):
+    # Kept in the shared "pages" cache (the default cache is disabled in
+    # production) and updated when the theme is saved (see
+    # ams/cms/signals.py), so only the first request after a cull queries the
+    # database. add() can't overwrite a newer version a save set meanwhile.
+    cache = caches[PAGE_CACHE_ALIAS]
+    key = f"theme_version_site{site.pk}"
+    version = cache.get(key)
+    if version is None:
+        version = ThemeSettings.for_request(request).cache_version
+        cache.add(key, version, timeout=None)
+    return version
+
+
+def request_validator_parts(request):
+    """Return what a rendered page depends on besides its own content.
+
+    These are the user and whether they have an active membership, the
+    language, and the site's theme and menu cache versions.
+    """
+    user = request.user
+    site = Site.find_for_request(request)
+    return [
+        user.pk,
+        user_has_active_membership(user),
+        get_language(),
+        site.pk if site else None,
+        _theme_version(request, site) if site else None,
+        get_menu_cache_version(site.pk) if site else None,
+    ]
+
+
+def make_etag(request, parts):
+    """Return an ETag for a page of ``request`` built from ``parts``."""
+    validator = repr([*parts, *request_validator_parts(request)])
+    return hashlib.sha256(validator.encode()).hexdigest()[:32]
+
+
+def is_conditional_request(request):
+    """Whether ``request`` is a GET that a 304 could answer.
+
+    Only requests with an If-None-Match qualify. Visitors with a pending
+    message, and previews, always get the page.
+    """
+    return (
+        request.method in ("GET", "HEAD")
+        and "if-none-match" in request.headers
+        and not getattr(request, "is_preview", False)
+        and not len(get_messages(request))
+    )
+
+
+def set_validators(request, response, etag, last_modified=None):
+    """Add the ETag and Last-Modified headers of a page to ``response``.
+
+    Browsers are asked to revalidate the page every time rather than guess
+    how long it stays fresh, and not to share a logged-in user's copy.
+    """
+    if response.status_code not in (HTTPStatus.OK, HTTPStatus.NOT_MODIFIED):
+        return response
+    response.headers["ETag"] = quote_etag(etag)
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+    if request.user.is_authenticated:
+        patch_cache_control(response, no_cache=True, private=True)
+    else:
+        patch_cache_control(response, no_cache=True)
+    return response
+
+
+def not_modified_response(request, etag, last_modified=None):
+    """Return a 304 response if the client's copy is current, otherwise None.
+
+    Only the ETag is compared; see the module docstring.
+    """
+    if "if-none-match" not in request.headers:
+        return None
+    response = get_conditional_response(request, etag=quote_etag(etag))
+    if response is None or response.status_code != HTTPStatus.NOT_MODIFIED:
+        return None
+    return set_validators(request, response, etag, last_modified)
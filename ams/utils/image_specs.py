@@ -0,0 +1,165 @@
+"""Pre-generation of imagekit spec files (thumbnails).
+
+Imagekit generates an ImageSpecField's file the first time a template asks for
+its URL: a storage download, a resize and an upload inside whichever request
+renders the page first. These helpers generate spec files ahead of time
+instead: on upload (see connect_image_spec_signals), through the same
+django_tasks task API as the CMS renditions, and in bulk with the
+warm_imagekit_specs command. Whether each file exists is recorded in the
+database-backed "imagekit" cache, so rendering reads that state rather than
+asking storage.
+"""
+
+from functools import cache
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_save
+from imagekit.cachefiles.backends import CacheFileState
+from imagekit.cachefiles.state import prefetch_cachefile_states
+from imagekit.models import ImageSpecField
+from imagekit.models.fields.utils import ImageSpecFileDescriptor
+
+# Formats offered for responsive image specs, best first. The last one is the
+# <img> fallback for browsers that support neither of the others.
+RESPONSIVE_IMAGE_FORMATS = (
+    ("AVIF", "image/avif"),
+    ("WEBP", "image/webp"),
+    ("JPEG", "image/jpeg"),
+)
+
+
+@cache
+def image_specs(model):
+    """Return ``{source field name: [spec attribute names]}`` for a model."""
+    specs = {}
+    for klass in reversed(model.__mro__):
+        for value in vars(klass).values():
+            if isinstance(value, ImageSpecFileDescriptor):
+                specs.setdefault(value.source_field_name, []).append(value.attname)
+    return specs
+
+
+def responsive_spec_attname(name, width, image_format):
+    return f"{name}_{width}_{image_format.lower()}"
+
+
+def add_responsive_image_specs(  # noqa: PLR0913
+    model,
+    name,
+    *,
+    source,
+    processor,
+    widths,
+    options=None,
+):
+    """Add an ImageSpecField to ``model`` for each width and responsive format.
+
+    Fields are named ``<name>_<width>_<format>`` (e.g. thumbnail_card_400_webp)
+    and ``processor(width)`` builds each one's resize. The widths are recorded
+    in ``model.responsive_image_specs`` for the responsive_image_spec tag.
+    """
+    for width in widths:
+        for image_format, _mime_type in RESPONSIVE_IMAGE_FORMATS:
+            model.add_to_class(
+                responsive_spec_attname(name, width, image_format),
+                ImageSpecField(
+                    source=source,
+                    processors=[processor(width)],
+                    format=image_format,
+                    options=options or {},
+                ),
+            )
+    model.responsive_image_specs = {
+        **getattr(model, "responsive_image_specs", {}),
+        name: tuple(widths),
+    }
+
+
+def responsive_spec_attnames(model, name):
+    return [
+        responsive_spec_attname(name, width, image_format)
+        for width in model.responsive_image_specs[name]
+        for image_format, _mime_type in RESPONSIVE_IMAGE_FORMATS
+    ]
+
+
+def models_with_image_specs():
+    return [model for model in apps.get_models() if image_specs(model)]
+
+
+def generate_image_specs(instance, *, force=False):
+    """Generate every spec file of ``instance`` that has a source image.
+
+    Returns the number of spec files that were generated. Files already
+    recorded as existing are skipped unless ``force`` is given.
+    """
+    generated = 0
+    for source_field_name, attnames in image_specs(type(instance)).items():
+        if not getattr(instance, source_field_name):
+            continue
+        for attname in attnames:
+            spec_file = getattr(instance, attname)
+            backend = spec_file.cachefile_backend
+            if not force and backend.get_state(spec_file) == CacheFileState.EXISTS:
+                continue
+            backend.generate_now(spec_file, force=True)
+            generated += 1
+    return generated
+
+
+def prefetch_image_spec_states(instances, *attnames):
+    """Load the stored state of many spec files in one cache lookup.
+
+    Only has an effect inside a request (see ImageSpecStateMiddleware), where
+    the states are kept for the spec files' later existence checks.
+    """
+    spec_files = []
+    for instance in instances:
+        specs = image_specs(type(instance))
+        spec_files.extend(
+            getattr(instance, attname)
+            for source_field_name, spec_attnames in specs.items()
+            if getattr(instance, source_field_name)
+            for attname in spec_attnames
+            if attname in attnames
+        )
+    prefetch_cachefile_states(spec_files)
+
+
+def _generate_on_upload(sender, instance, *, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    sources = image_specs(sender)
+    if update_fields is not None and not sources.keys() & set(update_fields):
+        return
+    # Imported here: the task module imports this one.
+    from ams.utils.tasks import generate_image_specs_task  # noqa: PLC0415
+
+    # Enqueued after commit so a rolled-back upload never leaves orphaned
+    # files. No task worker is deployed (see TASKS in config/settings/base.py),
+    # so the task runs at the end of the uploader's request.
+    transaction.on_commit(
+        partial(
+            generate_image_specs_task.enqueue,
+            sender._meta.label,  # noqa: SLF001
+            instance.pk,
+        ),
+        robust=True,
+    )
+
+
+def connect_image_spec_signals():
+    """Generate spec files whenever a model with image specs is saved.
+
+    Spec file names are derived from the source file name, so this only does
+    work for a newly uploaded image; otherwise the stored state says the
+    files already exist.
+    """
+    for model in models_with_image_specs():
+        post_save.connect(
+            _generate_on_upload,
+            sender=model,
+            dispatch_uid=f"generate_image_specs_{model._meta.label_lower}",  # noqa: SLF001
+        )
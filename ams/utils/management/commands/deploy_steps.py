@@ -13,6 +13,8 @@ class Command(management.base.BaseCommand):
     def handle(self, *args, **options):
         self.stdout.write(LOG_HEADER.format("💾 Migrate database"))
         management.call_command("migrate", interactive=False)
+        # Creates the database-backed "imagekit" cache table if missing.
+        management.call_command("createcachetable")
 
         management.call_command("setup_cms")
 
@@ -0,0 +1,102 @@
+"""Module for the custom Django warm_imagekit_specs command."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.core import management
+from django.db import connections
+from django.db.models import Q
+
+from ams.utils.image_specs import generate_image_specs
+from ams.utils.image_specs import image_specs
+from ams.utils.image_specs import models_with_image_specs
+from ams.utils.management.commands._constants import LOG_HEADER
+
+CHUNK_SIZE = 20
+
+
+def _init_worker():
+    django.setup()
+
+
+def _warm(model_label, pk, force):
+    """Generate one object's spec files; runs in a worker process.
+
+    Returns ``(generated count, error message or None)`` so that one missing
+    or unreadable source image doesn't stop the rest of the run.
+    """
+    model = apps.get_model(model_label)
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None:
+        return 0, None
+    try:
+        return generate_image_specs(instance, force=force), None
+    except Exception as error:  # noqa: BLE001
+        return 0, f"{model_label} {pk}: {error}"
+
+
+class Command(management.base.BaseCommand):
+    """Required command class for the warm_imagekit_specs command."""
+
+    help = (
+        "Generate every imagekit spec file (thumbnails) that does not exist yet, "
+        "across a pool of worker processes, and record them as existing so "
+        "page renders never need to check storage."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate spec files even if they are recorded as existing.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of worker processes. 0 generates in this process.",
+        )
+
+    def handle(self, *args, **options):
+        """Automatically called when the warm_imagekit_specs command is given."""
+        self.stdout.write(LOG_HEADER.format("🖼️ Warm imagekit specs"))
+        jobs = [
+            (model._meta.label, pk, options["force"])  # noqa: SLF001
+            for model in models_with_image_specs()
+            for pk in self._objects_with_sources(model)
+        ]
+        if options["workers"] > 0 and jobs:
+            # Worker processes open their own database connections; don't
+            # hand them this process's.
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options["workers"],
+                initializer=_init_worker,
+            ) as executor:
+                results = list(
+                    executor.map(_warm, *zip(*jobs, strict=True), chunksize=CHUNK_SIZE),
+                )
+        else:
+            results = [_warm(*job) for job in jobs]
+        errors = [error for _generated, error in results if error]
+        for error in errors:
+            self.stderr.write(f"❌ {error}")
+        generated = sum(generated for generated, _error in results)
+        self.stdout.write(
+            f"✅ Generated {generated} spec files for {len(jobs)} objects "
+            f"({len(errors)} failed).",
+        )
+
+    def _objects_with_sources(self, model):
+        has_source = Q()
+        for source_field_name in image_specs(model):
+            has_source |= Q(**{f"{source_field_name}__isnull": False}) & ~Q(
+                **{source_field_name: ""},
+            )
+        return list(
+            model.objects.filter(has_source)
+            .order_by("pk")
+            .values_list("pk", flat=True),
+        )
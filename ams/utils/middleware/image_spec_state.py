@@ -0,0 +1,19 @@
+from imagekit.cachefiles.state import use_cachefile_state_cache
+
+
+class ImageSpecStateMiddleware:
+    """
+    Keep imagekit spec file states in memory for the duration of a request.
+
+    Each existence check for a thumbnail otherwise costs a lookup in the
+    "imagekit" cache. Within a request, states are read once and reused, and
+    views can load them for a whole list at once with
+    ams.utils.image_specs.prefetch_image_spec_states().
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with use_cachefile_state_cache():
+            return self.get_response(request)
@@ -0,0 +1,68 @@
+from django.contrib.messages import get_messages
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from wagtail.models import Site
+
+from ams.cms.page_cache import cache_page_response
+from ams.cms.page_cache import get_cached_page
+from ams.cms.page_cache import page_cache_key
+
+
+class PageCacheMiddleware:
+    """
+    Serve anonymous GET requests for CMS pages from the page cache.
+
+    Only responses from pages that allow it (BasePage.is_page_cacheable), and
+    404s for paths no page answers (see page_not_found), are stored, and only
+    when they are the same for every anonymous visitor: no
+    CSRF token, cookie or session change. Visitors with a pending message
+    skip the cache so they see it. See ams/cms/page_cache.py.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not self._is_cacheable_request(request):
+            return self.get_response(request)
+        site = Site.find_for_request(request)
+        page_key = page_cache_key(request, site)
+        if page_key is None:
+            return self.get_response(request)
+        cached_response, version = get_cached_page(site, page_key)
+        if cached_response is not None:
+            # Revalidating clients get a 304 if the page's validators match.
+            return get_conditional_response(
+                request,
+                etag=cached_response.get("ETag"),
+                last_modified=parse_http_date_safe(
+                    cached_response.get("Last-Modified"),
+                ),
+                response=cached_response,
+            )
+        response = self.get_response(request)
+        if request.method == "GET" and self._is_cacheable_response(
+            request,
+            response,
+        ):
+            cache_page_response(page_key, response, version)
+        return response
+
+    @staticmethod
+    def _is_cacheable_request(request):
+        return (
+            request.method in ("GET", "HEAD")
+            and not request.user.is_authenticated
+            and not len(get_messages(request))
+        )
+
+    @staticmethod
+    def _is_cacheable_response(request, response):
+        session = getattr(request, "session", None)
+        return (
+            getattr(response, "page_cacheable", False)
+            and response.status_code in (200, 404)
+            and not response.cookies
+            and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+            and not (session is not None and session.modified)
+        )
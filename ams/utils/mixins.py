@@ -1,4 +1,14 @@
+from http import HTTPStatus
+
+from django.http import Http404
 from django.http import HttpResponsePermanentRedirect
+from django.views.generic.detail import SingleObjectMixin
+
+from ams.utils.breadcrumbs import register_breadcrumb_object
+from ams.utils.conditional_get import is_conditional_request
+from ams.utils.conditional_get import make_etag
+from ams.utils.conditional_get import not_modified_response
+from ams.utils.conditional_get import set_validators
 
 
 class RedirectToCosmeticURLMixin:
@@ -16,3 +26,80 @@ class RedirectToCosmeticURLMixin:
             return HttpResponsePermanentRedirect(canonical_url)
         context = self.get_context_data(object=self.object)
         return self.render_to_response(context)
+
+
+class ConditionalGetMixin:
+    """Answer conditional GETs of a detail view with 304 Not Modified.
+
+    The page's ETag combines the object's ``last_modified_field`` (also sent
+    as Last-Modified), get_etag_parts() and the request's own parts (see
+    ams/utils/conditional_get.py). When the request carries an If-None-Match,
+    the object is first looked up with only the fields these need, without
+    the view's select_related() and prefetch_related(), so an unchanged page
+    costs one narrow query. Views whose get_object() checks permissions
+    should check them in get_validator_object() too. Put it before
+    RedirectToCosmeticURLMixin.
+    """
+
+    last_modified_field = None
+    # Further fields of the object that get_etag_parts() reads.
+    validator_fields = ()
+
+    def get(self, request, *args, **kwargs):
+        if is_conditional_request(request):
+            obj = self.get_validator_object()
+            if obj is not None:
+                etag, last_modified = self.get_validators(obj)
+                response = not_modified_response(request, etag, last_modified)
+                if response is not None:
+                    self.object = obj
+                    return response
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == HTTPStatus.OK:
+            set_validators(request, response, *self.get_validators(self.object))
+        return response
+
+    def get_validator_object(self):
+        """Return the object with only its validator fields, or None if missing."""
+        fields = [
+            field
+            for field in (self.last_modified_field, *self.validator_fields)
+            if field
+        ]
+        queryset = (
+            self.get_queryset()
+            .select_related(None)
+            .prefetch_related(None)
+            .only("pk", *fields)
+        )
+        try:
+            # Skips the view's get_object(), which may check the object
+            # further; the ETag only matches a page the user was shown.
+            return SingleObjectMixin.get_object(self, queryset)
+        except Http404:
+            return None
+
+    def get_validators(self, obj):
+        """Return the ETag and Last-Modified time of the page of ``obj``."""
+        last_modified = (
+            getattr(obj, self.last_modified_field) if self.last_modified_field else None
+        )
+        label = obj._meta.label  # noqa: SLF001
+        parts = [label, obj.pk, last_modified, *self.get_etag_parts(obj)]
+        return make_etag(self.request, parts), last_modified
+
+    def get_etag_parts(self, obj):
+        """Return anything else the page of ``obj`` shows that may change."""
+        return []
+
+
+class BreadcrumbObjectMixin:
+    """Label the page's breadcrumbs with the object the view has loaded.
+
+    Registers the view's object on the request, so the breadcrumbs don't
+    fetch it again (see ams/utils/breadcrumbs.py).
+    """
+
+    def get_context_data(self, **kwargs):
+        register_breadcrumb_object(self.request, self.object)
+        return super().get_context_data(**kwargs)
@@ -0,0 +1,143 @@
+"""Keyset pagination for listings ordered by a date.
+
+Listings that grow without bound (articles, past events) page by a
+``(date, id)`` key rather than by offset, so a page deep in the archive costs
+the same single indexed query as the first one. A page is addressed by a
+cursor naming the object next to it, which keeps a URL showing the same
+objects as new ones are added.
+
+Cursors are relative to dates, whichever way a listing runs: ``before``
+gives the objects dated just before the cursor's object and ``after`` those
+just after it. A listing ordered newest first pages on with ``before``, and
+one ordered oldest first with ``after``.
+"""
+
+import datetime
+
+from django.db.models import Q
+
+CURSOR_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+
+def make_cursor(obj, field):
+    """Return the cursor for the objects next to ``obj`` by its ``field`` date."""
+    date = getattr(obj, field).astimezone(datetime.UTC)
+    return f"{date.strftime(CURSOR_DATE_FORMAT)}_{obj.pk}"
+
+
+def parse_cursor(value):
+    """Return the ``(date, id)`` in a cursor, or None if invalid."""
+    try:
+        date, pk = value.rsplit("_", 1)
+        return (
+            datetime.datetime.strptime(date, CURSOR_DATE_FORMAT).replace(
+                tzinfo=datetime.UTC,
+            ),
+            int(pk),
+        )
+    except (AttributeError, ValueError):
+        return None
+
+
+class KeysetPage:
+    """One page of objects from paginate_by_date().
+
+    Iterates over the page's objects in listing order. ``next_cursor``
+    addresses the following page and ``previous_cursor`` the preceding one,
+    or None at either end; see the module docstring for which query parameter
+    carries each.
+    """
+
+    def __init__(self, object_list, *, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+
+def paginate_by_date(  # noqa: PLR0913
+    queryset,
+    field,
+    *,
+    per_page,
+    descending=False,
+    before=None,
+    after=None,
+):
+    """Return one page of ``queryset`` ordered by ``(field, id)``, as a KeysetPage.
+
+    Without a cursor this is the first page. ``before`` and ``after`` take a
+    cursor string, and give the page of objects dated before or after the
+    cursor's object. An invalid cursor gives the first page, as does paging
+    back past it. Objects without a ``field`` date are left out.
+    """
+    queryset = queryset.exclude(**{f"{field}__isnull": True})
+    ascending_order = (field, "pk")
+    descending_order = (f"-{field}", "-pk")
+
+    def dated(key, *, later):
+        date, pk = key
+        lookup = "gt" if later else "lt"
+        # The OR alone can't bound an index scan, so Postgres would walk the
+        # index from the end and filter out every row before the cursor. The
+        # redundant bound on the date alone starts the scan at the cursor.
+        bound = Q(**{f"{field}__{lookup}e": date})
+        return bound & (
+            Q(**{f"{field}__{lookup}": date}) | Q(**{field: date, f"pk__{lookup}": pk})
+        )
+
+    # Whether each cursor pages forwards (on through the listing) or back.
+    forward, back = (before, after) if descending else (after, before)
+
+    back_key = parse_cursor(back) if back else None
+    if back_key is not None:
+        preceding = list(
+            queryset.filter(dated(back_key, later=descending)).order_by(
+                *(ascending_order if descending else descending_order),
+            )[: per_page + 1],
+        )
+        if len(preceding) > per_page:
+            object_list = preceding[:per_page][::-1]
+            return KeysetPage(
+                object_list,
+                next_cursor=make_cursor(object_list[-1], field),
+                previous_cursor=make_cursor(object_list[0], field),
+            )
+        # The preceding objects reach the first page, so show it instead.
+        forward = None
+
+    forward_key = parse_cursor(forward) if forward else None
+    listing = queryset.order_by(
+        *(descending_order if descending else ascending_order),
+    )
+    if forward_key is not None:
+        listing = listing.filter(dated(forward_key, later=not descending))
+    object_list = list(listing[: per_page + 1])
+    has_next = len(object_list) > per_page
+    object_list = object_list[:per_page]
+    return KeysetPage(
+        object_list,
+        next_cursor=make_cursor(object_list[-1], field) if has_next else None,
+        previous_cursor=(
+            make_cursor(object_list[0], field)
+            if forward_key is not None and object_list
+            else None
+        ),
+    )
@@ -0,0 +1,27 @@
+"""Background tasks for shared utilities."""
+
+import logging
+
+from django.apps import apps
+from django_tasks import task
+
+from ams.utils.image_specs import generate_image_specs
+
+logger = logging.getLogger(__name__)
+
+
+@task()
+def generate_image_specs_task(model_label, pk):
+    """Generate the missing spec files (thumbnails) of one object.
+
+    A bad image is logged, then fails the task, so the upload that enqueued
+    it still succeeds.
+    """
+    instance = apps.get_model(model_label).objects.filter(pk=pk).first()
+    if instance is None:
+        return 0
+    try:
+        return generate_image_specs(instance)
+    except Exception:
+        logger.exception("Generating image specs of %s %s failed.", model_label, pk)
+        raise
@@ -0,0 +1,49 @@
+"""Template tags for imagekit image specs."""
+
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+from django.utils.html import format_html_join
+
+from ams.utils.image_specs import RESPONSIVE_IMAGE_FORMATS
+from ams.utils.image_specs import responsive_spec_attname
+
+register = template.Library()
+
+
+@register.simple_tag
+def responsive_image_spec(instance, name, sizes, **attrs):
+    """Render a <picture> offering every variant of a responsive image spec.
+
+    Usage: {% responsive_image_spec resource "thumbnail_card" sizes="200px" %}
+    Extra keyword arguments (alt, class, loading, ...) become attributes of
+    the fallback <img>. See add_responsive_image_specs().
+    """
+    widths = type(instance).responsive_image_specs[name]
+
+    def spec_url(width, image_format):
+        return getattr(instance, responsive_spec_attname(name, width, image_format)).url
+
+    srcsets = {
+        image_format: ", ".join(
+            f"{spec_url(width, image_format)} {width}w" for width in widths
+        )
+        for image_format, _mime_type in RESPONSIVE_IMAGE_FORMATS
+    }
+    *preferred, (fallback_format, _mime_type) = RESPONSIVE_IMAGE_FORMATS
+    sources = format_html_join(
+        "",
+        '<source type="{}" srcset="{}" sizes="{}">',
+        (
+            (mime_type, srcsets[image_format], sizes)
+            for image_format, mime_type in preferred
+        ),
+    )
+    img_attrs = {
+        "src": spec_url(widths[0], fallback_format),
+        "srcset": srcsets[fallback_format],
+        "sizes": sizes,
+        "alt": "",
+        **attrs,
+    }
+    return format_html("<picture>{}<img{}></picture>", sources, flatatt(img_attrs))
@@ -2,9 +2,13 @@
 
 import uuid
 from unittest.mock import Mock
+from unittest.mock import patch
 
+import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from wagtail.models import Page
 
@@ -12,6 +16,7 @@ from ams.cms.models import HomePage
 from ams.events.tests.factories import EventFactory
 from ams.events.tests.factories import LocationFactory
 from ams.organisations.tests.factories import OrganisationFactory
+from ams.resources.tests.factories import ResourceFactory
 from ams.users.tests.factories import UserFactory
 from ams.utils.breadcrumbs import BREADCRUMB_REGISTRY
 from ams.utils.breadcrumbs import _get_cached_value
@@ -23,6 +28,7 @@ from ams.utils.breadcrumbs import _get_user_dashboard_label
 from ams.utils.breadcrumbs import get_breadcrumbs_for_django_page
 from ams.utils.breadcrumbs import get_current_view_name
 from ams.utils.breadcrumbs import is_homepage
+from ams.utils.breadcrumbs import register_breadcrumb_object
 
 User = get_user_model()
 
@@ -678,6 +684,65 @@ class TestGetBreadcrumbsForDjangoPage:
         assert result[2]["is_active"] is True
 
 
+class TestBreadcrumbLabels:
+    """Tests for reusing loaded objects for labels."""
+
+    def test_registered_object_needs_no_queries(
+        self,
+        db,
+        django_assert_num_queries,
+    ):
+        """Test that a label comes from the object registered on the request."""
+        event = EventFactory(name="Annual Conference")
+        request = RequestFactory().get("/")
+        register_breadcrumb_object(request, event)
+
+        with django_assert_num_queries(0):
+            assert _get_event_name(request, pk=event.pk) == "Annual Conference"
+
+    def test_registered_object_of_another_pk_is_ignored(self, db):
+        """Test that a registered object only labels its own page."""
+        event = EventFactory(name="Annual Conference")
+        request = RequestFactory().get("/")
+        register_breadcrumb_object(request, EventFactory(name="Other"))
+
+        assert _get_event_name(request, pk=event.pk) == "Annual Conference"
+
+    def test_other_labels_need_one_query(
+        self,
+        db,
+        django_assert_num_queries,
+    ):
+        """Test that a label without a registered object is one query."""
+        location = LocationFactory(name="Convention Centre")
+
+        with django_assert_num_queries(1):
+            label = _get_location_name(RequestFactory().get("/"), pk=location.pk)
+        assert label == "Convention Centre"
+
+    @pytest.mark.parametrize(
+        "factory",
+        [EventFactory, LocationFactory, ResourceFactory],
+    )
+    def test_breadcrumbs_add_no_queries_to_detail_views(self, db, client, factory):
+        """Test that a detail page's breadcrumbs reuse the view's object."""
+        url = factory().get_absolute_url()
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                client.get(url)
+            return len(queries)
+
+        # Rendered without breadcrumbs, once to warm the menus and the like.
+        with patch(
+            "ams.utils.templatetags.breadcrumbs.get_breadcrumbs_for_django_page",
+            return_value=[],
+        ):
+            count_queries()
+            without_breadcrumbs = count_queries()
+        assert count_queries() == without_breadcrumbs
+
+
 class TestBreadcrumbRegistry:
     """Tests for BREADCRUMB_REGISTRY configuration."""
 
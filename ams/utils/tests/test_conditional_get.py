@@ -0,0 +1,41 @@
+import pytest
+
+from ams.cms.models import ThemeSettings
+from ams.utils.conditional_get import _theme_version
+
+pytestmark = pytest.mark.django_db
+
+DUMMY_CACHE = {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+
+
+class TestThemeVersion:
+    @pytest.fixture(autouse=True)
+    def _production_caches(self, settings):
+        # As in production: the default cache is disabled, the page cache isn't.
+        settings.CACHES = {**settings.CACHES, "default": DUMMY_CACHE}
+
+    def test_read_from_the_page_cache_after_the_first_request(
+        self,
+        rf,
+        wagtail_site,
+        django_assert_num_queries,
+    ):
+        theme = ThemeSettings.for_site(wagtail_site)
+        request = rf.get("/", HTTP_HOST=wagtail_site.hostname)
+        assert _theme_version(request, wagtail_site) == theme.cache_version
+
+        request = rf.get("/", HTTP_HOST=wagtail_site.hostname)
+        with django_assert_num_queries(0):
+            assert _theme_version(request, wagtail_site) == theme.cache_version
+
+    def test_saving_the_theme_changes_the_version(self, rf, wagtail_site):
+        theme = ThemeSettings.for_site(wagtail_site)
+        request = rf.get("/", HTTP_HOST=wagtail_site.hostname)
+        old_version = _theme_version(request, wagtail_site)
+
+        theme.save()
+
+        request = rf.get("/", HTTP_HOST=wagtail_site.hostname)
+        new_version = _theme_version(request, wagtail_site)
+        assert new_version == theme.cache_version
+        assert new_version != old_version
@@ -0,0 +1,213 @@
+from io import BytesIO
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import caches
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from imagekit.cachefiles.backends import CacheFileState
+from imagekit.cachefiles.state import use_cachefile_state_cache
+from PIL import Image
+
+from ams.resources.models import Resource
+from ams.resources.tests.factories import ResourceFactory
+from ams.users.models import User
+from ams.utils.image_specs import generate_image_specs
+from ams.utils.image_specs import image_specs
+from ams.utils.image_specs import models_with_image_specs
+from ams.utils.image_specs import prefetch_image_spec_states
+from ams.utils.image_specs import responsive_spec_attnames
+from ams.utils.templatetags.image_specs import responsive_image_spec
+
+pytestmark = pytest.mark.django_db
+
+# Two widths in three formats for each of thumbnail_card and thumbnail_detail.
+RESOURCE_SPEC_COUNT = 12
+
+
+def _image_file(name="thumb.png"):
+    buffer = BytesIO()
+    Image.new("RGB", (40, 30), color="green").save(buffer, format="PNG")
+    return ContentFile(buffer.getvalue(), name=name)
+
+
+def _state(spec_file):
+    return spec_file.cachefile_backend.get_state(spec_file, check_if_unknown=False)
+
+
+@pytest.fixture
+def resource_with_thumbnail():
+    resource = ResourceFactory()
+    resource.thumbnail.save("thumb.png", _image_file(), save=False)
+    Resource.objects.filter(pk=resource.pk).update(thumbnail=resource.thumbnail.name)
+    return Resource.objects.get(pk=resource.pk)
+
+
+@pytest.fixture(autouse=True)
+def _clear_imagekit_cache():
+    caches["imagekit"].clear()
+
+
+class TestImageSpecs:
+    def test_finds_resource_specs(self):
+        assert image_specs(Resource) == {
+            "thumbnail": [
+                *responsive_spec_attnames(Resource, "thumbnail_card"),
+                *responsive_spec_attnames(Resource, "thumbnail_detail"),
+            ],
+        }
+
+    def test_finds_user_specs(self):
+        assert image_specs(User) == {"profile_picture": ["profile_picture_thumbnail"]}
+
+    def test_models_with_image_specs(self):
+        assert {Resource, User} <= set(models_with_image_specs())
+
+
+class TestGenerateImageSpecs:
+    def test_generates_and_records_missing_specs(self, resource_with_thumbnail):
+        assert generate_image_specs(resource_with_thumbnail) == RESOURCE_SPEC_COUNT
+        card = resource_with_thumbnail.thumbnail_card_200_avif
+        assert _state(card) == CacheFileState.EXISTS
+        assert card.storage.exists(card.name)
+
+    def test_skips_existing_specs(self, resource_with_thumbnail):
+        generate_image_specs(resource_with_thumbnail)
+        resource = Resource.objects.get(pk=resource_with_thumbnail.pk)
+        assert generate_image_specs(resource) == 0
+
+    def test_force_regenerates(self, resource_with_thumbnail):
+        generate_image_specs(resource_with_thumbnail)
+        resource = Resource.objects.get(pk=resource_with_thumbnail.pk)
+        assert generate_image_specs(resource, force=True) == RESOURCE_SPEC_COUNT
+
+    def test_object_without_source_is_skipped(self):
+        assert generate_image_specs(ResourceFactory()) == 0
+
+
+class TestGenerateOnUpload:
+    def test_saving_new_image_generates_specs(
+        self,
+        django_capture_on_commit_callbacks,
+    ):
+        resource = ResourceFactory()
+        with django_capture_on_commit_callbacks(execute=True):
+            resource.thumbnail = _image_file()
+            resource.save()
+        assert _state(resource.thumbnail_card_400_webp) == CacheFileState.EXISTS
+        assert _state(resource.thumbnail_detail_800_jpeg) == CacheFileState.EXISTS
+
+    def test_unreadable_image_is_logged_not_raised(
+        self,
+        django_capture_on_commit_callbacks,
+        caplog,
+    ):
+        resource = ResourceFactory()
+        with django_capture_on_commit_callbacks(execute=True):
+            resource.thumbnail = ContentFile(b"not an image", name="broken.png")
+            resource.save()
+        assert "Generating image specs of resources.Resource" in caplog.text
+
+    def test_update_fields_without_source_skips_generation(
+        self,
+        resource_with_thumbnail,
+        django_capture_on_commit_callbacks,
+    ):
+        with django_capture_on_commit_callbacks() as callbacks:
+            resource_with_thumbnail.save(update_fields=["view_count"])
+        assert callbacks == []
+
+
+class TestPrefetchImageSpecStates:
+    def test_rendering_after_prefetch_needs_no_lookups(
+        self,
+        resource_with_thumbnail,
+        django_assert_num_queries,
+    ):
+        generate_image_specs(resource_with_thumbnail)
+        resources = [
+            Resource.objects.get(pk=resource_with_thumbnail.pk),
+            ResourceFactory(),
+        ]
+        with use_cachefile_state_cache():
+            with django_assert_num_queries(1):
+                prefetch_image_spec_states(
+                    resources,
+                    *responsive_spec_attnames(Resource, "thumbnail_card"),
+                )
+            with (
+                django_assert_num_queries(0),
+                patch.object(
+                    type(resources[0].thumbnail_card_200_jpeg.storage),
+                    "exists",
+                ) as exists,
+            ):
+                assert responsive_image_spec(resources[0], "thumbnail_card", "200px")
+            exists.assert_not_called()
+
+
+class TestResponsiveImageSpecTag:
+    def test_renders_sources_and_fallback(self, resource_with_thumbnail):
+        resource = resource_with_thumbnail
+        html = responsive_image_spec(
+            resource,
+            "thumbnail_card",
+            "200px",
+            loading="lazy",
+        )
+        assert html.startswith('<picture><source type="image/avif"')
+        assert '<source type="image/webp"' in html
+        assert (
+            f'srcset="{resource.thumbnail_card_200_avif.url} 200w, '
+            f'{resource.thumbnail_card_400_avif.url} 400w"'
+        ) in html
+        assert f' src="{resource.thumbnail_card_200_jpeg.url}"' in html
+        assert f"{resource.thumbnail_card_400_jpeg.url} 400w" in html
+        assert 'sizes="200px"' in html
+        assert 'loading="lazy"' in html
+        assert 'alt=""' in html
+
+    def test_variants_are_encoded_in_their_format(self, resource_with_thumbnail):
+        generate_image_specs(resource_with_thumbnail)
+        for attname, image_format in (
+            ("thumbnail_card_200_avif", "AVIF"),
+            ("thumbnail_card_200_webp", "WEBP"),
+            ("thumbnail_detail_800_jpeg", "JPEG"),
+        ):
+            spec_file = getattr(resource_with_thumbnail, attname)
+            with spec_file.storage.open(spec_file.name) as file:
+                assert Image.open(file).format == image_format
+
+
+class TestWarmImagekitSpecsCommand:
+    def test_generates_missing_specs_in_process(self, resource_with_thumbnail):
+        ResourceFactory()
+        out = StringIO()
+        call_command("warm_imagekit_specs", "--workers", "0", stdout=out)
+        assert "Generated 12 spec files for 1 objects (0 failed)" in out.getvalue()
+        assert (
+            _state(resource_with_thumbnail.thumbnail_detail_400_avif)
+            == CacheFileState.EXISTS
+        )
+
+    def test_second_run_generates_nothing(self, resource_with_thumbnail):
+        call_command("warm_imagekit_specs", "--workers", "0", stdout=StringIO())
+        out = StringIO()
+        call_command("warm_imagekit_specs", "--workers", "0", stdout=out)
+        assert "Generated 0 spec files for 1 objects (0 failed)" in out.getvalue()
+
+    def test_missing_source_is_reported_and_skipped(self, resource_with_thumbnail):
+        broken = ResourceFactory()
+        Resource.objects.filter(pk=broken.pk).update(thumbnail="missing.png")
+        out = StringIO()
+        err = StringIO()
+        call_command(
+            "warm_imagekit_specs",
+            "--workers",
+            "0",
+            stdout=out,
+            stderr=err,
+        )
+        assert "Generated 12 spec files for 2 objects (1 failed)" in out.getvalue()
+        assert f"resources.Resource {broken.pk}" in err.getvalue()
@@ -3,7 +3,6 @@
 from http import HTTPStatus
 
 import pytest
-from django.http import Http404
 from django.test import RequestFactory
 from wagtail.models import Page
 from wagtail.models import Site
@@ -11,8 +10,9 @@ from wagtail.models import Site
 from ams.cms.models import ContentPage
 from ams.cms.models import HomePage
 from ams.cms.models import SiteSettings
+from ams.cms.page_paths import get_page_path_index
+from ams.cms.page_paths import page_path_key
 from ams.utils.views import _build_locale_info
-from ams.utils.views import _find_page_in_site
 from ams.utils.views import _normalize_path
 from ams.utils.views import page_not_found
 
@@ -161,72 +161,83 @@ class TestNormalizePath:
         assert result == "/"
 
 
-@pytest.mark.django_db
-class TestFindPageInSite:
-    """Test the _find_page_in_site helper function."""
+class TestPagePathKey:
+    """Test the page_path_key helper function."""
 
-    def test_find_page_in_site_finds_root_page(
-        self,
-        setup_multilingual_sites,
-        request_factory,
-    ):
-        sites = setup_multilingual_sites
-        request = request_factory.get("/")
+    @pytest.mark.parametrize(
+        "path",
+        ["/about/team/", "/about/team", "about/team/", "/about//team/"],
+    )
+    def test_page_path_key_normalises_slashes(self, path):
+        assert page_path_key(path) == "/about/team/"
+
+    @pytest.mark.parametrize("path", ["", "/", "//"])
+    def test_page_path_key_for_root(self, path):
+        assert page_path_key(path) == "/"
 
-        page = _find_page_in_site(sites["en_site"], "/", request)
 
-        assert page is not None
-        assert page.id == sites["en_home"].id
+@pytest.mark.django_db
+class TestPagePathIndex:
+    """Test the index of live page paths used by page_not_found."""
 
-    def test_find_page_in_site_finds_direct_child(
+    def test_index_has_live_pages_relative_to_site_root(
         self,
         setup_multilingual_sites,
-        request_factory,
     ):
         sites = setup_multilingual_sites
-        request = request_factory.get("/about/")
 
-        page = _find_page_in_site(sites["en_site"], "/about/", request)
+        index = get_page_path_index()
 
-        assert page is not None
-        assert page.id == sites["en_about"].id
+        en_site = index[sites["en_site"].id]
+        assert en_site.language == "en"
+        assert en_site.pages["/"].title == "Home"
+        assert en_site.pages["/about/team/"].url_path == sites["en_team"].url_path
+        assert "/contact/" not in index[sites["fr_site"].id].pages
 
-    def test_find_page_in_site_finds_nested_page(
+    def test_index_excludes_unpublished_pages(
         self,
         setup_multilingual_sites,
-        request_factory,
     ):
         sites = setup_multilingual_sites
-        request = request_factory.get("/about/team/")
+        draft = ContentPage(title="Draft", slug="draft", live=False)
+        sites["en_home"].add_child(instance=draft)
 
-        page = _find_page_in_site(sites["en_site"], "/about/team/", request)
+        index = get_page_path_index()
 
-        assert page is not None
-        assert page.id == sites["en_team"].id
+        assert "/draft/" not in index[sites["en_site"].id].pages
 
-    def test_find_page_in_site_raises_http404_for_nonexistent_page(
+    def test_index_is_rebuilt_after_publishing(
         self,
         setup_multilingual_sites,
-        request_factory,
+        django_capture_on_commit_callbacks,
     ):
         sites = setup_multilingual_sites
-        request = request_factory.get("/nonexistent/")
+        get_page_path_index()
+
+        page = ContentPage(title="Whakahaere", slug="whakahaere")
+        sites["mi_home"].add_child(instance=page)
+        with django_capture_on_commit_callbacks(execute=True):
+            page.save_revision().publish()
 
-        with pytest.raises(Http404):
-            _find_page_in_site(sites["en_site"], "/nonexistent/", request)
+        assert "/whakahaere/" in get_page_path_index()[sites["mi_site"].id].pages
 
-    def test_find_page_in_site_with_empty_path(
+    def test_page_not_found_uses_cached_index(
         self,
         setup_multilingual_sites,
         request_factory,
+        django_assert_num_queries,
     ):
         sites = setup_multilingual_sites
-        request = request_factory.get("/")
+        get_page_path_index()
+
+        request = request_factory.get("/en/about/team/")
+        request.LANGUAGE_CODE = "en"
+        request.site = sites["en_site"]
 
-        page = _find_page_in_site(sites["en_site"], "", request)
+        with django_assert_num_queries(0):
+            response = page_not_found(request)
 
-        assert page is not None
-        assert page.id == sites["en_home"].id
+        assert len(response.context_data["available_locales"]) == 1
 
 
 @pytest.mark.django_db
@@ -1,11 +1,12 @@
 from django.conf.locale import LANG_INFO
-from django.http import Http404
 from django.http import HttpResponseBadRequest
 from django.http import HttpResponseForbidden
 from django.http import HttpResponseServerError
 from django.shortcuts import render
 from django.template.response import TemplateResponse
-from wagtail.models import Site
+
+from ams.cms.page_paths import get_page_path_index
+from ams.cms.page_paths import page_path_key
 
 
 def bad_request(request, exception=None, template_name="400.html"):
@@ -36,13 +37,6 @@ def _normalize_path(path, language_code):
     return path
 
 
-def _find_page_in_site(site, path_without_lang, request):
-    """Try to find a page at the given path in this site's tree."""
-    path_parts = [p for p in path_without_lang.split("/") if p]
-    page, _args, _kwargs = site.root_page.specific.route(request, path_parts)
-    return page
-
-
 def _build_locale_info(page, site_language):
     """Build locale information dict for a page."""
     lang_info = LANG_INFO.get(site_language, {})
@@ -60,31 +54,29 @@ def page_not_found(request, exception=None, template_name="404.html"):
 
     This function-based view maintains APPEND_SLASH functionality while providing
     custom 404 page logic including locale information for pages that exist in
-    other sites.
+    other sites, looked up in the page path index (ams/cms/page_paths.py).
     """
     language_code = getattr(request, "LANGUAGE_CODE", None)
-    path_without_lang = _normalize_path(request.path, language_code)
+    path_key = page_path_key(_normalize_path(request.path, language_code))
     current_site = getattr(request, "site", None)
 
     available_locales = []
-    sites = Site.objects.select_related("sitesettings").exclude(
-        id=current_site.id if current_site else None,
-    )
-
-    for site in sites:
-        try:
-            page = _find_page_in_site(site, path_without_lang, request)
-            site_language = getattr(site.sitesettings, "language", None)
-
-            if page and site_language:
-                available_locales.append(
-                    _build_locale_info(page, site_language),
-                )
-        except (AttributeError, TypeError, Http404):
+    for site_id, site in get_page_path_index().items():
+        if current_site and site_id == current_site.id:
             continue
+        page = site.pages.get(path_key)
+        if page and site.language:
+            available_locales.append(_build_locale_info(page, site.language))
 
     context = {
         "available_locales": available_locales,
     }
 
-    return TemplateResponse(request, template_name, context, status=404)
+    response = TemplateResponse(request, template_name, context, status=404)
+    # A path that no CMS page answers gives every anonymous visitor the same
+    # 404 until a page is published there, which purges the page cache, so
+    # bots repeating junk paths get a stored 404. Other views' 404s can change
+    # without a purge, so they aren't stored.
+    match = request.resolver_match
+    response.page_cacheable = match is None or match.url_name == "wagtail_serve"
+    return response
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import django.conf.locale
 import environ
+from django.core.exceptions import ImproperlyConfigured
 from django.utils.translation import gettext_lazy as _
 
 BASE_DIR = Path(__file__).resolve(strict=True).parent.parent.parent
@@ -221,6 +222,8 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
     "wagtail.contrib.redirects.middleware.RedirectMiddleware",
+    "ams.utils.middleware.image_spec_state.ImageSpecStateMiddleware",
+    "ams.utils.middleware.page_cache.PageCacheMiddleware",
 ]
 
 # STATIC
@@ -299,6 +302,7 @@ TEMPLATES = [
                 "translate_url": "config.templatetags.translate_url",
                 "localise_url": "config.templatetags.localise_url",
                 "theme": "ams.cms.templatetags.theme",
+                "menu_cache": "ams.cms.templatetags.menu_cache",
                 "breadcrumbs": "ams.utils.templatetags.breadcrumbs",
                 "utils": "ams.utils.templatetags.utils",
             },
@@ -353,6 +357,18 @@ MANAGERS = ADMINS
 # Force the `admin` sign in process to go through the `django-allauth` workflow
 DJANGO_ADMIN_FORCE_ALLAUTH = env.bool("DJANGO_ADMIN_FORCE_ALLAUTH", default=True)
 
+# TASKS
+# ------------------------------------------------------------------------------
+# Background jobs (rendition and thumbnail generation, and Wagtail's own tasks)
+# are django_tasks tasks, enqueued after commit. No task worker is deployed, so
+# the immediate backend runs each one in the request that enqueued it, once its
+# transaction commits. A queue backend and a worker moves them off the request.
+TASKS = {
+    "default": {
+        "BACKEND": "django_tasks.backends.immediate.ImmediateBackend",
+    },
+}
+
 # LOGGING
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#logging
@@ -421,7 +437,25 @@ WAGTAIL_CONTENT_LANGUAGES = LANGUAGES
 WAGTAILADMIN_BASE_URL = env("SITE_DOMAIN", default="ams.com") + "/cms/"
 WAGTAILIMAGES_EXTENSIONS = ["avif", "gif", "jpg", "jpeg", "png", "webp", "svg"]
 WAGTAILDOCS_DOCUMENT_MODEL = "cms.AMSDocument"
-WAGTAILDOCS_SERVE_METHOD = "serve_view"
+# How a document download is delivered once check_document_permissions has
+# passed: "serve_view" streams it through gunicorn, "redirect" answers with a
+# 302 to a short-lived presigned storage URL, and "x_accel_redirect" hands the
+# transfer to a fronting nginx (see DOCUMENT_X_ACCEL_REDIRECT_PREFIX).
+DOCUMENT_SERVE_METHOD = env("DJANGO_DOCUMENT_SERVE_METHOD", default="serve_view")
+DOCUMENT_SERVE_METHODS = ("serve_view", "redirect", "x_accel_redirect")
+if DOCUMENT_SERVE_METHOD not in DOCUMENT_SERVE_METHODS:
+    msg = (
+        f"Unsupported DJANGO_DOCUMENT_SERVE_METHOD={DOCUMENT_SERVE_METHOD!r}. "
+        f"Expected one of: {', '.join(DOCUMENT_SERVE_METHODS)}."
+    )
+    raise ImproperlyConfigured(msg)
+DOCUMENT_X_ACCEL_REDIRECT_PREFIX = env(
+    "DJANGO_DOCUMENT_X_ACCEL_REDIRECT_PREFIX",
+    default="/_private-media/",
+)
+WAGTAILDOCS_SERVE_METHOD = (
+    "redirect" if DOCUMENT_SERVE_METHOD == "redirect" else "serve_view"
+)
 WAGTAILDOCS_EXTENSIONS = [
     *WAGTAILIMAGES_EXTENSIONS,
     "csv",
@@ -481,6 +515,43 @@ DEPLOYED = env.bool("DEPLOYED", default=False)
 SITE_DOMAIN = env("SITE_DOMAIN", default="ams.com")
 SITE_PORT = env.int("SITE_PORT", default=80)
 IMAGEKIT_CACHEFILE_DIR = "imagekit-modified"
+# Imagekit records whether each generated thumbnail exists in this cache so
+# that rendering a page never has to ask storage. It is database-backed
+# because the default cache is a DummyCache in production; its table is
+# created by createcachetable (run in deploy_steps). See ams/utils/image_specs.py.
+IMAGEKIT_CACHE_BACKEND = "imagekit"
+IMAGEKIT_STATE_CACHE = {
+    "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+    "LOCATION": "imagekit_cachefile_state",
+    "TIMEOUT": None,
+    "OPTIONS": {"MAX_ENTRIES": 100_000},
+}
+# Rendered CMS pages for anonymous visitors (see ams/cms/page_cache.py).
+# Database-backed so every worker shares the cache and its purges; a timeout
+# of 0 turns the page cache off.
+PAGE_CACHE = {
+    "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+    "LOCATION": "page_cache",
+    "TIMEOUT": env.int("DJANGO_PAGE_CACHE_TIMEOUT", default=300),
+    "OPTIONS": {"MAX_ENTRIES": 5_000},
+}
+# 404s of paths no CMS page answers, so bots repeating junk paths skip page
+# routing. Small and per process, apart from the shared "pages" cache, so a
+# scan of junk paths can't evict the pages, menus and versions kept there.
+NOT_FOUND_CACHE = {
+    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    "LOCATION": "not_found",
+    "TIMEOUT": 300,
+    "OPTIONS": {"MAX_ENTRIES": 1_000},
+}
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "imagekit": IMAGEKIT_STATE_CACHE,
+    "pages": PAGE_CACHE,
+    "not_found": NOT_FOUND_CACHE,
+}
 XERO_DEBUG = env.bool("XERO_DEBUG", default=False)
 XERO_EMAIL_INVOICES = env.bool("XERO_EMAIL_INVOICES", default=True)
 NOTIFY_STAFF_ORGANISATION_EVENTS = env.bool(
@@ -498,3 +569,4 @@ REQUIRE_FREE_MEMBERSHIP_APPROVAL = env.bool(
 EVENTS_ENABLED = env.bool("AMS_EVENTS_ENABLED", default=False)
 RESOURCES_ENABLED = env.bool("AMS_RESOURCES_ENABLED", default=False)
 RESOURCE_VIEW_RETENTION_DAYS = 400
+RESOURCE_RELATED_LIMIT = 5
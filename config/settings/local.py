@@ -1,4 +1,5 @@
 from config.settings.base import *  # noqa: F403
+from config.settings.base import IMAGEKIT_STATE_CACHE
 from config.settings.base import INSTALLED_APPS
 from config.settings.base import MIDDLEWARE
 from config.settings.base import env
@@ -23,12 +24,23 @@ if NGROK_HOST:
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#caches
 # Disabled to match production (see config/settings/production.py) so dev
-# doesn't rely on cache behavior that doesn't hold in prod.
+# doesn't rely on cache behavior that doesn't hold in prod. The
+# database-backed imagekit cache is kept, as in production. The page and 404
+# caches are disabled so template changes show up straight away.
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.dummy.DummyCache",
         "LOCATION": "default-cache",
     },
+    "imagekit": IMAGEKIT_STATE_CACHE,
+    "pages": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        "LOCATION": "pages",
+    },
+    "not_found": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        "LOCATION": "not_found",
+    },
 }
 
 # EMAIL
@@ -7,7 +7,10 @@ from sentry_sdk.integrations.logging import LoggingIntegration
 
 from config.settings.base import *  # noqa: F403
 from config.settings.base import DATABASES
+from config.settings.base import IMAGEKIT_STATE_CACHE
 from config.settings.base import INSTALLED_APPS
+from config.settings.base import NOT_FOUND_CACHE
+from config.settings.base import PAGE_CACHE
 from config.settings.base import env
 
 # GENERAL
@@ -62,13 +65,17 @@ SECURE_REFERRER_POLICY = "strict-origin-when-cross-origin"
 # CACHES
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#caches
-# Caching is disabled entirely until a shared cache backend (e.g. Redis) is
-# configurable.
+# The default cache is disabled until a shared cache backend (e.g. Redis) is
+# configurable. The database-backed imagekit and page caches, and the
+# per-process cache of 404s, are kept (see base.py).
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.dummy.DummyCache",
         "LOCATION": "",
     },
+    "imagekit": IMAGEKIT_STATE_CACHE,
+    "pages": PAGE_CACHE,
+    "not_found": NOT_FOUND_CACHE,
 }
 
 # EMAIL
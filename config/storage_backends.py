@@ -1,5 +1,89 @@
+import hashlib
+import time
+
+from botocore.exceptions import ClientError
 from django.conf import settings
+from django.core.cache import caches
 from storages.backends.s3 import S3Storage
+from storages.utils import clean_name
+
+SIGNED_URL_CACHE_PREFIX = "signed_url"
+# The database-backed "pages" cache, shared by every worker; the default cache
+# is not shared (a DummyCache in production).
+SIGNED_URL_CACHE_ALIAS = "pages"
+# Seconds before a signed URL's expiry at which it stops being handed out.
+SIGNED_URL_EXPIRY_MARGIN = 300
+DEFAULT_QUERYSTRING_EXPIRE = 3600
+
+
+class SignedURLCacheMixin:
+    """Reuse signed URLs until shortly before they expire.
+
+    Signing a fresh querystring-auth URL per request gives every download a
+    unique URL, so neither browsers nor a CDN can cache the file. Time is cut
+    into buckets of ``querystring_expire - SIGNED_URL_EXPIRY_MARGIN`` seconds
+    and the first URL signed in a bucket is cached (keyed by file name and
+    bucket) until the bucket ends; any URL signed within a bucket is still
+    valid for at least the margin after it, so a cached URL is never handed
+    out close to expiry. Every worker sharing the cache returns the same URL
+    within a bucket. Calls with explicit parameters, expiry or method bypass
+    the cache.
+    """
+
+    def url(self, name, *args, **kwargs):
+        if args or any(value is not None for value in kwargs.values()):
+            return super().url(name, *args, **kwargs)
+        return self.urls([name])[name]
+
+    def urls(self, names):
+        """Return a ``{name: url}`` dict, signing only names not already cached.
+
+        Uses one cache round trip for lookups and one for stores.
+        """
+        lifetime = self._signed_url_lifetime()
+        bucket, elapsed = divmod(int(time.time()), lifetime)
+        keys = {self._signed_url_cache_key(name, bucket): name for name in names}
+        cache = caches[SIGNED_URL_CACHE_ALIAS]
+        cached = cache.get_many(keys)
+        urls = {keys[key]: url for key, url in cached.items()}
+        missing = {
+            key: super(SignedURLCacheMixin, self).url(name)
+            for key, name in keys.items()
+            if key not in cached
+        }
+        if missing:
+            cache.set_many(missing, timeout=lifetime - elapsed)
+            urls.update({keys[key]: url for key, url in missing.items()})
+        return urls
+
+    def _signed_url_lifetime(self):
+        expire = getattr(self, "querystring_expire", DEFAULT_QUERYSTRING_EXPIRE)
+        return max(expire - SIGNED_URL_EXPIRY_MARGIN, 1)
+
+    def _signed_url_cache_key(self, name, bucket):
+        location = f"{getattr(self, 'bucket_name', '')}/{name}"
+        digest = hashlib.sha256(location.encode()).hexdigest()
+        return f"{SIGNED_URL_CACHE_PREFIX}:{digest}:{bucket}"
+
+
+class RangedReadMixin:
+    """Read the start of a stored object without downloading all of it.
+
+    ``S3Storage.open()`` fetches the whole object on first read, which is
+    wasteful when only a file signature is needed.
+    """
+
+    def read_range(self, name, length):
+        """Return up to the first ``length`` bytes of ``name`` in one ranged GET."""
+        key = self._normalize_name(clean_name(name))
+        try:
+            response = self.bucket.Object(key).get(Range=f"bytes=0-{length - 1}")
+        except ClientError as error:
+            # S3 rejects any range on an empty object.
+            if error.response.get("Error", {}).get("Code") == "InvalidRange":
+                return b""
+            raise
+        return response["Body"].read()
 
 
 class PublicMediaStorage(S3Storage):
@@ -16,7 +100,7 @@ class PublicMediaStorage(S3Storage):
         super().__init__(**kwargs)
 
 
-class PrivateMediaStorage(S3Storage):
+class PrivateMediaStorage(SignedURLCacheMixin, RangedReadMixin, S3Storage):
     default_acl = "private"
     querystring_auth = True
     file_overwrite = False
@@ -0,0 +1,132 @@
+from itertools import count
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+from django.core.cache import caches
+from django.core.files.storage import InMemoryStorage
+
+from config.storage_backends import SIGNED_URL_EXPIRY_MARGIN
+from config.storage_backends import PrivateMediaStorage
+from config.storage_backends import SignedURLCacheMixin
+
+EXPIRE = 3600
+LIFETIME = EXPIRE - SIGNED_URL_EXPIRY_MARGIN
+
+
+class SigningInMemoryStorage(InMemoryStorage):
+    """In-memory stand-in for S3 that returns a new "signature" per call."""
+
+    querystring_expire = EXPIRE
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.signatures = count()
+
+    def url(self, name, parameters=None, expire=None, http_method=None):
+        return f"{super().url(name)}?signature={next(self.signatures)}"
+
+
+class CachedSigningStorage(SignedURLCacheMixin, SigningInMemoryStorage):
+    pass
+
+
+@pytest.fixture
+def storage():
+    caches["pages"].clear()
+    yield CachedSigningStorage(location="", base_url="/private-media/")
+    caches["pages"].clear()
+
+
+def _at(seconds):
+    return patch("config.storage_backends.time.time", return_value=seconds)
+
+
+class TestSignedURLCacheMixin:
+    def test_reuses_url_within_bucket(self, storage):
+        with _at(LIFETIME * 10):
+            first = storage.url("file.pdf")
+        with _at(LIFETIME * 11 - 1):
+            second = storage.url("file.pdf")
+        assert first == second
+
+    def test_signs_new_url_in_next_bucket(self, storage):
+        with _at(LIFETIME * 10):
+            first = storage.url("file.pdf")
+        with _at(LIFETIME * 11):
+            second = storage.url("file.pdf")
+        assert first != second
+
+    def test_cached_url_never_served_within_margin_of_expiry(self, storage):
+        # Signed at the very start of a bucket, then served until its end:
+        # the URL must still have at least the margin left to run.
+        signed_at = LIFETIME * 10
+        with _at(signed_at):
+            storage.url("file.pdf")
+        last_served_at = LIFETIME * 11 - 1
+        assert signed_at + EXPIRE - last_served_at > SIGNED_URL_EXPIRY_MARGIN
+
+    def test_different_names_get_different_urls(self, storage):
+        with _at(LIFETIME * 10):
+            assert storage.url("a.pdf") != storage.url("b.pdf")
+
+    def test_explicit_parameters_bypass_cache(self, storage):
+        with _at(LIFETIME * 10):
+            first = storage.url("file.pdf")
+            second = storage.url("file.pdf", parameters={"x": "y"})
+        assert first != second
+
+    def test_bulk_urls_sign_only_missing_names(self, storage):
+        with _at(LIFETIME * 10):
+            cached = storage.url("a.pdf")
+            urls = storage.urls(["a.pdf", "b.pdf", "c.pdf"])
+        assert urls["a.pdf"] == cached
+        assert set(urls) == {"a.pdf", "b.pdf", "c.pdf"}
+        # One signature for the first call, then one each for b and c.
+        assert next(storage.signatures) == 3  # noqa: PLR2004
+
+    def test_bulk_urls_single_cache_round_trip(self, storage):
+        with (
+            _at(LIFETIME * 10),
+            patch("config.storage_backends.caches") as mock_caches,
+        ):
+            mock_cache = mock_caches.__getitem__.return_value
+            mock_cache.get_many.return_value = {}
+            storage.urls(["a.pdf", "b.pdf", "c.pdf"])
+        mock_cache.get_many.assert_called_once()
+        mock_cache.set_many.assert_called_once()
+
+
+class TestRangedReadMixin:
+    @pytest.fixture
+    def s3_object(self):
+        s3_object = MagicMock()
+        bucket = MagicMock()
+        bucket.Object.return_value = s3_object
+        with patch.object(PrivateMediaStorage, "bucket", bucket):
+            yield s3_object
+
+    def test_requests_only_the_given_range(self, s3_object):
+        s3_object.get.return_value = {"Body": MagicMock(read=lambda: b"\x89PNG")}
+        storage = PrivateMediaStorage(bucket_name="private", location="media")
+        assert storage.read_range("resources/1/a.bin", 261) == b"\x89PNG"
+        storage.bucket.Object.assert_called_once_with("media/resources/1/a.bin")
+        s3_object.get.assert_called_once_with(Range="bytes=0-260")
+
+    def test_empty_object_returns_no_bytes(self, s3_object):
+        s3_object.get.side_effect = ClientError(
+            {"Error": {"Code": "InvalidRange"}},
+            "GetObject",
+        )
+        storage = PrivateMediaStorage(bucket_name="private")
+        assert storage.read_range("empty.bin", 261) == b""
+
+    def test_other_errors_propagate(self, s3_object):
+        s3_object.get.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey"}},
+            "GetObject",
+        )
+        storage = PrivateMediaStorage(bucket_name="private")
+        with pytest.raises(ClientError):
+            storage.read_range("missing.bin", 261)
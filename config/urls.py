@@ -39,6 +39,7 @@ urlpatterns = [
     # CMS
     path("cms/", include(wagtailadmin_urls)),
     path("cms-documents/", include(wagtaildocs_urls)),
+    path("theme/", include("ams.cms.urls", namespace="cms")),
     # Forum
     path("forum/", include("ams.forum.urls", namespace="forum")),
 ]